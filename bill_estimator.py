@@ -8,6 +8,13 @@ import numpy as np
 from datetime import datetime
 import calendar
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +22,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; both are constant for the life of a batch run
+_CURRENT_YEAR = datetime.now().year
+_MONTH_NAMES = tuple(calendar.month_name)
+
+
+@njit(cache=True)
+def _usage_kernel(square_footage, year_built, current_year, bedrooms, climate_factor,
+                  sqft_bins, sqft_min, sqft_max, base_usage, usage_min, usage_max,
+                  age_bins, age_factors, bedroom_factors):
+    """Compute monthly usage (kWh) before the seasonal factor from numeric inputs."""
+    # Base consumption by home size, interpolated within the category
+    size_idx = 0
+    while size_idx < len(sqft_bins) and square_footage >= sqft_bins[size_idx]:
+        size_idx += 1
+    usage = base_usage[size_idx]
+    if square_footage > 0:
+        sqft_factor = (square_footage - sqft_min[size_idx]) / (sqft_max[size_idx] - sqft_min[size_idx])
+        usage = usage_min[size_idx] + sqft_factor * (usage_max[size_idx] - usage_min[size_idx])
+    
+    # Home age factor (unknown construction year counts as average)
+    age_factor = 1.0
+    if year_built > 0:
+        age = current_year - year_built
+        age_idx = 0
+        while age_idx < len(age_bins) and age > age_bins[age_idx]:
+            age_idx += 1
+        age_factor = age_factors[age_idx]
+    
+    bedroom_factor = bedroom_factors[min(max(bedrooms, 0), len(bedroom_factors) - 1)]
+    
+    return usage * age_factor * bedroom_factor * climate_factor
+
+
 class BillEstimator:
     """Class to estimate electric bills based on property characteristics and location."""
     
@@ -67,6 +107,61 @@ class BillEstimator:
                 'zip_prefixes': ['786', '787', '788', '789', '790', '791', '792', '793', '794', '795', '796', '797', '798', '799']
             }
         })
+        
+        # Flat ZIP prefix -> (climate zone, base factor) index so lookups are a
+        # single dict probe instead of a scan over every zone's prefixes
+        self._zip_prefix_index = {
+            prefix: (zone, data['base_factor'])
+            for zone, data in self.climate_zones.items()
+            for prefix in data['zip_prefixes']
+        }
+        
+        # Different utility rates by region in Texas
+        self._utility_rates = {
+            'north': 0.115,    # North Texas (Dallas area)
+            'central': 0.125,  # Central Texas (Austin/San Antonio area)
+            'south': 0.135,    # South Texas (Houston area)
+            'west': 0.110,     # West Texas
+            'panhandle': 0.105 # Texas Panhandle
+        }
+        
+        # Map climate zones to utility regions, pre-baked to (region, rate)
+        # so a ZIP estimate resolves its rate with a single lookup
+        region_map = {
+            'north': 'north',
+            'central': 'central',
+            'south': 'south'
+        }
+        self._zone_utility = {
+            zone: (region_map.get(zone, 'central'), self._utility_rates[region_map.get(zone, 'central')])
+            for zone in list(self.climate_zones) + ['central']
+        }
+        
+        # Square footage categories as bin edges (small/medium/large/very_large)
+        # with the interpolation range used within each category
+        consumption = self.base_consumption
+        self._sqft_bins = np.array([1200, 2500, 3500], dtype=float)
+        self._sqft_min = np.array([800, 1200, 2500, 3500], dtype=float)
+        self._sqft_max = np.array([1200, 2500, 3500, 5000], dtype=float)
+        self._base_usage = np.array([consumption['small'], consumption['medium'],
+                                     consumption['large'], consumption['very_large']], dtype=float)
+        self._usage_min = self._base_usage * 0.8
+        self._usage_max = self._base_usage * np.array([1.0, 1.2, 1.2, 1.3])
+        
+        # Home age bins (upper bounds, inclusive) and efficiency factors
+        self._age_bins = np.array([5, 15, 30, 50], dtype=float)
+        self._age_factors = np.array([0.85, 0.9, 1.0, 1.1, 1.2])
+        
+        # Bedroom factors indexed by bedroom count (0-5, clipped)
+        self._bedroom_factors = np.array([0.7, 0.7, 0.85, 1.0, 1.15, 1.25])
+        
+        # Monthly factors as an array ordered January-December
+        self._monthly_factors_arr = np.array([self.monthly_factors.get(m, 1.0) for m in range(1, 13)])
+        
+        # Sorted prefix keys with parallel climate factors for vectorized lookups
+        sorted_prefixes = sorted(self._zip_prefix_index)
+        self._zip_prefix_keys = np.array(sorted_prefixes, dtype=str)
+        self._zip_prefix_factors = np.array([self._zip_prefix_index[p][1] for p in sorted_prefixes], dtype=float)
     
     def estimate_monthly_bill(self, property_data, utility_data=None, month=None):
         """
@@ -80,87 +175,10 @@ class BillEstimator:
         Returns:
             Estimated monthly bill in dollars
         """
-        logger.info(f"Estimating electric bill for property")
+        logger.debug("Estimating electric bill for property")
         
         try:
-            # Extract property characteristics
-            square_footage = property_data.get('square_footage', 0)
-            year_built = property_data.get('year_built', 2000)
-            bedrooms = property_data.get('bedrooms', 3)
-            zip_code = property_data.get('zip_code', '')
-            
-            # Default electricity rate if utility_data not provided
-            if utility_data and 'residential' in utility_data:
-                rate = utility_data.get('residential')
-            else:
-                rate = 0.12  # National average rate in $/kWh
-            
-            # Determine base consumption by home size
-            if square_footage < 1200:
-                base_usage = self.base_consumption['small']
-            elif square_footage < 2500:
-                base_usage = self.base_consumption['medium']
-            elif square_footage < 3500:
-                base_usage = self.base_consumption['large']
-            else:
-                base_usage = self.base_consumption['very_large']
-            
-            # Fine-tune based on exact square footage
-            if square_footage > 0:
-                # Determine the category boundaries
-                if square_footage < 1200:
-                    min_sqft, max_sqft = 800, 1200
-                    min_usage, max_usage = self.base_consumption['small'] * 0.8, self.base_consumption['small']
-                elif square_footage < 2500:
-                    min_sqft, max_sqft = 1200, 2500
-                    min_usage, max_usage = self.base_consumption['medium'] * 0.8, self.base_consumption['medium'] * 1.2
-                elif square_footage < 3500:
-                    min_sqft, max_sqft = 2500, 3500
-                    min_usage, max_usage = self.base_consumption['large'] * 0.8, self.base_consumption['large'] * 1.2
-                else:
-                    min_sqft, max_sqft = 3500, 5000
-                    min_usage, max_usage = self.base_consumption['very_large'] * 0.8, self.base_consumption['very_large'] * 1.3
-                
-                # Linear interpolation within the category
-                sqft_factor = (square_footage - min_sqft) / (max_sqft - min_sqft)
-                base_usage = min_usage + sqft_factor * (max_usage - min_usage)
-            
-            # Adjust for home age (newer homes are typically more efficient)
-            current_year = datetime.now().year
-            if year_built > 0:
-                age = current_year - year_built
-                if age <= 5:
-                    age_factor = 0.85  # 15% more efficient than average
-                elif age <= 15:
-                    age_factor = 0.9   # 10% more efficient than average
-                elif age <= 30:
-                    age_factor = 1.0   # Average efficiency
-                elif age <= 50:
-                    age_factor = 1.1   # 10% less efficient than average
-                else:
-                    age_factor = 1.2   # 20% less efficient than average
-            else:
-                age_factor = 1.0
-            
-            # Adjust for number of bedrooms (proxy for number of occupants)
-            if bedrooms <= 1:
-                bedroom_factor = 0.7
-            elif bedrooms == 2:
-                bedroom_factor = 0.85
-            elif bedrooms == 3:
-                bedroom_factor = 1.0
-            elif bedrooms == 4:
-                bedroom_factor = 1.15
-            else:
-                bedroom_factor = 1.25
-            
-            # Determine climate zone based on ZIP code
-            climate_factor = 1.0  # Default
-            for zone, data in self.climate_zones.items():
-                for prefix in data['zip_prefixes']:
-                    if zip_code.startswith(prefix):
-                        climate_factor = data['base_factor']
-                        break
+            invariant_usage, rate = self._compute_property_invariants(property_data, utility_data)
             
             # Apply monthly seasonal factor if month is specified
             month_factor = 1.0
@@ -168,18 +186,162 @@ class BillEstimator:
                 month_factor = self.monthly_factors.get(month, 1.0)
             
             # Calculate estimated monthly usage
-            estimated_usage = base_usage * age_factor * bedroom_factor * climate_factor * month_factor
+            estimated_usage = invariant_usage * month_factor
             
             # Calculate estimated bill
             estimated_bill = estimated_usage * rate
             
-            logger.info(f"Estimated monthly bill: ${estimated_bill:.2f}")
+            logger.debug("Estimated monthly bill: $%.2f", estimated_bill)
             return estimated_bill
             
         except Exception as e:
             logger.error(f"Error estimating electric bill: {e}")
             return 0
     
+    def estimate_monthly_bill_batch(self, square_footage, year_built, bedrooms, zip_codes, rates=None, month=None):
+        """
+        Estimate monthly electric bills for many properties in one vectorized pass.
+        
+        Args:
+            square_footage: Array-like of home sizes in square feet
+            year_built: Array-like of construction years (0 if unknown)
+            bedrooms: Array-like of bedroom counts
+            zip_codes: Sequence of ZIP code strings
+            rates: Optional array-like of electricity rates in $/kWh (defaults to 0.12)
+            month: Optional month (1-12) to estimate for specific month, or None for annual average
+            
+        Returns:
+            NumPy array of estimated monthly bills in dollars
+        """
+        square_footage = np.asarray(square_footage, dtype=float)
+        year_built = np.asarray(year_built, dtype=float)
+        bedrooms = np.asarray(bedrooms, dtype=float)
+        rates = np.full(square_footage.shape, 0.12) if rates is None else np.asarray(rates, dtype=float)
+        
+        # Base consumption by home size, interpolated within each category
+        size_idx = np.searchsorted(self._sqft_bins, square_footage, side='right')
+        min_sqft, max_sqft = self._sqft_min[size_idx], self._sqft_max[size_idx]
+        min_usage, max_usage = self._usage_min[size_idx], self._usage_max[size_idx]
+        sqft_factor = (square_footage - min_sqft) / (max_sqft - min_sqft)
+        base_usage = np.where(square_footage > 0,
+                              min_usage + sqft_factor * (max_usage - min_usage),
+                              self._base_usage[size_idx])
+        
+        # Home age and bedroom factors
+        age_idx = np.searchsorted(self._age_bins, _CURRENT_YEAR - year_built, side='left')
+        age_factor = np.where(year_built > 0, self._age_factors[age_idx], 1.0)
+        bedroom_factor = self._bedroom_factors[np.clip(bedrooms.astype(int), 0, 5)]
+        
+        # Climate factor from the sorted ZIP prefix table
+        climate_factor = np.ones(square_footage.shape)
+        if len(self._zip_prefix_keys):
+            prefixes = np.array([zip_code[:3] for zip_code in zip_codes], dtype=str)
+            prefix_idx = np.minimum(np.searchsorted(self._zip_prefix_keys, prefixes), len(self._zip_prefix_keys) - 1)
+            found = self._zip_prefix_keys[prefix_idx] == prefixes
+            climate_factor = np.where(found, self._zip_prefix_factors[prefix_idx], 1.0)
+        
+        month_factor = 1.0
+        if month is not None and 1 <= month <= 12:
+            month_factor = self.monthly_factors.get(month, 1.0)
+        
+        return base_usage * age_factor * bedroom_factor * climate_factor * month_factor * rates
+    
+    def _compute_property_invariants(self, property_data, utility_data=None):
+        """
+        Compute the month-independent part of the bill estimate.
+        
+        Args:
+            property_data: Dictionary with property information
+            utility_data: Optional dictionary with utility rate information
+            
+        Returns:
+            Tuple of (monthly usage in kWh before the seasonal factor, rate in $/kWh)
+        """
+        square_footage, year_built, bedrooms, climate_factor = self._usage_inputs(property_data)
+        rate = self._residential_rate(utility_data)
+        
+        return self._invariant_usage(square_footage, year_built, bedrooms, climate_factor), rate
+    
+    def _residential_rate(self, utility_data=None):
+        """
+        Get the residential electricity rate from utility data.
+        
+        Args:
+            utility_data: Optional dictionary with utility rate information
+            
+        Returns:
+            Rate in $/kWh
+        """
+        # Default electricity rate if utility_data not provided
+        if utility_data and 'residential' in utility_data:
+            return utility_data.get('residential')
+        return 0.12  # National average rate in $/kWh
+    
+    def _usage_inputs(self, property_data):
+        """
+        Extract the numeric inputs of the usage model from property data.
+        
+        Args:
+            property_data: Dictionary with property information
+            
+        Returns:
+            Tuple of (square_footage, year_built, bedrooms, climate_factor)
+        """
+        # Extract property characteristics
+        square_footage = property_data.get('square_footage', 0)
+        year_built = property_data.get('year_built', 2000)
+        bedrooms = property_data.get('bedrooms', 3)
+        zip_code = property_data.get('zip_code', '')
+        
+        # Determine climate zone based on ZIP code
+        climate_factor = self._zip_prefix_index.get(zip_code[:3], (None, 1.0))[1]
+        
+        return square_footage, year_built, bedrooms, climate_factor
+    
+    def bill_inputs_key(self, property_data, utility_data=None):
+        """
+        Key of everything the bill estimates for a property depend on.
+        
+        Properties with equal keys get identical results from estimate_monthly_bill,
+        estimate_annual_bill_profile and analyze_bill_factors, so callers can
+        compute those once per key.
+        
+        Args:
+            property_data: Dictionary with property information
+            utility_data: Optional dictionary with utility rate information
+            
+        Returns:
+            Hashable tuple of the model inputs and which optional fields are present
+        """
+        return (
+            self._usage_inputs(property_data),
+            self._residential_rate(utility_data),
+            'square_footage' in property_data,
+            'year_built' in property_data,
+            bool(utility_data) and 'residential' in utility_data
+        )
+    
+    def _invariant_usage(self, square_footage, year_built, bedrooms, climate_factor):
+        """
+        Compute monthly usage (kWh) before the seasonal factor.
+        
+        Args:
+            square_footage: Home size in square feet
+            year_built: Year the home was built (0 if unknown)
+            bedrooms: Number of bedrooms
+            climate_factor: Climate zone factor for the ZIP code
+            
+        Returns:
+            Monthly usage in kWh
+        """
+        # Size, age and bedroom adjustments run in the compiled kernel
+        return _usage_kernel(
+            square_footage, year_built, _CURRENT_YEAR, int(bedrooms), climate_factor,
+            self._sqft_bins, self._sqft_min, self._sqft_max,
+            self._base_usage, self._usage_min, self._usage_max,
+            self._age_bins, self._age_factors, self._bedroom_factors
+        )
+    
     def estimate_annual_bill_profile(self, property_data, utility_data=None):
         """
         Estimate electric bill for each month of the year.
@@ -191,16 +353,18 @@ class BillEstimator:
         Returns:
             Dictionary with monthly bill estimates
         """
-        logger.info(f"Estimating annual bill profile")
+        logger.debug("Estimating annual bill profile")
         
-        monthly_bills = {}
-        annual_total = 0
+        try:
+            # All twelve months in one vector operation
+            invariant_usage, rate = self._compute_property_invariants(property_data, utility_data)
+            monthly_bills_arr = invariant_usage * self._monthly_factors_arr * rate
+        except Exception as e:
+            logger.error(f"Error estimating electric bill: {e}")
+            monthly_bills_arr = np.zeros(12)
         
-        for month in range(1, 13):
-            monthly_bill = self.estimate_monthly_bill(property_data, utility_data, month)
-            month_name = calendar.month_name[month]
-            monthly_bills[month_name] = round(monthly_bill, 2)
-            annual_total += monthly_bill
+        monthly_bills = dict(zip(_MONTH_NAMES[1:13], np.round(monthly_bills_arr, 2).tolist()))
+        annual_total = float(monthly_bills_arr.sum())
         
         return {
             'monthly': monthly_bills,
@@ -221,7 +385,7 @@ class BillEstimator:
         Returns:
             Estimated monthly bill in dollars
         """
-        logger.info(f"Estimating bill by ZIP code: {zip_code}")
+        logger.debug("Estimating bill by ZIP code: %s", zip_code)
         
         # Create simplified property data dictionary
         property_data = {
@@ -234,33 +398,8 @@ class BillEstimator:
         # Determine utility rate based on ZIP code
         # This would typically involve looking up the utility provider for the ZIP code
         # For now, use a simplified approach with Texas average rates
-        
-        # Different utility rates by region in Texas
-        utility_rates = {
-            'north': 0.115,    # North Texas (Dallas area)
-            'central': 0.125,  # Central Texas (Austin/San Antonio area)
-            'south': 0.135,    # South Texas (Houston area)
-            'west': 0.110,     # West Texas
-            'panhandle': 0.105 # Texas Panhandle
-        }
-        
-        # Determine region based on ZIP code
-        region = 'central'  # Default
-        for zone, data in self.climate_zones.items():
-            for prefix in data['zip_prefixes']:
-                if zip_code.startswith(prefix):
-                    region = zone
-                    break
-        
-        # Map climate zones to utility regions
-        region_map = {
-            'north': 'north',
-            'central': 'central',
-            'south': 'south'
-        }
-        
-        utility_region = region_map.get(region, 'central')
-        rate = utility_rates.get(utility_region, 0.12)
+        region = self._region_for_zip(zip_code[:3])
+        utility_region, rate = self._zone_utility[region]
         
         # Create simplified utility data
         utility_data = {
@@ -271,6 +410,18 @@ class BillEstimator:
         # Estimate bill
         return self.estimate_monthly_bill(property_data, utility_data)
     
+    def _region_for_zip(self, zip_prefix):
+        """
+        Map a 3-digit ZIP prefix to its climate zone.
+        
+        Args:
+            zip_prefix: First three digits of the ZIP code
+            
+        Returns:
+            Climate zone name, defaulting to 'central'
+        """
+        return self._zip_prefix_index.get(zip_prefix, ('central', 1.0))[0]
+    
     def analyze_bill_factors(self, property_data, utility_data=None):
         """
         Analyze the factors affecting the electric bill.
@@ -282,96 +433,167 @@ class BillEstimator:
         Returns:
             Dictionary with analysis of bill factors
         """
-        logger.info(f"Analyzing bill factors")
+        logger.debug("Analyzing bill factors")
         
         try:
+            # Compute the model inputs once; each perturbation below only
+            # recomputes the factor it changes
+            square_footage, year_built, bedrooms, climate_factor = self._usage_inputs(property_data)
+            usage = self._invariant_usage(square_footage, year_built, bedrooms, climate_factor)
+            rate = self._residential_rate(utility_data)
+            
             # Base bill with all factors
-            base_bill = self.estimate_monthly_bill(property_data, utility_data)
+            base_bill = usage * rate
             
-            # Create modified property data for each factor
             factors = {}
             
             # Size factor
             if 'square_footage' in property_data:
-                smaller_property = property_data.copy()
-                smaller_property['square_footage'] = property_data['square_footage'] * 0.8
-                smaller_bill = self.estimate_monthly_bill(smaller_property, utility_data)
+                smaller_sqft = property_data['square_footage'] * 0.8
+                smaller_bill = self._invariant_usage(smaller_sqft, year_built, bedrooms, climate_factor) * rate
                 
-                larger_property = property_data.copy()
-                larger_property['square_footage'] = property_data['square_footage'] * 1.2
-                larger_bill = self.estimate_monthly_bill(larger_property, utility_data)
+                larger_sqft = property_data['square_footage'] * 1.2
+                larger_bill = self._invariant_usage(larger_sqft, year_built, bedrooms, climate_factor) * rate
                 
                 factors['size'] = {
                     'description': 'Impact of home size',
                     'current': property_data['square_footage'],
                     'current_bill': base_bill,
-                    'smaller': smaller_property['square_footage'],
+                    'smaller': smaller_sqft,
                     'smaller_bill': smaller_bill,
                     'smaller_savings': base_bill - smaller_bill,
-                    'larger': larger_property['square_footage'],
+                    'larger': larger_sqft,
                     'larger_bill': larger_bill,
                     'larger_cost': larger_bill - base_bill
                 }
             
             # Age factor
             if 'year_built' in property_data:
-                newer_property = property_data.copy()
-                newer_property['year_built'] = min(datetime.now().year - 5, property_data['year_built'] + 20)
-                newer_bill = self.estimate_monthly_bill(newer_property, utility_data)
+                newer_year = min(_CURRENT_YEAR - 5, property_data['year_built'] + 20)
+                newer_bill = self._invariant_usage(square_footage, newer_year, bedrooms, climate_factor) * rate
                 
-                older_property = property_data.copy()
-                older_property['year_built'] = max(1900, property_data['year_built'] - 20)
-                older_bill = self.estimate_monthly_bill(older_property, utility_data)
+                older_year = max(1900, property_data['year_built'] - 20)
+                older_bill = self._invariant_usage(square_footage, older_year, bedrooms, climate_factor) * rate
                 
                 factors['age'] = {
                     'description': 'Impact of home age',
                     'current': property_data['year_built'],
                     'current_bill': base_bill,
-                    'newer': newer_property['year_built'],
+                    'newer': newer_year,
                     'newer_bill': newer_bill,
                     'newer_savings': base_bill - newer_bill,
-                    'older': older_property['year_built'],
+                    'older': older_year,
                     'older_bill': older_bill,
                     'older_cost': older_bill - base_bill
                 }
             
-            # Rate factor
+            # Rate factor (the bill is linear in the rate)
             if utility_data and 'residential' in utility_data:
                 current_rate = utility_data['residential']
                 
-                lower_rate_utility = utility_data.copy()
-                lower_rate_utility['residential'] = current_rate * 0.9
-                lower_rate_bill = self.estimate_monthly_bill(property_data, lower_rate_utility)
+                lower_rate = current_rate * 0.9
+                lower_rate_bill = usage * lower_rate
                 
-                higher_rate_utility = utility_data.copy()
-                higher_rate_utility['residential'] = current_rate * 1.1
-                higher_rate_bill = self.estimate_monthly_bill(property_data, higher_rate_utility)
+                higher_rate = current_rate * 1.1
+                higher_rate_bill = usage * higher_rate
                 
                 factors['rate'] = {
                     'description': 'Impact of electricity rate',
                     'current': current_rate,
                     'current_bill': base_bill,
-                    'lower': lower_rate_utility['residential'],
+                    'lower': lower_rate,
                     'lower_bill': lower_rate_bill,
                     'lower_savings': base_bill - lower_rate_bill,
-                    'higher': higher_rate_utility['residential'],
+                    'higher': higher_rate,
                     'higher_bill': higher_rate_bill,
                     'higher_cost': higher_rate_bill - base_bill
                 }
             
             # Seasonal factor
             current_month = datetime.now().month
-            summer_bill = self.estimate_monthly_bill(property_data, utility_data, 7)  # July
-            winter_bill = self.estimate_monthly_bill(property_data, utility_data, 1)  # January
+            summer_bill = usage * self.monthly_factors.get(7, 1.0) * rate  # July
+            winter_bill = usage * self.monthly_factors.get(1, 1.0) * rate  # January
             
             factors['seasonal'] = {
                 'description': 'Seasonal impact on bill',
-                'current_month': calendar.month_name[current_month],
+                'current_month': _MONTH_NAMES[current_month],
                 'current_bill': base_bill,
                 'summer_month': 'July',
                 'summer_bill': summer_bill,
                 'summer_difference': summer_bill - base_bill,
                 'winter_month': 'January',
                 'winter_bill': winter_bill,
-       
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+                'winter_difference': winter_bill - base_bill
+            }
+            
+            return {
+                'base_bill': base_bill,
+                'factors': factors
+            }
+            
+        except Exception as e:
+            logger.error(f"Error analyzing bill factors: {e}")
+            return {
+                'base_bill': 0,
+                'factors': {},
+                'error': str(e)
+            }
+    
+    def analyze_bill_factors_batch(self, square_footage, year_built, bedrooms, zip_codes, rates=None):
+        """
+        Analyze the size, age and rate factors for many properties at once.
+        
+        Vectorized counterpart of analyze_bill_factors: every perturbation is
+        stacked into one call to estimate_monthly_bill_batch instead of being
+        estimated per home.
+        
+        Args:
+            square_footage: Array-like of home sizes in square feet
+            year_built: Array-like of construction years (0 if unknown)
+            bedrooms: Array-like of bedroom counts
+            zip_codes: Sequence of ZIP code strings
+            rates: Optional array-like of electricity rates in $/kWh (defaults to 0.12)
+            
+        Returns:
+            Dictionary of NumPy arrays, one element per property
+        """
+        square_footage = np.asarray(square_footage, dtype=float)
+        year_built = np.asarray(year_built, dtype=float)
+        bedrooms = np.asarray(bedrooms, dtype=float)
+        rates = np.full(square_footage.shape, 0.12) if rates is None else np.asarray(rates, dtype=float)
+        zip_codes = list(zip_codes)
+        
+        # Variants: current, smaller, larger, newer, older
+        newer_year = np.minimum(_CURRENT_YEAR - 5, year_built + 20)
+        older_year = np.maximum(1900, year_built - 20)
+        bills = self.estimate_monthly_bill_batch(
+            np.concatenate([square_footage, square_footage * 0.8, square_footage * 1.2,
+                            square_footage, square_footage]),
+            np.concatenate([year_built, year_built, year_built, newer_year, older_year]),
+            np.tile(bedrooms, 5),
+            zip_codes * 5,
+            rates=np.tile(rates, 5)
+        ).reshape(5, -1)
+        base_bill, smaller_bill, larger_bill, newer_bill, older_bill = bills
+        
+        # The bill is linear in the rate
+        lower_rate_bill = base_bill * 0.9
+        higher_rate_bill = base_bill * 1.1
+        
+        return {
+            'base_bill': base_bill,
+            'smaller_bill': smaller_bill,
+            'smaller_savings': base_bill - smaller_bill,
+            'larger_bill': larger_bill,
+            'larger_cost': larger_bill - base_bill,
+            'newer_year': newer_year,
+            'newer_bill': newer_bill,
+            'newer_savings': base_bill - newer_bill,
+            'older_year': older_year,
+            'older_bill': older_bill,
+            'older_cost': older_bill - base_bill,
+            'lower_rate_bill': lower_rate_bill,
+            'lower_savings': base_bill - lower_rate_bill,
+            'higher_rate_bill': higher_rate_bill,
+            'higher_cost': higher_rate_bill - base_bill
+        }
@@ -5,9 +5,18 @@ Integrates data from various sources and enriches property records.
 
 import os
 import logging
-import json
+import functools
+import concurrent.futures
+import numpy as np
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:
+    # Without numba the scoring kernel simply runs as regular Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,10 +24,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Roof orientations encoded for the scoring kernel: codes below 3 are optimal
+# (S, SE, SW), 3-4 are acceptable (E, W) and anything else scores as poor
+_ORIENTATION_CODES = {'S': 0, 'SE': 1, 'SW': 2, 'E': 3, 'W': 4}
+_ORIENTATION_OTHER = 5
+
+
+@njit(cache=True)
+def _score_kernel(has_property, year_built, assessed_value, square_footage,
+                  has_utility, monthly_bill, has_net_metering,
+                  has_roof, usable_area, orientation_code, shading,
+                  has_owner, ownership_length, do_not_call):
+    """Score a single lead from unpacked inputs (see _calculate_lead_score)."""
+    # This is a simplified scoring algorithm
+    # In a real implementation, this would be more sophisticated
+    
+    score = 50  # Start with a neutral score
+    
+    # Property factors (up to +/-15 points)
+    if has_property:
+        # Age of home
+        if year_built > 0:
+            if year_built < 1970:
+                score -= 5  # Older homes may need electrical upgrades
+            elif year_built > 2010:
+                score += 5  # Newer homes typically have better electrical systems
+        
+        # Home value
+        if assessed_value > 500000:
+            score += 5  # Higher value homes often have more disposable income
+        
+        # Square footage
+        if square_footage > 2500:
+            score += 5  # Larger homes typically have higher energy usage
+    
+    # Utility factors (up to +/-30 points)
+    if has_utility:
+        # Monthly bill
+        if monthly_bill > 200:
+            score += 15  # High bills mean more savings potential
+        elif monthly_bill > 150:
+            score += 10
+        elif monthly_bill > 120:
+            score += 5
+        else:
+            score -= 10  # Low bills mean less savings potential
+        
+        # Net metering
+        if has_net_metering:
+            score += 15  # Net metering significantly improves ROI
+    
+    # Roof factors (up to +/-40 points)
+    if has_roof:
+        # Usable area
+        if usable_area > 1000:
+            score += 10  # Larger usable area means more panels
+        elif usable_area < 500:
+            score -= 10  # Small usable area limits system size
+        
+        # Orientation
+        if orientation_code < 3:
+            score += 15  # Optimal orientations
+        elif orientation_code < 5:
+            score += 5  # Acceptable orientations
+        else:
+            score -= 15  # Poor orientations
+        
+        # Shading
+        if shading < 10:
+            score += 15  # Minimal shading is ideal
+        elif shading < 20:
+            score += 5  # Some shading is acceptable
+        else:
+            score -= 15  # Heavy shading reduces production
+    
+    # Owner factors (up to +/-15 points)
+    if has_owner:
+        # Length of ownership
+        if ownership_length > 5:
+            score += 5  # Longer ownership suggests stability
+        
+        # Do Not Call list
+        if do_not_call:
+            score -= 10  # DNC status makes contact more difficult
+    
+    # Ensure score is within 0-100 range
+    return max(0, min(100, score))
+
 class DataEnrichmentPipeline:
     """Class to integrate and enrich data from multiple sources."""
     
-    def __init__(self, database, property_collector, utility_collector, roof_collector, skip_tracer):
+    def __init__(self, database, property_collector, utility_collector, roof_collector, skip_tracer, max_workers=8):
         """
         Initialize with component instances.
         
@@ -28,12 +124,31 @@ class DataEnrichmentPipeline:
             utility_collector: UtilityDataCollector instance
             roof_collector: RoofDataCollector instance
             skip_tracer: SkipTracer instance
+            max_workers: Maximum number of threads fetching property data in batch mode
         """
         self.database = database
         self.property_collector = property_collector
         self.utility_collector = utility_collector
         self.roof_collector = roof_collector
         self.skip_tracer = skip_tracer
+        self.max_workers = max_workers
+        
+        # Roof lookups overlap the utility lookup on the fetching thread. One
+        # pool for the pipeline keeps that to max_workers extra threads, even
+        # when batch mode fetches max_workers properties at once.
+        self._roof_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='roof-fetch'
+        )
+    
+    def close(self):
+        """Shut down the pipeline's roof lookup threads."""
+        self._roof_executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def process_property(self, address, city, state, zip_code):
         """
@@ -48,78 +163,143 @@ class DataEnrichmentPipeline:
         Returns:
             Dictionary with processed data including property_id
         """
-        logger.info(f"Processing property: {address}, {city}, {state} {zip_code}")
+        fetched = self._fetch_property(address, city, state, zip_code)
+        if not fetched:
+            return None
+        
+        return self._store_property(address, fetched)
+    
+    def _fetch_property(self, address, city, state, zip_code):
+        """
+        Fetch property, utility, roof and owner data from the external sources.
+        
+        Performs no database access, so batch mode can run it from worker threads.
+        
+        Args:
+            address: Street address
+            city: City name
+            state: State code
+            zip_code: ZIP code
+            
+        Returns:
+            Dictionary with the fetched data, or None if the property is not a candidate
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing property: %s, %s, %s %s", address, city, state, zip_code)
         
         try:
-            # Step 1: Fetch property data
-            property_data = self.property_collector.fetch_property_by_address(address, city, state, zip_code)
-            if not property_data:
+            # Step 1: Check the basic criteria on the cheap summary lookup so
+            # non-qualifying properties skip the remaining requests
+            summary = self.property_collector.fetch_property_summary(address, city, state, zip_code)
+            if not summary:
                 logger.warning(f"Could not find property data for {address}")
                 return None
             
-            # Step 2: Check if property meets basic criteria
-            if not self._meets_basic_criteria(property_data):
-                logger.info(f"Property does not meet basic criteria: {address}")
+            if not self._meets_basic_criteria(summary):
+                logger.debug("Property does not meet basic criteria: %s", address)
                 return None
             
-            # Step 3: Insert property into database
-            property_id = self.database.insert_property(property_data)
-            if not property_id:
-                logger.error(f"Failed to insert property into database: {address}")
+            # Step 2: Fetch full property data
+            property_data = self.property_collector.fetch_property_by_address(address, city, state, zip_code)
+            if not property_data:
+                logger.warning(f"Could not find property data for {address}")
                 return None
             
-            # Step 4: Fetch utility data
+            # Step 3: Utility rates and roof data are independent requests, so
+            # the roof lookup runs on the pipeline's pool during the utility one
+            roof_future = None
+            if 'latitude' in property_data and 'longitude' in property_data:
+                roof_future = self._roof_executor.submit(
+                    self.roof_collector.fetch_roof_data,
+                    property_data['latitude'],
+                    property_data['longitude'],
+                    address
+                )
             utility_data = self.utility_collector.fetch_utility_rates_by_zip(zip_code)
+            roof_data = roof_future.result() if roof_future else None
+            
+            # Step 4: Calculate estimated monthly bill
             if utility_data:
-                # Calculate estimated monthly bill
                 square_footage = property_data.get('square_footage', 0)
                 utility_data['estimated_monthly_bill'] = self.utility_collector.estimate_monthly_bill(
                     square_footage, utility_data
                 )
-                
-                # Add property_id and insert into database
-                utility_data['property_id'] = property_id
-                self.database.insert_utility(utility_data)
             
-            # Step 5: Fetch roof data
-            if 'latitude' in property_data and 'longitude' in property_data:
-                roof_data = self.roof_collector.fetch_roof_data(
-                    property_data['latitude'], 
-                    property_data['longitude'],
-                    address
-                )
-                
-                if roof_data:
-                    # Estimate solar potential
-                    solar_potential = self.roof_collector.estimate_solar_potential(roof_data, utility_data)
-                    roof_data.update(solar_potential)
-                    
-                    # Add property_id and insert into database
-                    roof_data['property_id'] = property_id
-                    self.database.insert_roof(roof_data)
+            # Step 5: Estimate solar potential
+            solar_potential = None
+            if roof_data:
+                solar_potential = self.roof_collector.estimate_solar_potential(roof_data, utility_data)
+                roof_data.update(solar_potential)
             
             # Step 6: Perform skip tracing
             owner_data = self.skip_tracer.trace_property_owner(property_data)
+            
+            return {
+                'property_data': property_data,
+                'utility_data': utility_data,
+                'roof_data': roof_data,
+                'solar_potential': solar_potential,
+                'owner_data': owner_data
+            }
+            
+        except Exception as e:
+            logger.error(f"Error processing property: {e}")
+            return None
+    
+    def _store_property(self, address, fetched):
+        """
+        Insert fetched property data into the database and create the lead record.
+        
+        Args:
+            address: Street address (for logging)
+            fetched: Dictionary returned by _fetch_property
+            
+        Returns:
+            Dictionary with processed data including property_id
+        """
+        try:
+            property_data = fetched['property_data']
+            utility_data = fetched['utility_data']
+            roof_data = fetched['roof_data']
+            owner_data = fetched['owner_data']
+            solar_potential = fetched['solar_potential']
+            utility_id = roof_id = lead_id = None
+            
+            # Step 7: Insert property into database
+            property_id = self.database.insert_property(property_data)
+            if not property_id:
+                logger.error(f"Failed to insert property into database: {address}")
+                return None
+            
+            # Add property_id and insert the dependent records
+            if utility_data:
+                utility_data['property_id'] = property_id
+                utility_id = self.database.insert_utility(utility_data)
+            
+            if roof_data:
+                roof_data['property_id'] = property_id
+                roof_id = self.database.insert_roof(roof_data)
+            
             if owner_data:
-                # Add property_id and insert into database
                 owner_data['property_id'] = property_id
                 homeowner_id = self.database.insert_homeowner(owner_data)
                 
-                # Step 7: Create lead record if all data is available
-                if homeowner_id and 'roof_id' in locals() and 'utility_id' in locals():
+                # Step 8: Create lead record if all data is available
+                if homeowner_id and roof_id is not None and utility_id is not None:
                     # Calculate lead score
                     lead_score = self._calculate_lead_score(property_data, utility_data, roof_data, owner_data)
                     
                     # Create lead data
+                    potential = solar_potential if solar_potential is not None else {}
                     lead_data = {
                         'property_id': property_id,
                         'homeowner_id': homeowner_id,
                         'lead_score': lead_score,
                         'lead_status': 'new',
-                        'estimated_savings': solar_potential.get('annual_savings', 0) if 'solar_potential' in locals() else 0,
-                        'estimated_system_size': solar_potential.get('system_size', 0) if 'solar_potential' in locals() else 0,
-                        'estimated_installation_cost': solar_potential.get('system_cost', 0) if 'solar_potential' in locals() else 0,
-                        'estimated_payback_period': solar_potential.get('payback_period', 0) if 'solar_potential' in locals() else 0
+                        'estimated_savings': potential.get('annual_savings', 0),
+                        'estimated_system_size': potential.get('system_size', 0),
+                        'estimated_installation_cost': potential.get('system_cost', 0),
+                        'estimated_payback_period': potential.get('payback_period', 0)
                     }
                     
                     # Insert lead into database
@@ -129,10 +309,10 @@ class DataEnrichmentPipeline:
             return {
                 'property_id': property_id,
                 'property_data': property_data,
-                'utility_data': utility_data if 'utility_data' in locals() else None,
-                'roof_data': roof_data if 'roof_data' in locals() else None,
-                'owner_data': owner_data if 'owner_data' in locals() else None,
-                'lead_id': lead_id if 'lead_id' in locals() else None
+                'utility_data': utility_data,
+                'roof_data': roof_data,
+                'owner_data': owner_data,
+                'lead_id': lead_id
             }
             
         except Exception as e:
@@ -151,35 +331,159 @@ class DataEnrichmentPipeline:
         """
         logger.info(f"Batch processing {len(property_list)} properties")
         
-        results = []
+        # Parse addresses, skipping duplicates so each property is fetched only once
+        addresses = []
+        seen = set()
         for prop in property_list:
-            if isinstance(prop, dict):
-                # If property is a dictionary, extract address components
-                address = prop.get('address_line_1', '')
-                city = prop.get('city', '')
-                state = prop.get('state', '')
-                zip_code = prop.get('zip_code', '')
-            else:
-                # If property is an address string, parse it (simplified)
-                parts = prop.split(',')
-                if len(parts) >= 3:
-                    address = parts[0].strip()
-                    city = parts[1].strip()
-                    state_zip = parts[2].strip().split()
-                    state = state_zip[0] if state_zip else ''
-                    zip_code = state_zip[1] if len(state_zip) > 1 else ''
-                else:
-                    logger.warning(f"Could not parse address: {prop}")
-                    continue
+            parsed = self._parse_prop(prop)
+            if parsed is None:
+                continue
             
-            # Process the property
-            result = self.process_property(address, city, state, zip_code)
-            if result:
-                results.append(result)
+            key = (parsed[0], parsed[3])
+            if key in seen:
+                continue
+            seen.add(key)
+            addresses.append(parsed)
+        
+        # Fetch external data concurrently (network-bound), then store the
+        # results on this thread in input order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched_list = list(executor.map(lambda parsed: self._fetch_property(*parsed), addresses))
+        
+        results = self._store_batch([fetched for fetched in fetched_list if fetched])
         
         logger.info(f"Completed batch processing with {len(results)} successful properties")
         return results
     
+    def _store_batch(self, fetched_list):
+        """
+        Bulk-insert a batch of fetched properties and their dependent records.
+        
+        Properties are inserted first so their IDs can be stitched into the
+        utility, roof and homeowner rows, which are then inserted per table.
+        
+        Args:
+            fetched_list: List of dictionaries returned by _fetch_property
+            
+        Returns:
+            List of processed property results
+        """
+        if not fetched_list:
+            return []
+        
+        property_ids = self.database.bulk_insert_properties([f['property_data'] for f in fetched_list])
+        stored = [(fetched, property_id) for fetched, property_id in zip(fetched_list, property_ids) if property_id]
+        if len(stored) < len(fetched_list):
+            logger.error(f"Failed to insert {len(fetched_list) - len(stored)} properties into database")
+        
+        # Add property_id to the dependent records
+        for fetched, property_id in stored:
+            for key in ('utility_data', 'roof_data', 'owner_data'):
+                if fetched[key]:
+                    fetched[key]['property_id'] = property_id
+        
+        utility_ids = self._bulk_insert_dependent(stored, 'utility_data', self.database.bulk_insert_utilities)
+        roof_ids = self._bulk_insert_dependent(stored, 'roof_data', self.database.bulk_insert_roofs)
+        homeowner_ids = self._bulk_insert_dependent(stored, 'owner_data', self.database.bulk_insert_homeowners)
+        
+        # Create lead records where all data is available, scoring them in one pass
+        lead_indexes = [
+            i for i in range(len(stored))
+            if homeowner_ids[i] and roof_ids[i] and utility_ids[i]
+        ]
+        lead_scores = []
+        if lead_indexes:
+            score_inputs = [
+                self._score_inputs(
+                    stored[i][0]['property_data'], stored[i][0]['utility_data'],
+                    stored[i][0]['roof_data'], stored[i][0]['owner_data']
+                )
+                for i in lead_indexes
+            ]
+            columns = [np.array(column) for column in zip(*score_inputs)]
+            lead_scores = self._calculate_lead_score_batch(*columns).tolist()
+        
+        leads = []
+        for i, lead_score in zip(lead_indexes, lead_scores):
+            fetched, property_id = stored[i]
+            solar_potential = fetched['solar_potential'] or {}
+            leads.append({
+                'property_id': property_id,
+                'homeowner_id': homeowner_ids[i],
+                'lead_score': lead_score,
+                'lead_status': 'new',
+                'estimated_savings': solar_potential.get('annual_savings', 0),
+                'estimated_system_size': solar_potential.get('system_size', 0),
+                'estimated_installation_cost': solar_potential.get('system_cost', 0),
+                'estimated_payback_period': solar_potential.get('payback_period', 0)
+            })
+        
+        lead_ids = [None] * len(stored)
+        for i, lead_id in zip(lead_indexes, self.database.bulk_insert_leads(leads)):
+            lead_ids[i] = lead_id
+        
+        return [
+            {
+                'property_id': property_id,
+                'property_data': fetched['property_data'],
+                'utility_data': fetched['utility_data'],
+                'roof_data': fetched['roof_data'],
+                'owner_data': fetched['owner_data'],
+                'lead_id': lead_ids[i]
+            }
+            for i, (fetched, property_id) in enumerate(stored)
+        ]
+    
+    def _bulk_insert_dependent(self, stored, key, bulk_insert):
+        """
+        Bulk-insert one kind of dependent record for a stored batch.
+        
+        Args:
+            stored: List of (fetched, property_id) tuples
+            key: Key of the record in each fetched dictionary
+            bulk_insert: Database bulk insert method for the record's table
+            
+        Returns:
+            List of inserted IDs aligned with stored (None where there was no record)
+        """
+        indexes = [i for i, (fetched, _) in enumerate(stored) if fetched[key]]
+        ids = [None] * len(stored)
+        for i, record_id in zip(indexes, bulk_insert([stored[i][0][key] for i in indexes])):
+            ids[i] = record_id
+        return ids
+    
+    def _parse_prop(self, prop):
+        """
+        Extract address components from a property dictionary or address string.
+        
+        Args:
+            prop: Property dictionary or "Street, City, State ZIP" string
+            
+        Returns:
+            Tuple of (address, city, state, zip_code), or None if it cannot be parsed
+        """
+        if isinstance(prop, dict):
+            # If property is a dictionary, extract address components
+            return (
+                prop.get('address_line_1', ''),
+                prop.get('city', ''),
+                prop.get('state', ''),
+                prop.get('zip_code', '')
+            )
+        
+        # If property is an address string, parse it (simplified)
+        parts = prop.split(',')
+        if len(parts) >= 3:
+            address = parts[0].strip()
+            city = parts[1].strip()
+            state_zip = parts[2].strip().split()
+            state = state_zip[0] if state_zip else ''
+            zip_code = state_zip[1] if len(state_zip) > 1 else ''
+            return address, city, state, zip_code
+        
+        logger.warning(f"Could not parse address: {prop}")
+        return None
+    
     def import_and_process_csv(self, csv_file):
         """
         Import properties from CSV and process them.
@@ -205,23 +509,45 @@ class DataEnrichmentPipeline:
         Args:
             property_data: Dictionary with property information
             
+        Returns:
+            Boolean indicating if property meets criteria
+        """
+        return self._criteria_ok(
+            property_data.get('property_type', '').lower(),
+            bool(property_data.get('is_owner_occupied', False)),
+            bool(property_data.get('has_solar_installation', False)),
+            bool(property_data.get('has_solar_permit', False))
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _criteria_ok(property_type, is_owner_occupied, has_solar_installation, has_solar_permit):
+        """
+        Evaluate the basic lead criteria on normalized, hashable property fields.
+        
+        Args:
+            property_type: Lower-cased property type
+            is_owner_occupied: Whether the property is owner-occupied
+            has_solar_installation: Whether the property already has solar
+            has_solar_permit: Whether the property has a recent solar permit
+            
         Returns:
             Boolean indicating if property meets criteria
         """
         # Check if property is a single-family home
-        if property_data.get('property_type', '').lower() != 'single-family':
+        if property_type != 'single-family':
             return False
         
         # Check if property is owner-occupied
-        if not property_data.get('is_owner_occupied', False):
+        if not is_owner_occupied:
             return False
         
         # Check if property already has solar
-        if property_data.get('has_solar_installation', False):
+        if has_solar_installation:
             return False
         
         # Check if property has a recent solar permit
-        if property_data.get('has_solar_permit', False):
+        if has_solar_permit:
             return False
         
         # Property passes basic criteria
@@ -240,87 +566,100 @@ class DataEnrichmentPipeline:
         Returns:
             Integer score from 0-100
         """
-        # This is a simplified scoring algorithm
-        # In a real implementation, this would be more sophisticated
+        return int(_score_kernel(*self._score_inputs(property_data, utility_data, roof_data, owner_data)))
+    
+    def _score_inputs(self, property_data, utility_data, roof_data, owner_data):
+        """
+        Unpack the lead scoring inputs from the source dictionaries.
         
-        score = 50  # Start with a neutral score
+        Missing sections are flagged so their factors are skipped.
+        
+        Returns:
+            Tuple of arguments for _score_kernel
+        """
+        year_built = assessed_value = square_footage = 0
+        monthly_bill = usable_area = shading = ownership_length = 0
+        has_net_metering = do_not_call = False
+        orientation_code = _ORIENTATION_OTHER
         
-        # Property factors (up to +/-15 points)
         if property_data:
-            # Age of home
-            year_built = property_data.get('year_built', 0)
-            if year_built > 0:
-                if year_built < 1970:
-                    score -= 5  # Older homes may need electrical upgrades
-                elif year_built > 2010:
-                    score += 5  # Newer homes typically have better electrical systems
-            
-            # Home value
-            assessed_value = property_data.get('assessed_value', 0)
-            if assessed_value > 500000:
-                score += 5  # Higher value homes often have more disposable income
-            
-            # Square footage
-            square_footage = property_data.get('square_footage', 0)
-            if square_footage > 2500:
-                score += 5  # Larger homes typically have higher energy usage
+            year_built = property_data.get('year_built', 0) or 0
+            assessed_value = property_data.get('assessed_value', 0) or 0
+            square_footage = property_data.get('square_footage', 0) or 0
         
-        # Utility factors (up to +/-30 points)
         if utility_data:
-            # Monthly bill
-            monthly_bill = utility_data.get('estimated_monthly_bill', 0)
-            if monthly_bill > 200:
-                score += 15  # High bills mean more savings potential
-            elif monthly_bill > 150:
-                score += 10
-            elif monthly_bill > 120:
-                score += 5
-            else:
-                score -= 10  # Low bills mean less savings potential
-            
-            # Net metering
-            if utility_data.get('has_net_metering', False):
-                score += 15  # Net metering significantly improves ROI
+            monthly_bill = utility_data.get('estimated_monthly_bill', 0) or 0
+            has_net_metering = bool(utility_data.get('has_net_metering', False))
         
-        # Roof factors (up to +/-40 points)
         if roof_data:
-            # Usable area
-            usable_area = roof_data.get('usable_roof_area', 0)
-            if usable_area > 1000:
-                score += 10  # Larger usable area means more panels
-            elif usable_area < 500:
-                score -= 10  # Small usable area limits system size
-            
-            # Orientation
-            orientation = roof_data.get('primary_orientation', '')
-            if orientation in ['S', 'SE', 'SW']:
-                score += 15  # Optimal orientations
-            elif orientation in ['E', 'W']:
-                score += 5  # Acceptable orientations
-            else:
-                score -= 15  # Poor orientations
-            
-            # Shading
-            shading = roof_data.get('shading_percentage', 0)
-            if shading < 10:
-                score += 15  # Minimal shading is ideal
-            elif shading < 20:
-                score += 5  # Some shading is acceptable
-            else:
-                score -= 15  # Heavy shading reduces production
-        
-        # Owner factors (up to +/-15 points)
+            usable_area = roof_data.get('usable_roof_area', 0) or 0
+            orientation_code = _ORIENTATION_CODES.get(roof_data.get('primary_orientation', ''), _ORIENTATION_OTHER)
+            shading = roof_data.get('shading_percentage', 0) or 0
+        
         if owner_data:
-            # Length of ownership
-            ownership_length = owner_data.get('length_of_ownership', 0)
-            if ownership_length > 5:
-                score += 5  # Longer ownership suggests stability
-            
-            # Do Not Call list
-            if owner_data.get('do_not_call', False):
-                score -= 10  # DNC status makes contact more difficult
+            ownership_length = owner_data.get('length_of_ownership', 0) or 0
+            do_not_call = bool(owner_data.get('do_not_call', False))
+        
+        return (
+            bool(property_data), float(year_built), float(assessed_value), float(square_footage),
+            bool(utility_data), float(monthly_bill), has_net_metering,
+            bool(roof_data), float(usable_area), orientation_code, float(shading),
+            bool(owner_data), float(ownership_length), do_not_call
+        )
+    
+    @staticmethod
+    def _calculate_lead_score_batch(has_property, year_built, assessed_value, square_footage,
+                                    has_utility, monthly_bill, has_net_metering,
+                                    has_roof, usable_area, orientation_code, shading,
+                                    has_owner, ownership_length, do_not_call):
+        """
+        Calculate lead scores for many leads at once.
+        
+        Vectorized equivalent of _calculate_lead_score; each argument is a
+        1-D array with one element per lead, in _score_inputs order.
+        
+        Returns:
+            NumPy int16 array of scores from 0-100
+        """
+        score = np.full(len(year_built), 50, dtype=np.int16)
+        
+        # Property factors
+        score += np.where(
+            has_property & (year_built > 0),
+            np.where(year_built < 1970, -5, np.where(year_built > 2010, 5, 0)),
+            0
+        ).astype(np.int16)
+        score += np.where(has_property & (assessed_value > 500000), 5, 0).astype(np.int16)
+        score += np.where(has_property & (square_footage > 2500), 5, 0).astype(np.int16)
+        
+        # Utility factors
+        score += np.where(
+            has_utility,
+            np.select([monthly_bill > 200, monthly_bill > 150, monthly_bill > 120], [15, 10, 5], default=-10),
+            0
+        ).astype(np.int16)
+        score += np.where(has_utility & has_net_metering, 15, 0).astype(np.int16)
+        
+        # Roof factors
+        score += np.where(
+            has_roof,
+            np.select([usable_area > 1000, usable_area < 500], [10, -10], default=0),
+            0
+        ).astype(np.int16)
+        score += np.where(
+            has_roof,
+            np.select([orientation_code < 3, orientation_code < _ORIENTATION_OTHER], [15, 5], default=-15),
+            0
+        ).astype(np.int16)
+        score += np.where(
+            has_roof,
+            np.select([shading < 10, shading < 20], [15, 5], default=-15),
+            0
+        ).astype(np.int16)
         
-        # Ensure score is within 0-100 range
-        score = max(0, min(100, score))
+        # Owner factors
+        score += np.where(has_owner & (ownership_length > 5), 5, 0).astype(np.int16)
+        score += np.where(has_owner & do_not_call, -10, 0).astype(np.int16)
         
+        np.clip(score, 0, 100, out=score)
         return score
@@ -5,42 +5,283 @@ Handles database connection and schema creation.
 
 import sqlite3
 import os
+import logging
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
+from enum import IntEnum
+
+# Handlers and levels are left to the application entry point
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a pooled read connection (or, in bulk_load, for every
+# borrowed one to come back) before giving up
+_POOL_TIMEOUT = 30
+
+# Rows fetched per page by the iter_* generators, which return their read
+# connection to the pool between pages
+_PAGE_SIZE = 500
+
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Column order of each table as declared in create_tables
+_TABLE_COLUMNS = {
+    'Property': (
+        'property_id', 'address_line_1', 'address_line_2', 'city', 'county', 'state',
+        'zip_code', 'latitude', 'longitude', 'property_type', 'year_built',
+        'square_footage', 'bedrooms', 'bathrooms', 'lot_size', 'assessed_value',
+        'last_sale_date', 'last_sale_price', 'is_owner_occupied', 'has_solar_installation',
+        'has_solar_permit', 'data_source', 'last_updated'
+    ),
+    'Homeowner': (
+        'homeowner_id', 'property_id', 'first_name', 'last_name', 'email', 'phone_mobile',
+        'phone_landline', 'mailing_address_line_1', 'mailing_address_line_2',
+        'mailing_city', 'mailing_state', 'mailing_zip_code', 'length_of_ownership',
+        'skip_trace_status', 'do_not_call', 'contact_preference', 'data_source',
+        'last_updated'
+    ),
+    'Roof': (
+        'roof_id', 'property_id', 'roof_type', 'roof_age', 'roof_condition',
+        'total_roof_area', 'usable_roof_area', 'primary_orientation', 'azimuth', 'pitch',
+        'shading_percentage', 'estimated_solar_potential', 'data_source', 'last_updated'
+    ),
+    'Utility': (
+        'utility_id', 'property_id', 'utility_provider', 'utility_rate_plan', 'base_rate',
+        'tdu_rate', 'has_net_metering', 'net_metering_rate', 'estimated_monthly_bill',
+        'estimated_annual_usage', 'peak_demand', 'data_source', 'last_updated'
+    ),
+    'Lead': (
+        'lead_id', 'property_id', 'homeowner_id', 'lead_score', 'estimated_savings',
+        'estimated_system_size', 'estimated_installation_cost', 'estimated_payback_period',
+        'lead_status', 'assigned_to', 'notes', 'created_date', 'last_updated'
+    )
+}
+
+def _build_insert_sql(table, columns):
+    """Build an INSERT statement with one placeholder per column."""
+    fields = ', '.join(columns)
+    placeholders = ', '.join(['?' for _ in columns])
+    return f"INSERT INTO {table} ({fields}) VALUES ({placeholders})"
+
+# Full-row INSERT statements, built once at import and used to seed each
+# instance's statement cache
+_FULL_INSERT_SQL = {
+    ('insert', table, columns): _build_insert_sql(table, columns)
+    for table, columns in _TABLE_COLUMNS.items()
+}
+
+class LeadStatus(IntEnum):
+    """Lead pipeline stages, stored as small integers in Lead.lead_status."""
+    NEW = 0
+    CONTACTED = 1
+    QUALIFIED = 2
+    APPOINTMENT = 3
+    PROPOSAL = 4
+    WON = 5
+    LOST = 6
+    DISQUALIFIED = 7
+
+# Lead table definition, also used to rebuild pre-LeadStatus tables
+_LEAD_TABLE_SQL = '''
+CREATE TABLE IF NOT EXISTS {table} (
+    lead_id TEXT PRIMARY KEY,
+    property_id TEXT NOT NULL,
+    homeowner_id TEXT NOT NULL,
+    lead_score INTEGER,
+    estimated_savings REAL,
+    estimated_system_size REAL,
+    estimated_installation_cost REAL,
+    estimated_payback_period REAL,
+    lead_status INTEGER NOT NULL DEFAULT 0 CHECK(lead_status BETWEEN 0 AND 7),
+    assigned_to TEXT,
+    notes TEXT,
+    created_date TEXT DEFAULT CURRENT_TIMESTAMP,
+    last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (property_id) REFERENCES Property(property_id),
+    FOREIGN KEY (homeowner_id) REFERENCES Homeowner(homeowner_id),
+    FOREIGN KEY (assigned_to) REFERENCES User(user_id)
+)
+'''
+
+def _lead_status_value(status):
+    """Convert a LeadStatus, its integer value or its name (any case) to the stored integer."""
+    if isinstance(status, str):
+        try:
+            return int(LeadStatus[status.upper()])
+        except KeyError:
+            raise ValueError(f"Unknown lead status: {status}")
+    return int(LeadStatus(status))
+
+def _new_ids(count):
+    """Generate count UUID4 strings from a single read of the OS random source."""
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4))
+        for offset in range(0, 16 * count, 16)
+    ]
 
 class Database:
-    def __init__(self, db_path):
-        """Initialize database connection."""
+    def __init__(self, db_path, pool_size=4):
+        """
+        Initialize database connection.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            pool_size: Number of pooled read connections (reads use the
+                main connection when 0 or for in-memory databases)
+        """
         self.db_path = db_path
+        self.pool_size = pool_size
         self.conn = None
-        self.cursor = None
+        self._sql_cache = dict(_FULL_INSERT_SQL)  # (kind, table, columns) -> SQL string
+        self._column_order_cache = {}  # (table, key order) -> canonical columns
+        self._write_lock = threading.RLock()  # serializes writes on self.conn
+        self._pool_cond = threading.Condition()  # guards the read pool fields below
+        self._read_conns = []  # every open pooled connection
+        self._idle_conns = []  # pooled connections not borrowed right now
+        self._pool_generation = 0  # bumped when the pool is closed
         
     def connect(self):
         """Connect to the database."""
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
             
             # Connect to database
-            self.conn = sqlite3.connect(self.db_path)
-            self.cursor = self.conn.cursor()
-            print(f"Connected to database: {self.db_path}")
+            # Autocommit mode: multi-statement writes open their own transaction
+            # (see _transaction), and writes from any thread are serialized by
+            # _write_lock rather than pinned to the connecting thread
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self.conn.row_factory = sqlite3.Row  # rows index by name as well as position
+            
+            # WAL lets commits append to the log instead of rewriting the
+            # rollback journal, so NORMAL sync is safe and far fewer fsyncs
+            # are needed per insert
+            journal_mode = self.conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            if journal_mode.lower() == 'wal':
+                self.conn.execute('PRAGMA synchronous=NORMAL')
+            else:
+                # e.g. in-memory or network filesystems; keep the default durability
+                logger.warning(f"WAL not available, using journal_mode={journal_mode}")
+            self.conn.execute('PRAGMA temp_store=MEMORY')
+            self.conn.execute('PRAGMA cache_size=-65536')  # ~64MB page cache
+            self.conn.execute('PRAGMA mmap_size=268435456')  # 256MB
+            self.conn.execute('PRAGMA foreign_keys=ON')
+            
+            self._open_read_pool()
+            logger.info(f"Connected to database: {self.db_path}")
             return True
         except Exception as e:
-            print(f"Error connecting to database: {e}")
+            logger.error(f"Error connecting to database: {e}")
             return False
     
     def close(self):
         """Close the database connection."""
+        self._close_read_pool()
+        
         if self.conn:
+            try:
+                # Refresh planner statistics if the session's queries need it
+                self.conn.execute('PRAGMA optimize')
+            except sqlite3.Error as e:
+                logger.warning(f"Error optimizing database: {e}")
             self.conn.close()
-            print("Database connection closed.")
+            logger.info("Database connection closed.")
+    
+    def _open_read_pool(self):
+        """Open the pooled read connections."""
+        # Under WAL readers don't block the writer. Writes stay on self.conn
+        # so there is a single writer. A second ':memory:' connection would
+        # be a separate database, so in-memory databases read from self.conn.
+        if self.db_path == ':memory:':
+            return
+        
+        read_conns = []
+        for _ in range(self.pool_size):
+            read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            read_conn.row_factory = sqlite3.Row
+            read_conn.execute('PRAGMA cache_size=-16384')  # ~16MB page cache
+            read_conn.execute('PRAGMA mmap_size=268435456')
+            read_conns.append(read_conn)
+        
+        with self._pool_cond:
+            self._read_conns = read_conns
+            self._idle_conns = list(read_conns)
+            self._pool_cond.notify_all()
+    
+    def _close_read_pool(self, wait=False):
+        """
+        Close the pooled read connections; reads fall back to self.conn.
+        
+        Borrowed connections belong to the closed pool's generation and are
+        closed when they are returned rather than going back into a pool.
+        
+        Args:
+            wait: Wait for every borrowed connection to be returned first
+        
+        Raises:
+            RuntimeError: If wait is set and connections are still borrowed
+                after _POOL_TIMEOUT seconds
+        """
+        with self._pool_cond:
+            if wait and not self._pool_cond.wait_for(
+                lambda: len(self._idle_conns) == len(self._read_conns), timeout=_POOL_TIMEOUT
+            ):
+                borrowed = len(self._read_conns) - len(self._idle_conns)
+                raise RuntimeError(
+                    f"{borrowed} pooled read connection(s) still in use after {_POOL_TIMEOUT}s"
+                )
+            
+            for read_conn in self._idle_conns:
+                read_conn.close()
+            self._read_conns = []
+            self._idle_conns = []
+            self._pool_generation += 1
+            self._pool_cond.notify_all()
+    
+    @contextmanager
+    def _borrow(self):
+        """
+        Borrow a read connection from the pool, or the main connection (under the writer lock) if there is no pool.
+        
+        Raises:
+            TimeoutError: If no pooled connection is returned within _POOL_TIMEOUT seconds
+        """
+        with self._pool_cond:
+            conn = None
+            if self._read_conns:
+                if not self._pool_cond.wait_for(lambda: self._idle_conns or not self._read_conns, timeout=_POOL_TIMEOUT):
+                    raise TimeoutError(f"No pooled read connection free after {_POOL_TIMEOUT}s (pool_size={self.pool_size})")
+                if self._idle_conns:
+                    conn = self._idle_conns.pop()
+                    generation = self._pool_generation
+        
+        if conn is None:
+            # No pool, or it was closed while waiting (e.g. by bulk_load, which
+            # holds the writer lock until the load is done and the pool reopened)
+            with self._write_lock:
+                yield self.conn
+            return
+        
+        try:
+            yield conn
+        finally:
+            with self._pool_cond:
+                if generation == self._pool_generation:
+                    self._idle_conns.append(conn)
+                else:
+                    conn.close()  # the pool it came from has been closed
+                self._pool_cond.notify_all()
     
     def create_tables(self):
         """Create database tables if they don't exist."""
         try:
             # Property Table
-            self.cursor.execute('''
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS Property (
                 property_id TEXT PRIMARY KEY,
                 address_line_1 TEXT NOT NULL,
@@ -69,7 +310,7 @@ class Database:
             ''')
             
             # Homeowner Table
-            self.cursor.execute('''
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS Homeowner (
                 homeowner_id TEXT PRIMARY KEY,
                 property_id TEXT NOT NULL,
@@ -94,7 +335,7 @@ class Database:
             ''')
             
             # Roof Table
-            self.cursor.execute('''
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS Roof (
                 roof_id TEXT PRIMARY KEY,
                 property_id TEXT NOT NULL,
@@ -115,7 +356,7 @@ class Database:
             ''')
             
             # Utility Table
-            self.cursor.execute('''
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS Utility (
                 utility_id TEXT PRIMARY KEY,
                 property_id TEXT NOT NULL,
@@ -135,7 +376,7 @@ class Database:
             ''')
             
             # User Table
-            self.cursor.execute('''
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS User (
                 user_id TEXT PRIMARY KEY,
                 username TEXT NOT NULL UNIQUE,
@@ -150,45 +391,316 @@ class Database:
             )
             ''')
             
-            # Lead Table
-            self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Lead (
-                lead_id TEXT PRIMARY KEY,
-                property_id TEXT NOT NULL,
-                homeowner_id TEXT NOT NULL,
-                lead_score INTEGER,
-                estimated_savings REAL,
-                estimated_system_size REAL,
-                estimated_installation_cost REAL,
-                estimated_payback_period REAL,
-                lead_status TEXT,
-                assigned_to TEXT,
-                notes TEXT,
-                created_date TEXT DEFAULT CURRENT_TIMESTAMP,
-                last_updated TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (property_id) REFERENCES Property(property_id),
-                FOREIGN KEY (homeowner_id) REFERENCES Homeowner(homeowner_id),
-                FOREIGN KEY (assigned_to) REFERENCES User(user_id)
+            # Lead Table (rebuilt first if it still stores free-text statuses)
+            self._migrate_lead_status()
+            self.conn.execute(_LEAD_TABLE_SQL.format(table='Lead'))
+            
+            # Lead status lookup table mirroring LeadStatus
+            self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS LeadStatus (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
             )
             ''')
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO LeadStatus (id, name) VALUES (?, ?)',
+                [(int(status), status.name.lower()) for status in LeadStatus]
+            )
             
             # Create indexes
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_property_location ON Property(latitude, longitude)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_property_zip ON Property(zip_code)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_property_owner_occupied ON Property(is_owner_occupied)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_homeowner_contact ON Homeowner(email, phone_mobile)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_lead_score ON Lead(lead_score)')
-            self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_lead_status ON Lead(lead_status)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_property_zip ON Property(zip_code)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_homeowner_contact ON Homeowner(email, phone_mobile)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_lead_status ON Lead(lead_status)')
             
-            self.conn.commit()
-            print("Database tables created successfully.")
+            # Lead score index ordered for get_leads_by_score, carrying the
+            # join keys so the range scan doesn't need the table row
+            self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_lead_score_covering
+            ON Lead(lead_score DESC, property_id, homeowner_id, lead_status, assigned_to)
+            ''')
+            
+            # Superseded by the covering index, and a boolean index too
+            # unselective to help reads while still costing every write
+            self.conn.execute('DROP INDEX IF EXISTS idx_lead_score')
+            self.conn.execute('DROP INDEX IF EXISTS idx_property_owner_occupied')
+            
+            # Bounding-box lookups use the PropertyGeo R*Tree instead
+            self.conn.execute('DROP INDEX IF EXISTS idx_property_location')
+            
+            self._create_search_tables()
+            self._create_geo_index()
+            
+            # Gather statistics so the planner picks the new indexes
+            self.conn.execute('ANALYZE')
+            logger.info("Database tables created successfully.")
             return True
         except Exception as e:
-            print(f"Error creating tables: {e}")
+            logger.error(f"Error creating tables: {e}")
             return False
     
-    def insert_property(self, property_data):
-        """Insert a new property record."""
+    def _migrate_lead_status(self):
+        """
+        Rebuild a Lead table that still stores lead_status as free text.
+        
+        Databases created before LeadStatus hold names like 'new' in a TEXT
+        column, which CREATE TABLE IF NOT EXISTS leaves in place. Legacy
+        values are mapped to LeadStatus by name (any case) or number;
+        anything unrecognised, including NULL, becomes NEW.
+        """
+        column_types = {row['name']: row['type'] for row in self.conn.execute('PRAGMA table_info(Lead)')}
+        if not column_types or column_types.get('lead_status', '').upper() == 'INTEGER':
+            return
+        
+        mapping = []
+        unknown = []
+        for (legacy,) in self.conn.execute('SELECT DISTINCT lead_status FROM Lead WHERE lead_status IS NOT NULL'):
+            value = legacy.strip() if isinstance(legacy, str) else legacy
+            try:
+                status = _lead_status_value(int(value) if isinstance(value, str) and value.isdigit() else value)
+            except (ValueError, TypeError):
+                unknown.append(legacy)
+                status = int(LeadStatus.NEW)
+            mapping.append((legacy, status))
+        if unknown:
+            logger.warning(f"Migrating unknown lead statuses {unknown} to 'new'")
+        
+        columns = [column for column in _TABLE_COLUMNS['Lead'] if column in column_types]
+        if mapping:
+            status_sql = 'CASE lead_status ' + ' '.join(['WHEN ? THEN ?'] * len(mapping)) + ' ELSE 0 END'
+        else:
+            status_sql = '0'
+        selected = ', '.join([status_sql if column == 'lead_status' else column for column in columns])
+        
+        with self._transaction():
+            self.conn.execute(_LEAD_TABLE_SQL.format(table='Lead_migrated'))
+            self.conn.execute(
+                f"INSERT INTO Lead_migrated ({', '.join(columns)}) SELECT {selected} FROM Lead",
+                [value for pair in mapping for value in pair]
+            )
+            self.conn.execute('DROP TABLE Lead')
+            self.conn.execute('ALTER TABLE Lead_migrated RENAME TO Lead')
+        logger.info("Migrated Lead.lead_status to LeadStatus values")
+    
+    def _create_search_tables(self):
+        """
+        Create FTS5 full-text indexes over property addresses and homeowner names.
+        
+        The indexes are external-content tables kept in sync by triggers, so
+        searches are inverted-index lookups instead of LIKE scans. They are
+        rebuilt from the base tables when first created on an existing database.
+        Skipped (with a warning) if SQLite was built without FTS5.
+        """
+        search_tables = {
+            'PropertySearch': ('Property', ('address_line_1', 'city', 'zip_code')),
+            'HomeownerSearch': ('Homeowner', ('first_name', 'last_name'))
+        }
+        
+        try:
+            for search_table, (table, columns) in search_tables.items():
+                exists = self.conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (search_table,)
+                ).fetchone()
+                
+                fields = ', '.join(columns)
+                new_fields = ', '.join([f"new.{column}" for column in columns])
+                old_fields = ', '.join([f"old.{column}" for column in columns])
+                
+                self.conn.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS {search_table}
+                USING fts5({fields}, content='{table}', content_rowid='rowid')
+                ''')
+                self.conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {search_table}(rowid, {fields}) VALUES (new.rowid, {new_fields});
+                END
+                ''')
+                self.conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {search_table}({search_table}, rowid, {fields}) VALUES ('delete', old.rowid, {old_fields});
+                END
+                ''')
+                self.conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {table} BEGIN
+                    INSERT INTO {search_table}({search_table}, rowid, {fields}) VALUES ('delete', old.rowid, {old_fields});
+                    INSERT INTO {search_table}(rowid, {fields}) VALUES (new.rowid, {new_fields});
+                END
+                ''')
+                
+                if not exists:
+                    self.conn.execute(f"INSERT INTO {search_table}({search_table}) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable: {e}")
+    
+    def _create_geo_index(self):
+        """
+        Create the PropertyGeo R*Tree over property coordinates.
+        
+        Each located property is stored as a point box keyed by its rowid and
+        kept in sync by triggers, so bounding-box queries are tree lookups
+        rather than scans. Skipped (with a warning) if SQLite lacks R*Tree.
+        """
+        try:
+            exists = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'PropertyGeo'"
+            ).fetchone()
+            
+            self.conn.execute('CREATE VIRTUAL TABLE IF NOT EXISTS PropertyGeo USING rtree(id, min_lat, max_lat, min_lon, max_lon)')
+            self.conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS PropertyGeo_ai AFTER INSERT ON Property
+            WHEN new.latitude IS NOT NULL AND new.longitude IS NOT NULL BEGIN
+                INSERT INTO PropertyGeo VALUES (new.rowid, new.latitude, new.latitude, new.longitude, new.longitude);
+            END
+            ''')
+            self.conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS PropertyGeo_ad AFTER DELETE ON Property BEGIN
+                DELETE FROM PropertyGeo WHERE id = old.rowid;
+            END
+            ''')
+            self.conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS PropertyGeo_au AFTER UPDATE OF latitude, longitude ON Property BEGIN
+                DELETE FROM PropertyGeo WHERE id = old.rowid;
+                INSERT INTO PropertyGeo
+                SELECT new.rowid, new.latitude, new.latitude, new.longitude, new.longitude
+                WHERE new.latitude IS NOT NULL AND new.longitude IS NOT NULL;
+            END
+            ''')
+            
+            if not exists:
+                self.conn.execute('''
+                INSERT INTO PropertyGeo
+                SELECT rowid, latitude, latitude, longitude, longitude FROM Property
+                WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+                ''')
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Spatial index unavailable: {e}")
+    
+    def _ordered_columns(self, table, record):
+        """
+        Get a record's columns in the table's declared order.
+        
+        Callers passing the same fields in different orders then share one
+        statement (and one executemany group) instead of each building their
+        own. Keys that aren't table columns keep their order at the end, so
+        SQLite still reports them.
+        
+        Args:
+            table: Table name
+            record: Dictionary of column values
+            
+        Returns:
+            Tuple of column names
+        """
+        keys = tuple(record)
+        columns = self._column_order_cache.get((table, keys))
+        if columns is None:
+            declared = _TABLE_COLUMNS[table]
+            columns = tuple(column for column in declared if column in record)
+            columns += tuple(key for key in keys if key not in declared)
+            self._column_order_cache[(table, keys)] = columns
+        return columns
+    
+    def _insert_sql(self, table, columns):
+        """
+        Get the INSERT statement for a table and column signature.
+        
+        Statements are cached so repeated inserts with the same fields skip
+        rebuilding the SQL (and hit sqlite3's own statement cache).
+        
+        Args:
+            table: Table name
+            columns: Tuple of column names in value order
+            
+        Returns:
+            SQL string with one placeholder per column
+        """
+        key = ('insert', table, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = _build_insert_sql(table, columns)
+            self._sql_cache[key] = query
+        return query
+    
+    def _update_sql(self, table, columns, id_field):
+        """
+        Get the UPDATE statement for a table and column signature.
+        
+        Args:
+            table: Table name
+            columns: Tuple of column names to set, in value order
+            id_field: Primary key column used in the WHERE clause
+            
+        Returns:
+            SQL string whose last placeholder is the record ID
+        """
+        key = ('update', table, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            set_clause = ', '.join([f"{column} = ?" for column in columns])
+            query = f"UPDATE {table} SET {set_clause} WHERE {id_field} = ?"
+            self._sql_cache[key] = query
+        return query
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a block of writes as one transaction, holding the write lock.
+        
+        A block opened inside another transaction runs as a savepoint, so it
+        rolls back only its own writes on error and leaves committing to the
+        outermost block.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                self.conn.execute('SAVEPOINT nested_write')
+                try:
+                    yield
+                except Exception:
+                    self.conn.execute('ROLLBACK TO nested_write')
+                    self.conn.execute('RELEASE nested_write')
+                    raise
+                self.conn.execute('RELEASE nested_write')
+                return
+            
+            self.conn.execute('BEGIN')
+            try:
+                yield
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+    
+    def _execute_write(self, query, values, table, id_field, record_id, return_row=False):
+        """
+        Execute an INSERT or UPDATE, optionally returning the written row.
+        
+        Uses RETURNING when SQLite supports it so the row comes back from the
+        same statement; older libraries fall back to selecting it by ID.
+        
+        Args:
+            query: INSERT or UPDATE statement
+            values: Statement parameters
+            table: Table name
+            id_field: Primary key column
+            record_id: ID of the record being written
+            return_row: Whether to return the written row
+            
+        Returns:
+            The written row if return_row, otherwise None
+        """
+        with self._write_lock:
+            if not return_row:
+                self.conn.execute(query, values)
+                return None
+            
+            if _SUPPORTS_RETURNING:
+                rows = self.conn.execute(f"{query} RETURNING *", values).fetchall()
+                return rows[0] if rows else None
+            
+            self.conn.execute(query, values)
+            return self.conn.execute(f"SELECT * FROM {table} WHERE {id_field} = ?", (record_id,)).fetchone()
+    
+    def insert_property(self, property_data, return_row=False):
+        """Insert a new property record (returns the stored row instead of the ID if return_row)."""
         try:
             property_id = str(uuid.uuid4())
             property_data['property_id'] = property_id
@@ -197,22 +709,20 @@ class Database:
             if 'last_updated' not in property_data:
                 property_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SQL query dynamically based on available fields
-            fields = ', '.join(property_data.keys())
-            placeholders = ', '.join(['?' for _ in property_data])
+            # Build the SQL query based on available fields
+            columns = self._ordered_columns('Property', property_data)
+            query = self._insert_sql('Property', columns)
+            values = [property_data[column] for column in columns]
+            row = self._execute_write(query, values, 'Property', 'property_id', property_id, return_row)
             
-            query = f"INSERT INTO Property ({fields}) VALUES ({placeholders})"
-            self.cursor.execute(query, list(property_data.values()))
-            self.conn.commit()
-            
-            print(f"Property inserted with ID: {property_id}")
-            return property_id
+            logger.debug("Property inserted with ID: %s", property_id)
+            return row if return_row else property_id
         except Exception as e:
-            print(f"Error inserting property: {e}")
+            logger.error(f"Error inserting property: {e}")
             return None
     
-    def insert_homeowner(self, homeowner_data):
-        """Insert a new homeowner record."""
+    def insert_homeowner(self, homeowner_data, return_row=False):
+        """Insert a new homeowner record (returns the stored row instead of the ID if return_row)."""
         try:
             homeowner_id = str(uuid.uuid4())
             homeowner_data['homeowner_id'] = homeowner_id
@@ -221,22 +731,20 @@ class Database:
             if 'last_updated' not in homeowner_data:
                 homeowner_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SQL query dynamically based on available fields
-            fields = ', '.join(homeowner_data.keys())
-            placeholders = ', '.join(['?' for _ in homeowner_data])
+            # Build the SQL query based on available fields
+            columns = self._ordered_columns('Homeowner', homeowner_data)
+            query = self._insert_sql('Homeowner', columns)
+            values = [homeowner_data[column] for column in columns]
+            row = self._execute_write(query, values, 'Homeowner', 'homeowner_id', homeowner_id, return_row)
             
-            query = f"INSERT INTO Homeowner ({fields}) VALUES ({placeholders})"
-            self.cursor.execute(query, list(homeowner_data.values()))
-            self.conn.commit()
-            
-            print(f"Homeowner inserted with ID: {homeowner_id}")
-            return homeowner_id
+            logger.debug("Homeowner inserted with ID: %s", homeowner_id)
+            return row if return_row else homeowner_id
         except Exception as e:
-            print(f"Error inserting homeowner: {e}")
+            logger.error(f"Error inserting homeowner: {e}")
             return None
     
-    def insert_roof(self, roof_data):
-        """Insert a new roof record."""
+    def insert_roof(self, roof_data, return_row=False):
+        """Insert a new roof record (returns the stored row instead of the ID if return_row)."""
         try:
             roof_id = str(uuid.uuid4())
             roof_data['roof_id'] = roof_id
@@ -245,22 +753,20 @@ class Database:
             if 'last_updated' not in roof_data:
                 roof_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SQL query dynamically based on available fields
-            fields = ', '.join(roof_data.keys())
-            placeholders = ', '.join(['?' for _ in roof_data])
-            
-            query = f"INSERT INTO Roof ({fields}) VALUES ({placeholders})"
-            self.cursor.execute(query, list(roof_data.values()))
-            self.conn.commit()
+            # Build the SQL query based on available fields
+            columns = self._ordered_columns('Roof', roof_data)
+            query = self._insert_sql('Roof', columns)
+            values = [roof_data[column] for column in columns]
+            row = self._execute_write(query, values, 'Roof', 'roof_id', roof_id, return_row)
             
-            print(f"Roof inserted with ID: {roof_id}")
-            return roof_id
+            logger.debug("Roof inserted with ID: %s", roof_id)
+            return row if return_row else roof_id
         except Exception as e:
-            print(f"Error inserting roof: {e}")
+            logger.error(f"Error inserting roof: {e}")
             return None
     
-    def insert_utility(self, utility_data):
-        """Insert a new utility record."""
+    def insert_utility(self, utility_data, return_row=False):
+        """Insert a new utility record (returns the stored row instead of the ID if return_row)."""
         try:
             utility_id = str(uuid.uuid4())
             utility_data['utility_id'] = utility_id
@@ -269,22 +775,20 @@ class Database:
             if 'last_updated' not in utility_data:
                 utility_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SQL query dynamically based on available fields
-            fields = ', '.join(utility_data.keys())
-            placeholders = ', '.join(['?' for _ in utility_data])
-            
-            query = f"INSERT INTO Utility ({fields}) VALUES ({placeholders})"
-            self.cursor.execute(query, list(utility_data.values()))
-            self.conn.commit()
+            # Build the SQL query based on available fields
+            columns = self._ordered_columns('Utility', utility_data)
+            query = self._insert_sql('Utility', columns)
+            values = [utility_data[column] for column in columns]
+            row = self._execute_write(query, values, 'Utility', 'utility_id', utility_id, return_row)
             
-            print(f"Utility inserted with ID: {utility_id}")
-            return utility_id
+            logger.debug("Utility inserted with ID: %s", utility_id)
+            return row if return_row else utility_id
         except Exception as e:
-            print(f"Error inserting utility: {e}")
+            logger.error(f"Error inserting utility: {e}")
             return None
     
-    def insert_lead(self, lead_data):
-        """Insert a new lead record."""
+    def insert_lead(self, lead_data, return_row=False):
+        """Insert a new lead record (returns the stored row instead of the ID if return_row)."""
         try:
             lead_id = str(uuid.uuid4())
             lead_data['lead_id'] = lead_id
@@ -294,112 +798,409 @@ class Database:
                 lead_data['created_date'] = datetime.now().isoformat()
             if 'last_updated' not in lead_data:
                 lead_data['last_updated'] = datetime.now().isoformat()
+            if 'lead_status' in lead_data:
+                lead_data['lead_status'] = _lead_status_value(lead_data['lead_status'])
             
-            # Build the SQL query dynamically based on available fields
-            fields = ', '.join(lead_data.keys())
-            placeholders = ', '.join(['?' for _ in lead_data])
+            # Build the SQL query based on available fields
+            columns = self._ordered_columns('Lead', lead_data)
+            query = self._insert_sql('Lead', columns)
+            values = [lead_data[column] for column in columns]
+            row = self._execute_write(query, values, 'Lead', 'lead_id', lead_id, return_row)
             
-            query = f"INSERT INTO Lead ({fields}) VALUES ({placeholders})"
-            self.cursor.execute(query, list(lead_data.values()))
-            self.conn.commit()
+            logger.debug("Lead inserted with ID: %s", lead_id)
+            return row if return_row else lead_id
+        except Exception as e:
+            logger.error(f"Error inserting lead: {e}")
+            return None
+    
+    def insert_lead_bundle(self, property_data, homeowner_data, lead_extra=None):
+        """
+        Insert a property, its homeowner and their lead in one transaction.
+        
+        Args:
+            property_data: Dictionary with property information
+            homeowner_data: Dictionary with homeowner information
+            lead_extra: Optional dictionary with the remaining lead fields
+                (score, status, estimates)
+            
+        Returns:
+            Dictionary with property_id, homeowner_id and lead_id, or None
+            if the bundle failed (nothing is written in that case)
+        """
+        try:
+            property_id, homeowner_id, lead_id = _new_ids(3)
+            now = datetime.now().isoformat()
             
-            print(f"Lead inserted with ID: {lead_id}")
-            return lead_id
+            property_data['property_id'] = property_id
+            homeowner_data['homeowner_id'] = homeowner_id
+            homeowner_data['property_id'] = property_id
+            
+            lead_data = dict(lead_extra or {})
+            lead_data['lead_id'] = lead_id
+            lead_data['property_id'] = property_id
+            lead_data['homeowner_id'] = homeowner_id
+            if 'created_date' not in lead_data:
+                lead_data['created_date'] = now
+            if 'lead_status' in lead_data:
+                lead_data['lead_status'] = _lead_status_value(lead_data['lead_status'])
+            
+            # Set default timestamps if not provided
+            for record in (property_data, homeowner_data, lead_data):
+                if 'last_updated' not in record:
+                    record['last_updated'] = now
+            
+            with self._transaction():
+                for table, record in (('Property', property_data), ('Homeowner', homeowner_data), ('Lead', lead_data)):
+                    columns = self._ordered_columns(table, record)
+                    self.conn.execute(self._insert_sql(table, columns), [record[column] for column in columns])
+            
+            logger.debug("Lead bundle inserted with lead ID: %s", lead_id)
+            return {
+                'property_id': property_id,
+                'homeowner_id': homeowner_id,
+                'lead_id': lead_id
+            }
         except Exception as e:
-            print(f"Error inserting lead: {e}")
+            logger.error(f"Error inserting lead bundle: {e}")
             return None
     
+    def _bulk_insert(self, table, id_field, records):
+        """
+        Insert many records into a table in a single transaction.
+        
+        Records are grouped by their (canonically ordered) column set so each
+        group is written with one executemany call. Prefer the bulk_insert_* methods over the
+        per-row insert_* methods for ETL paths.
+        
+        Args:
+            table: Table name
+            id_field: Name of the primary key column to generate
+            records: List of dictionaries to insert
+            
+        Returns:
+            List of generated IDs in input order (all None if the batch failed)
+        """
+        if not records:
+            return []
+        
+        try:
+            # Generate every ID up front so the transaction only writes rows
+            ids = _new_ids(len(records))
+            batch_time = datetime.now().isoformat()  # shared by the whole batch
+            groups = {}
+            for record, record_id in zip(records, ids):
+                record[id_field] = record_id
+                
+                # Set default timestamp if not provided
+                if 'last_updated' not in record:
+                    record['last_updated'] = batch_time
+                
+                columns = self._ordered_columns(table, record)
+                groups.setdefault(columns, []).append([record[column] for column in columns])
+            
+            with self._transaction():
+                for columns, rows in groups.items():
+                    self.conn.executemany(self._insert_sql(table, columns), rows)
+            
+            logger.debug("Inserted %d records into %s", len(ids), table)
+            return ids
+        except Exception as e:
+            logger.error(f"Error bulk inserting into {table}: {e}")
+            return [None] * len(records)
+    
+    def bulk_insert_properties(self, properties):
+        """Insert many property records; returns their IDs in order."""
+        return self._bulk_insert('Property', 'property_id', properties)
+    
+    def bulk_insert_homeowners(self, homeowners):
+        """Insert many homeowner records; returns their IDs in order."""
+        return self._bulk_insert('Homeowner', 'homeowner_id', homeowners)
+    
+    def bulk_insert_roofs(self, roofs):
+        """Insert many roof records; returns their IDs in order."""
+        return self._bulk_insert('Roof', 'roof_id', roofs)
+    
+    def bulk_insert_utilities(self, utilities):
+        """Insert many utility records; returns their IDs in order."""
+        return self._bulk_insert('Utility', 'utility_id', utilities)
+    
+    def bulk_insert_leads(self, leads):
+        """Insert many lead records; returns their IDs in order."""
+        created_date = datetime.now().isoformat()
+        try:
+            for lead_data in leads:
+                if 'created_date' not in lead_data:
+                    lead_data['created_date'] = created_date
+                if 'lead_status' in lead_data:
+                    lead_data['lead_status'] = _lead_status_value(lead_data['lead_status'])
+        except ValueError as e:
+            logger.error(f"Error bulk inserting into Lead: {e}")
+            return [None] * len(leads)
+        return self._bulk_insert('Lead', 'lead_id', leads)
+    
+    @contextmanager
+    def bulk_load(self):
+        """
+        Context manager for loading a fresh dataset as fast as possible.
+        
+        Journaling, fsyncs and foreign key checks are switched off for the
+        duration and the previous settings are restored on exit. Without a
+        journal a crash (or a failed batch) during the load can leave partial
+        or corrupt data, so only use this for loads that can be re-run from
+        scratch, e.g. an initial property import:
+        
+            with db.bulk_load():
+                db.bulk_insert_properties(rows)
+        """
+        with self._write_lock:
+            self.conn.commit()
+            
+            # SQLite can't leave WAL mode while other connections are open,
+            # so wait for borrowed readers to come back before closing them
+            self._close_read_pool(wait=True)
+            try:
+                journal_mode = self.conn.execute('PRAGMA journal_mode').fetchone()[0]
+                synchronous = self.conn.execute('PRAGMA synchronous').fetchone()[0]
+                foreign_keys = self.conn.execute('PRAGMA foreign_keys').fetchone()[0]
+                
+                try:
+                    self.conn.execute('PRAGMA journal_mode=OFF')
+                    self.conn.execute('PRAGMA synchronous=OFF')
+                    self.conn.execute('PRAGMA foreign_keys=OFF')
+                    yield self
+                finally:
+                    self.conn.commit()
+                    self.conn.execute(f'PRAGMA journal_mode={journal_mode}')
+                    self.conn.execute(f'PRAGMA synchronous={synchronous}')
+                    self.conn.execute(f'PRAGMA foreign_keys={foreign_keys}')
+                
+                # Let the planner see the freshly loaded distributions
+                for table in ('Property', 'Homeowner', 'Lead'):
+                    self.conn.execute(f'ANALYZE {table}')
+            finally:
+                self._open_read_pool()
+    
     def get_property_by_id(self, property_id):
         """Get property by ID."""
         try:
-            self.cursor.execute("SELECT * FROM Property WHERE property_id = ?", (property_id,))
-            return self.cursor.fetchone()
+            with self._borrow() as conn:
+                return conn.execute("SELECT * FROM Property WHERE property_id = ?", (property_id,)).fetchone()
         except Exception as e:
-            print(f"Error getting property: {e}")
+            logger.error(f"Error getting property: {e}")
             return None
     
     def get_properties_by_zip(self, zip_code):
         """Get properties by ZIP code."""
         try:
-            self.cursor.execute("SELECT * FROM Property WHERE zip_code = ?", (zip_code,))
-            return self.cursor.fetchall()
+            return list(self.iter_properties_by_zip(zip_code))
         except Exception as e:
-            print(f"Error getting properties by ZIP: {e}")
+            logger.error(f"Error getting properties by ZIP: {e}")
             return []
     
+    def iter_properties_by_zip(self, zip_code):
+        """
+        Iterate over properties by ZIP code, a page of rows at a time.
+        
+        The read connection is borrowed only while a page is fetched, so a
+        slow or abandoned generator doesn't hold it. Errors propagate to the
+        caller. Rows carry an extra _rowid column, the key the next page
+        resumes from.
+        """
+        last_rowid = 0
+        while True:
+            with self._borrow() as conn:
+                rows = conn.execute(
+                    "SELECT rowid AS _rowid, * FROM Property WHERE zip_code = ? AND rowid > ? ORDER BY rowid LIMIT ?",
+                    (zip_code, last_rowid, _PAGE_SIZE)
+                ).fetchall()
+            
+            yield from rows
+            if len(rows) < _PAGE_SIZE:
+                return
+            last_rowid = rows[-1]['_rowid']
+    
     def get_homeowner_by_property(self, property_id):
         """Get homeowner by property ID."""
         try:
-            self.cursor.execute("SELECT * FROM Homeowner WHERE property_id = ?", (property_id,))
-            return self.cursor.fetchone()
+            with self._borrow() as conn:
+                return conn.execute("SELECT * FROM Homeowner WHERE property_id = ?", (property_id,)).fetchone()
         except Exception as e:
-            print(f"Error getting homeowner: {e}")
+            logger.error(f"Error getting homeowner: {e}")
             return None
     
     def get_leads_by_score(self, min_score=0, max_score=100, limit=100):
         """Get leads by score range."""
         try:
-            self.cursor.execute("""
-                SELECT l.*, p.address_line_1, p.city, p.zip_code, h.first_name, h.last_name, h.phone_mobile, h.email
-                FROM Lead l
-                JOIN Property p ON l.property_id = p.property_id
-                JOIN Homeowner h ON l.homeowner_id = h.homeowner_id
-                WHERE l.lead_score BETWEEN ? AND ?
-                ORDER BY l.lead_score DESC
-                LIMIT ?
-            """, (min_score, max_score, limit))
-            return self.cursor.fetchall()
+            return list(self.iter_leads_by_score(min_score, max_score, limit))
+        except Exception as e:
+            logger.error(f"Error getting leads by score: {e}")
+            return []
+    
+    def iter_leads_by_score(self, min_score=0, max_score=100, limit=100):
+        """
+        Iterate over leads by score range, highest score first.
+        
+        lead_status comes back as its LeadStatus name in lowercase, e.g.
+        'new'. Pages continue from the last (score, lead_id) seen and the
+        read connection is borrowed only while a page is fetched. Errors
+        propagate to the caller.
+        """
+        last_score, last_lead_id = max_score, ''
+        remaining = limit
+        while remaining > 0:
+            page_size = min(_PAGE_SIZE, remaining)
+            with self._borrow() as conn:
+                rows = conn.execute("""
+                    SELECT l.lead_id, l.lead_score, s.name AS lead_status,
+                           p.address_line_1, p.city, p.zip_code,
+                           h.first_name, h.last_name, h.phone_mobile, h.email
+                    FROM Lead l
+                    JOIN Property p ON l.property_id = p.property_id
+                    JOIN Homeowner h ON l.homeowner_id = h.homeowner_id
+                    LEFT JOIN LeadStatus s ON s.id = l.lead_status
+                    WHERE l.lead_score BETWEEN ? AND ?
+                      AND (l.lead_score < ? OR (l.lead_score = ? AND l.lead_id > ?))
+                    ORDER BY l.lead_score DESC, l.lead_id
+                    LIMIT ?
+                """, (min_score, max_score, last_score, last_score, last_lead_id, page_size)).fetchall()
+            
+            yield from rows
+            if len(rows) < page_size:
+                return
+            remaining -= len(rows)
+            last_score, last_lead_id = rows[-1]['lead_score'], rows[-1]['lead_id']
+    
+    def properties_in_bbox(self, lat1, lat2, lon1, lon2):
+        """
+        Get properties located inside a latitude/longitude bounding box.
+        
+        Args:
+            lat1, lat2: Latitude bounds (either order)
+            lon1, lon2: Longitude bounds (either order)
+            
+        Returns:
+            List of property rows
+        """
+        min_lat, max_lat = sorted((lat1, lat2))
+        min_lon, max_lon = sorted((lon1, lon2))
+        try:
+            with self._borrow() as conn:
+                # The R*Tree stores 32-bit bounds rounded outward, so it selects
+                # candidates and the exact coordinates decide
+                return conn.execute("""
+                    SELECT p.*
+                    FROM PropertyGeo g
+                    JOIN Property p ON p.rowid = g.id
+                    WHERE g.max_lat >= ? AND g.min_lat <= ?
+                      AND g.max_lon >= ? AND g.min_lon <= ?
+                      AND p.latitude BETWEEN ? AND ?
+                      AND p.longitude BETWEEN ? AND ?
+                """, (min_lat, max_lat, min_lon, max_lon,
+                      min_lat, max_lat, min_lon, max_lon)).fetchall()
         except Exception as e:
-            print(f"Error getting leads by score: {e}")
+            logger.error(f"Error getting properties in bounding box: {e}")
             return []
     
-    def update_property(self, property_id, update_data):
-        """Update property record."""
+    def _match_query(self, text):
+        """Turn free text into an FTS5 query matching every word as a prefix."""
+        terms = ['"' + term.replace('"', '""') + '"*' for term in text.split()]
+        return ' '.join(terms)
+    
+    def search_properties(self, text, limit=100):
+        """Search properties by address, city or ZIP code text."""
+        try:
+            query = self._match_query(text)
+            if not query:
+                return []
+            with self._borrow() as conn:
+                return conn.execute("""
+                    SELECT p.*
+                    FROM PropertySearch s
+                    JOIN Property p ON p.rowid = s.rowid
+                    WHERE PropertySearch MATCH ?
+                    ORDER BY s.rank
+                    LIMIT ?
+                """, (query, limit)).fetchall()
+        except Exception as e:
+            logger.error(f"Error searching properties: {e}")
+            return []
+    
+    def search_homeowners(self, text, limit=100):
+        """Search homeowners by first or last name."""
+        try:
+            query = self._match_query(text)
+            if not query:
+                return []
+            with self._borrow() as conn:
+                return conn.execute("""
+                    SELECT h.*
+                    FROM HomeownerSearch s
+                    JOIN Homeowner h ON h.rowid = s.rowid
+                    WHERE HomeownerSearch MATCH ?
+                    ORDER BY s.rank
+                    LIMIT ?
+                """, (query, limit)).fetchall()
+        except Exception as e:
+            logger.error(f"Error searching homeowners: {e}")
+            return []
+    
+    def update_property(self, property_id, update_data, return_row=False):
+        """Update property record (returns the updated row instead of True if return_row)."""
         try:
             # Add last_updated timestamp
             update_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SET clause for the SQL query
-            set_clause = ', '.join([f"{key} = ?" for key in update_data.keys()])
-            values = list(update_data.values())
+            # Build the SQL query based on the fields being updated
+            columns = self._ordered_columns('Property', update_data)
+            query = self._update_sql('Property', columns, 'property_id')
+            values = [update_data[column] for column in columns]
             values.append(property_id)  # Add property_id for the WHERE clause
+            row = self._execute_write(query, values, 'Property', 'property_id', property_id, return_row)
             
-            query = f"UPDATE Property SET {set_clause} WHERE property_id = ?"
-            self.cursor.execute(query, values)
-            self.conn.commit()
-            
-            print(f"Property updated: {property_id}")
-            return True
+            logger.debug("Property updated: %s", property_id)
+            return row if return_row else True
         except Exception as e:
-            print(f"Error updating property: {e}")
+            logger.error(f"Error updating property: {e}")
             return False
     
-    def update_homeowner(self, homeowner_id, update_data):
-        """Update homeowner record."""
+    def update_homeowner(self, homeowner_id, update_data, return_row=False):
+        """Update homeowner record (returns the updated row instead of True if return_row)."""
         try:
             # Add last_updated timestamp
             update_data['last_updated'] = datetime.now().isoformat()
             
-            # Build the SET clause for the SQL query
-            set_clause = ', '.join([f"{key} = ?" for key in update_data.keys()])
-            values = list(update_data.values())
+            # Build the SQL query based on the fields being updated
+            columns = self._ordered_columns('Homeowner', update_data)
+            query = self._update_sql('Homeowner', columns, 'homeowner_id')
+            values = [update_data[column] for column in columns]
             values.append(homeowner_id)  # Add homeowner_id for the WHERE clause
+            row = self._execute_write(query, values, 'Homeowner', 'homeowner_id', homeowner_id, return_row)
             
-            query = f"UPDATE Homeowner SET {set_clause} WHERE homeowner_id = ?"
-            self.cursor.execute(query, values)
-            self.conn.commit()
-            
-            print(f"Homeowner updated: {homeowner_id}")
-            return True
+            logger.debug("Homeowner updated: %s", homeowner_id)
+            return row if return_row else True
         except Exception as e:
-            print(f"Error updating homeowner: {e}")
+            logger.error(f"Error updating homeowner: {e}")
             return False
     
     def update_lead_status(self, lead_id, status, notes=None):
-        """Update lead status."""
+        """Update lead status (a LeadStatus, its value or its name)."""
         try:
             update_data = {
-                'lead_status': status,
+                'lead_status': _lead_status_value(status),
                 'last_updated': datetime.now().isoformat()
-
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+            }
+            if notes is not None:
+                update_data['notes'] = notes
+            
+            # Build the SQL query based on the fields being updated
+            columns = self._ordered_columns('Lead', update_data)
+            query = self._update_sql('Lead', columns, 'lead_id')
+            values = [update_data[column] for column in columns]
+            values.append(lead_id)  # Add lead_id for the WHERE clause
+            self._execute_write(query, values, 'Lead', 'lead_id', lead_id)
+            
+            logger.debug("Lead status updated: %s -> %s", lead_id, status)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating lead status: {e}")
+            return False
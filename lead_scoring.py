@@ -3,10 +3,25 @@ Lead scoring module for the Solar Lead Generation System.
 Implements algorithms for evaluating and scoring potential solar leads.
 """
 
+import os
 import logging
+import types
 import numpy as np
+from bisect import bisect_right
+from collections import namedtuple
 from datetime import datetime
 
+try:
+    from numba import njit, prange, config as numba_config, get_num_threads, set_num_threads
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Batch scoring then uses the NumPy column expressions instead of the kernel
+    _NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -14,6 +29,286 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Category scores, looked up by name in the per-lead methods
+_ORIENT_SCORE_MAP = {
+    'S': 100,   # South is optimal
+    'SE': 90,   # Southeast is very good
+    'SW': 90,   # Southwest is very good
+    'E': 70,    # East is good
+    'W': 70,    # West is good
+    'NE': 40,   # Northeast is poor
+    'NW': 40,   # Northwest is poor
+    'N': 20     # North is very poor
+}
+_COND_SCORE_MAP = {
+    'excellent': 100,
+    'good': 80,
+    'fair': 60,
+    'poor': 30,
+    'very poor': 10
+}
+_PTYPE_SCORE_MAP = {
+    'Single-Family': 100,
+    'Multi-Family': 50   # Multi-family gets half points
+}
+
+# Integer encodings of the same categories for the batch scoring path.
+# Each score table has one extra slot after the known categories for an
+# unrecognized value, and a trailing 0 that code -1 (field absent) selects.
+_MISSING = -1
+
+
+def _encode_categories(score_map, unknown_score):
+    """Build the name -> code mapping and the code-indexed score table."""
+    codes = {name: code for code, name in enumerate(score_map)}
+    scores = np.array(list(score_map.values()) + [unknown_score, 0], dtype=np.float32)
+    return codes, scores
+
+
+_ORIENT_CODES, _ORIENT_SCORES = _encode_categories(_ORIENT_SCORE_MAP, 50)
+_COND_CODES, _COND_SCORES = _encode_categories(_COND_SCORE_MAP, 50)
+_PTYPE_CODES, _PTYPE_SCORES = _encode_categories(_PTYPE_SCORE_MAP, 0)
+
+_QUAL_LABELS = np.array(['unsuitable', 'poor', 'average', 'good', 'excellent'])
+_QUAL_NAMES = tuple(_QUAL_LABELS.tolist())
+
+# Quantiles reported by analyze_lead_distribution (10th, 25th, median, 75th, 90th)
+_DISTRIBUTION_QUANTILES = np.array([0.10, 0.25, 0.50, 0.75, 0.90])
+
+# Piecewise-linear score ramps as interpolation breakpoints; inputs below the
+# first breakpoint score 0 (bill, roof area), and shading is 0 beyond 40%
+_BILL_XP = np.array([120, 200, 300], dtype=np.float32)
+_BILL_FP = np.array([50, 80, 100], dtype=np.float32)
+_AREA_XP = np.array([400, 1200], dtype=np.float32)
+_AREA_FP = np.array([50, 100], dtype=np.float32)
+_SHADING_XP = np.array([0, 40], dtype=np.float32)
+_SHADING_FP = np.array([100, 0], dtype=np.float32)
+
+# Step scores: searchsorted(bins, x, side='right') indexes the score table
+_VALUE_BINS = np.array([100000, 200000, 300000, 500000], dtype=np.float32)
+_VALUE_SCORES = np.array([20, 40, 60, 80, 100], dtype=np.float32)
+_RATE_BINS = np.array([0.08, 0.10, 0.12, 0.14], dtype=np.float32)
+_RATE_SCORES = np.array([20, 40, 60, 80, 100], dtype=np.float32)
+_YEARS_BINS = np.array([1, 3, 5], dtype=np.float32)
+_YEARS_SCORES = np.array([40, 60, 80, 100], dtype=np.float32)
+
+# Disqualification reasons indexed by the codes the scoring paths emit
+_REASON_NONE, _REASON_OWNER, _REASON_SOLAR, _REASON_BILL, _REASON_AREA, _REASON_SHADING, _REASON_ROOF = range(7)
+_DISQUALIFICATION_REASONS = np.array([
+    None,
+    "Property is not owner-occupied",
+    "Property already has solar",
+    "Monthly bill below minimum threshold",
+    "Usable roof area below minimum",
+    "Roof shading above maximum",
+    "Roof unsuitable for solar installation"
+], dtype=object)
+
+# Roof limits that disqualify a lead before any component is scored
+_MIN_ROOF_AREA = 400
+_MAX_SHADING = 40
+
+
+# Numeric fields per record type; a present value that is not a real number
+# (None, NaN, text) makes the lead invalid for scoring
+_PROPERTY_NUMERIC_FIELDS = ('square_footage', 'property_value')
+_UTILITY_NUMERIC_FIELDS = ('estimated_monthly_bill', 'residential')
+_ROOF_NUMERIC_FIELDS = ('overall_score', 'usable_roof_area', 'shading_percentage')
+_OWNER_NUMERIC_FIELDS = ('ownership_years',)
+
+_INVALID_LEAD_ERROR = "Invalid lead data"
+
+
+def _numbers_valid(record, fields):
+    """Check that every listed field present in record holds a real, non-NaN number."""
+    if not record:
+        return True
+    for field in fields:
+        if field in record:
+            value = record[field]
+            if not isinstance(value, (int, float, np.number)) or value != value:
+                return False
+    return True
+
+
+def _monthly_bill(property_data, utility_data):
+    """Monthly bill from utility data, else the $0.10 per square foot estimate, else 0."""
+    if utility_data and 'estimated_monthly_bill' in utility_data:
+        return utility_data['estimated_monthly_bill']
+    if 'square_footage' in property_data:
+        return property_data['square_footage'] * 0.10
+    return 0
+
+
+def _float_column(records, key):
+    """Column of a numeric field, NaN where the record or field is absent."""
+    return np.array([r[key] if r and key in r else np.nan for r in records], dtype=np.float32)
+
+
+def _flag_column(records, key):
+    """Column of a boolean field as 1/0, or _MISSING where absent."""
+    return np.array([(1 if r[key] else 0) if r and key in r else _MISSING for r in records], dtype=np.int8)
+
+
+def _code_column(records, key, codes, lower=False):
+    """Column of a categorical field encoded through codes, or _MISSING where absent."""
+    unknown = len(codes)
+    if lower:
+        return np.array([codes.get(r[key].lower(), unknown) if r and key in r else _MISSING
+                         for r in records], dtype=np.int8)
+    return np.array([codes.get(r[key], unknown) if r and key in r else _MISSING
+                     for r in records], dtype=np.int8)
+
+
+@njit(cache=True)
+def _ramp(x, xp, fp):
+    """Piecewise-linear interpolation of a scalar, clamped at both ends like np.interp."""
+    if x <= xp[0]:
+        return fp[0]
+    for i in range(1, xp.shape[0]):
+        if x < xp[i]:
+            return fp[i - 1] + (x - xp[i - 1]) * (fp[i] - fp[i - 1]) / (xp[i] - xp[i - 1])
+    return fp[xp.shape[0] - 1]
+
+
+@njit(cache=True)
+def _step(x, bins, scores):
+    """Step score of a scalar: scores[number of bins <= x]."""
+    i = 0
+    while i < bins.shape[0] and x >= bins[i]:
+        i += 1
+    return scores[i]
+
+
+@njit(cache=True)
+def _score_kernel(monthly_bill, has_roof_data, roof_overall_score, orientation_code, usable_roof_area,
+                  shading_percentage, condition_code, is_owner_occupied, property_type_code,
+                  property_value, has_solar_permit, has_utility_data, net_metering_available, rate,
+                  has_owner_data, has_phone, has_email, do_not_call, ownership_years,
+                  orient_scores, cond_scores, ptype_scores, weights, min_roof_score):
+    """Score one lead that passed the quick disqualification checks; NaN or -1 marks an absent field."""
+    # Bill size
+    bill_score = 0.0 if monthly_bill < _BILL_XP[0] else _ramp(monthly_bill, _BILL_XP, _BILL_FP)
+    
+    # Roof suitability
+    if not has_roof_data:
+        roof_score = 50.0
+    elif not np.isnan(roof_overall_score):
+        roof_score = roof_overall_score
+    else:
+        roof_score = orient_scores[orientation_code] * 0.4
+        if not np.isnan(usable_roof_area) and usable_roof_area >= _AREA_XP[0]:
+            roof_score += _ramp(usable_roof_area, _AREA_XP, _AREA_FP) * 0.3
+        if not np.isnan(shading_percentage):
+            roof_score += _ramp(shading_percentage, _SHADING_XP, _SHADING_FP) * 0.2
+        roof_score += cond_scores[condition_code] * 0.1
+    
+    # Property characteristics
+    if is_owner_occupied == 0 or has_solar_permit == 1:
+        property_score = 0.0
+    else:
+        property_score = 100 * 0.4 if is_owner_occupied == 1 else 0.0
+        property_score += ptype_scores[property_type_code] * 0.3
+        if not np.isnan(property_value):
+            property_score += _step(property_value, _VALUE_BINS, _VALUE_SCORES) * 0.2
+        if has_solar_permit == 0:
+            property_score += 100 * 0.1
+    
+    # Net metering
+    if not has_utility_data:
+        metering_score = 50.0
+    else:
+        metering_score = 0.0
+        if net_metering_available == 1:
+            metering_score += 100 * 0.6
+        elif net_metering_available == 0:
+            metering_score += 30 * 0.6
+        if not np.isnan(rate):
+            metering_score += _step(rate, _RATE_BINS, _RATE_SCORES) * 0.4
+    
+    # Homeowner characteristics
+    if not has_owner_data:
+        homeowner_score = 50.0
+    else:
+        if has_phone and has_email:
+            contact_score = 100.0
+        elif has_phone:
+            contact_score = 70.0
+        elif has_email:
+            contact_score = 60.0
+        else:
+            contact_score = 0.0
+        homeowner_score = contact_score * 0.4
+        if do_not_call == 0:
+            homeowner_score += 100 * 0.3
+        if not np.isnan(ownership_years):
+            homeowner_score += _step(ownership_years, _YEARS_BINS, _YEARS_SCORES) * 0.3
+    
+    # Disqualification and weighted total
+    if roof_score < min_roof_score:
+        reason = _REASON_ROOF
+        overall_score = 0.0
+    else:
+        reason = _REASON_NONE
+        overall_score = (
+            bill_score * weights[0] +
+            roof_score * weights[1] +
+            property_score * weights[2] +
+            metering_score * weights[3] +
+            homeowner_score * weights[4]
+        )
+    
+    return bill_score, roof_score, property_score, metering_score, homeowner_score, overall_score, reason
+
+
+def _renamed(func, name):
+    """
+    Copy a function under another name.
+    
+    Numba keys its on-disk cache by qualified name and line rather than by
+    compile options, so giving the parallel build its own name keeps it from
+    sharing a cache entry with the serial one.
+    """
+    copy = types.FunctionType(func.__code__, func.__globals__, name, func.__defaults__, func.__closure__)
+    copy.__qualname__ = name
+    copy.__doc__ = func.__doc__
+    return copy
+
+
+def _score_rows(monthly_bill, has_roof_data, roof_overall_score, orientation_code, usable_roof_area,
+                shading_percentage, condition_code, is_owner_occupied, property_type_code,
+                property_value, has_solar_permit, has_utility_data, net_metering_available, rate,
+                has_owner_data, has_phone, has_email, do_not_call, ownership_years,
+                orient_scores, cond_scores, ptype_scores, weights, min_roof_score,
+                scores, reasons):
+    """Fill scores (n x 6: five components then overall) and reason codes for a batch."""
+    for i in prange(monthly_bill.shape[0]):
+        (scores[i, 0], scores[i, 1], scores[i, 2], scores[i, 3], scores[i, 4],
+         scores[i, 5], reasons[i]) = _score_kernel(
+            monthly_bill[i], has_roof_data[i], roof_overall_score[i], orientation_code[i],
+            usable_roof_area[i], shading_percentage[i], condition_code[i], is_owner_occupied[i],
+            property_type_code[i], property_value[i], has_solar_permit[i], has_utility_data[i],
+            net_metering_available[i], rate[i], has_owner_data[i], has_phone[i], has_email[i],
+            do_not_call[i], ownership_years[i],
+            orient_scores, cond_scores, ptype_scores, weights, min_roof_score
+        )
+
+
+# Rows are independent, so large batches split across threads; below
+# _PARALLEL_MIN_ROWS the thread fan-out costs more than it saves
+_PARALLEL_MIN_ROWS = 512
+_score_rows_serial = njit(cache=True)(_score_rows)
+_score_rows_parallel = njit(cache=True, parallel=True)(_renamed(_score_rows, '_score_rows_parallel'))
+
+
+# Flat lead score returned in place of the result dictionary when callers
+# ask for raw output
+LeadScore = namedtuple('LeadScore', [
+    'property_id', 'overall_score', 'qualification', 'disqualified', 'disqualification_reason',
+    'bill_score', 'roof_score', 'property_score', 'metering_score', 'homeowner_score'
+])
+
+
 class LeadScoringEngine:
     """Class to calculate lead scores based on multiple factors."""
     
@@ -49,8 +344,70 @@ class LeadScoringEngine:
             'monthly_bill': 120,  # Minimum monthly bill ($)
             'roof_score': 30      # Minimum roof suitability score
         })
+        
+        # Threads for scoring large batches with the compiled kernel
+        self.n_workers = self.config.get('n_workers', os.cpu_count() or 1)
+        
+        # Weights in component order and ascending thresholds, bound once so the
+        # per-lead paths skip the dict lookups (rebuild the engine after changing them)
+        self._w = (
+            self.weights['bill_size'],
+            self.weights['roof_suitability'],
+            self.weights['property_value'],
+            self.weights['net_metering'],
+            self.weights['homeowner']
+        )
+        self._weights_arr = np.array(self._w, dtype=np.float32)
+        self._thresh = np.array([
+            self.thresholds['poor'],
+            self.thresholds['average'],
+            self.thresholds['good'],
+            self.thresholds['excellent']
+        ], dtype=np.float32)
+        self._thresh_values = tuple(self._thresh.tolist())
     
-    def calculate_overall_score(self, property_data, utility_data=None, roof_data=None, owner_data=None):
+    def _qual(self, score):
+        """
+        Qualification category for a single overall score
+        
+        Uses the same right-sided binary search over the ascending thresholds as
+        the batch path; bisect on a tuple avoids the numpy call overhead per lead.
+        
+        Args:
+            score: Overall lead score
+            
+        Returns:
+            Qualification label
+        """
+        return _QUAL_NAMES[bisect_right(self._thresh_values, score)]
+    
+    def _quick_disqualify(self, property_data, utility_data=None, roof_data=None):
+        """
+        Check the hard requirements a lead must meet before it is scored.
+        
+        Args:
+            property_data: Dictionary with property information
+            utility_data: Optional dictionary with utility information
+            roof_data: Optional dictionary with roof information
+            
+        Returns:
+            Disqualification reason, or None if the lead meets every requirement
+        """
+        if 'is_owner_occupied' in property_data and not property_data['is_owner_occupied']:
+            return "Property is not owner-occupied"
+        if property_data.get('has_solar_permit'):
+            return "Property already has solar"
+        if _monthly_bill(property_data, utility_data) < self.min_requirements['monthly_bill']:
+            return "Monthly bill below minimum threshold"
+        if roof_data:
+            if 'usable_roof_area' in roof_data and roof_data['usable_roof_area'] < _MIN_ROOF_AREA:
+                return "Usable roof area below minimum"
+            if 'shading_percentage' in roof_data and roof_data['shading_percentage'] > _MAX_SHADING:
+                return "Roof shading above maximum"
+        return None
+    
+    def calculate_overall_score(self, property_data, utility_data=None, roof_data=None, owner_data=None,
+                                _timestamp=None, return_raw=False, detail='full'):
         """
         Calculate overall lead score based on all available data.
         
@@ -59,13 +416,23 @@ class LeadScoringEngine:
             utility_data: Optional dictionary with utility information
             roof_data: Optional dictionary with roof information
             owner_data: Optional dictionary with homeowner information
+            _timestamp: Optional ISO timestamp shared by a batch (defaults to now)
+            return_raw: Return a flat LeadScore tuple instead of the result dictionary
+            detail: 'full' for the complete result, 'summary' for the score,
+                qualification and disqualification only, or 'score_only' for an
+                (overall_score, qualification) tuple
             
         Returns:
-            Dictionary with overall score and component scores
+            Dictionary with overall score and component scores, a LeadScore
+            when return_raw is set, or the reduced result selected by detail
         """
         logger.info(f"Calculating lead score for property")
         
-        try:
+        # Hard requirements first; a lead that fails one is not scored further
+        disqualification_reason = self._quick_disqualify(property_data, utility_data, roof_data)
+        if disqualification_reason:
+            bill_score = roof_score = property_score = metering_score = homeowner_score = 0
+        else:
             # Calculate component scores
             bill_score = self.calculate_bill_score(property_data, utility_data)
             roof_score = self.calculate_roof_score(property_data, roof_data)
@@ -73,67 +440,399 @@ class LeadScoringEngine:
             metering_score = self.calculate_net_metering_score(property_data, utility_data)
             homeowner_score = self.calculate_homeowner_score(property_data, owner_data)
             
-            # Check if any component scores disqualify the lead
-            if bill_score < self.min_requirements['monthly_bill']:
-                disqualified = True
-                disqualification_reason = "Monthly bill below minimum threshold"
-            elif roof_score < self.min_requirements['roof_score']:
-                disqualified = True
+            # Check if the roof score disqualifies the lead
+            if roof_score < self.min_requirements['roof_score']:
                 disqualification_reason = "Roof unsuitable for solar installation"
-            else:
-                disqualified = False
-                disqualification_reason = None
-            
-            # Calculate weighted overall score
-            if disqualified:
-                overall_score = 0
-            else:
-                overall_score = (
-                    bill_score * self.weights['bill_size'] +
-                    roof_score * self.weights['roof_suitability'] +
-                    property_score * self.weights['property_value'] +
-                    metering_score * self.weights['net_metering'] +
-                    homeowner_score * self.weights['homeowner']
-                )
-            
-            # Determine qualification category
-            if overall_score >= self.thresholds['excellent']:
-                qualification = "excellent"
-            elif overall_score >= self.thresholds['good']:
-                qualification = "good"
-            elif overall_score >= self.thresholds['average']:
-                qualification = "average"
-            elif overall_score >= self.thresholds['poor']:
-                qualification = "poor"
-            else:
-                qualification = "unsuitable"
-            
-            # Return comprehensive result
-            return {
-                'property_id': property_data.get('property_id', 'unknown'),
-                'overall_score': round(overall_score),
+        
+        disqualified = disqualification_reason is not None
+        
+        # Calculate weighted overall score
+        if disqualified:
+            overall_score = 0
+        else:
+            w_bill, w_roof, w_property, w_metering, w_homeowner = self._w
+            overall_score = (
+                bill_score * w_bill +
+                roof_score * w_roof +
+                property_score * w_property +
+                metering_score * w_metering +
+                homeowner_score * w_homeowner
+            )
+        
+        # Determine qualification category
+        qualification = self._qual(overall_score)
+        
+        if return_raw:
+            return LeadScore(
+                property_data.get('property_id', 'unknown'), round(overall_score), qualification,
+                disqualified, disqualification_reason, round(bill_score), round(roof_score),
+                round(property_score), round(metering_score), round(homeowner_score)
+            )
+        
+        if detail == 'score_only':
+            return round(overall_score), qualification
+        
+        result = {
+            'property_id': property_data.get('property_id', 'unknown'),
+            'overall_score': round(overall_score),
+            'qualification': qualification,
+            'disqualified': disqualified,
+            'disqualification_reason': disqualification_reason
+        }
+        if detail == 'summary':
+            return result
+        
+        # Return comprehensive result
+        result['component_scores'] = {
+            'bill_score': round(bill_score),
+            'roof_score': round(roof_score),
+            'property_score': round(property_score),
+            'metering_score': round(metering_score),
+            'homeowner_score': round(homeowner_score)
+        }
+        result['weights'] = self.weights
+        result['timestamp'] = _timestamp or datetime.now().isoformat()
+        
+        return result
+    
+    def encode_batch(self, properties, utilities=None, roofs=None, owners=None):
+        """
+        Transpose per-lead dictionaries into columns for batch scoring.
+        
+        Args:
+            properties: List of property dictionaries
+            utilities: Optional parallel list of utility dictionaries (entries may be None)
+            roofs: Optional parallel list of roof dictionaries (entries may be None)
+            owners: Optional parallel list of homeowner dictionaries (entries may be None)
+        
+        Returns:
+            Dictionary of NumPy arrays, one element per lead; rows that fail
+            _validate_batch are flagged in 'valid' and encoded as empty records
+        """
+        n = len(properties)
+        utilities = utilities if utilities is not None else [None] * n
+        roofs = roofs if roofs is not None else [None] * n
+        owners = owners if owners is not None else [None] * n
+        
+        property_ids = np.array([p.get('property_id', 'unknown') if isinstance(p, dict) else 'unknown'
+                                 for p in properties], dtype=object)
+        
+        # Validate once up front so encoding and scoring never raise per lead
+        valid = self._validate_batch(properties, utilities, roofs, owners)
+        if not valid.all():
+            keep = valid.tolist()
+            properties = [p if ok else {} for p, ok in zip(properties, keep)]
+            utilities = [u if ok else None for u, ok in zip(utilities, keep)]
+            roofs = [r if ok else None for r, ok in zip(roofs, keep)]
+            owners = [o if ok else None for o, ok in zip(owners, keep)]
+        
+        # Monthly bill from utility data, else the square-footage estimate
+        monthly_bill = np.array([
+            u['estimated_monthly_bill'] if u and 'estimated_monthly_bill' in u
+            else p['square_footage'] * 0.10 if 'square_footage' in p
+            else 0
+            for p, u in zip(properties, utilities)
+        ], dtype=np.float32)
+        
+        return {
+            'property_id': property_ids,
+            'valid': valid,
+            'monthly_bill': monthly_bill,
+            # Roof
+            'has_roof_data': np.array([bool(r) for r in roofs]),
+            'roof_overall_score': _float_column(roofs, 'overall_score'),
+            'primary_orientation': _code_column(roofs, 'primary_orientation', _ORIENT_CODES),
+            'usable_roof_area': _float_column(roofs, 'usable_roof_area'),
+            'shading_percentage': _float_column(roofs, 'shading_percentage'),
+            'roof_condition': _code_column(roofs, 'roof_condition', _COND_CODES, lower=True),
+            # Property
+            'is_owner_occupied': _flag_column(properties, 'is_owner_occupied'),
+            'property_type': _code_column(properties, 'property_type', _PTYPE_CODES),
+            'property_value': _float_column(properties, 'property_value'),
+            'has_solar_permit': _flag_column(properties, 'has_solar_permit'),
+            # Utility
+            'has_utility_data': np.array([bool(u) for u in utilities]),
+            'net_metering_available': _flag_column(utilities, 'net_metering_available'),
+            'residential': _float_column(utilities, 'residential'),
+            # Homeowner
+            'has_owner_data': np.array([bool(o) for o in owners]),
+            'has_phone': np.array([bool(o and o.get('phone')) for o in owners]),
+            'has_email': np.array([bool(o and o.get('email')) for o in owners]),
+            'do_not_call': _flag_column(owners, 'do_not_call'),
+            'ownership_years': _float_column(owners, 'ownership_years')
+        }
+    
+    def _validate_batch(self, properties, utilities, roofs, owners):
+        """
+        Find the leads whose data the scoring rules can be applied to.
+        
+        Args:
+            properties: List of property dictionaries
+            utilities: Parallel list of utility dictionaries or None
+            roofs: Parallel list of roof dictionaries or None
+            owners: Parallel list of homeowner dictionaries or None
+        
+        Returns:
+            Boolean NumPy array, True for valid leads
+        """
+        return np.fromiter(
+            (
+                isinstance(p, dict) and
+                _numbers_valid(p, _PROPERTY_NUMERIC_FIELDS) and
+                _numbers_valid(u, _UTILITY_NUMERIC_FIELDS) and
+                _numbers_valid(r, _ROOF_NUMERIC_FIELDS) and
+                _numbers_valid(o, _OWNER_NUMERIC_FIELDS) and
+                (not r or isinstance(r.get('roof_condition', ''), str))
+                for p, u, r, o in zip(properties, utilities, roofs, owners)
+            ),
+            dtype=bool,
+            count=len(properties)
+        )
+    
+    def calculate_overall_score_batch(self, columns):
+        """
+        Calculate lead scores for a whole batch at once.
+        
+        Rows are scored by the compiled kernel when numba is installed and by
+        NumPy column expressions otherwise; both follow the same rules as the
+        per-lead calculate_*_score methods.
+        
+        Args:
+            columns: Dictionary of arrays as produced by encode_batch
+        
+        Returns:
+            Dictionary of NumPy arrays with overall scores, qualifications,
+            disqualification flags and rounded component scores
+        """
+        score_columns = self._score_columns_jit if _NUMBA_AVAILABLE else self._score_columns_numpy
+        
+        # Only leads that meet the hard requirements go through the scoring;
+        # the rest keep all-zero scores and their disqualification reason
+        reasons = self._quick_disqualify_batch(columns)
+        keep = reasons == _REASON_NONE
+        if keep.all():
+            scores, reasons = score_columns(columns)
+        else:
+            scores = np.zeros((len(keep), 6), dtype=np.float32)
+            if keep.any():
+                scores[keep], reasons[keep] = score_columns({key: column[keep] for key, column in columns.items()})
+        
+        rounded = np.rint(scores).astype(np.int32)
+        
+        # Qualification category from the ascending thresholds
+        qualification = _QUAL_LABELS[np.searchsorted(self._thresh, scores[:, 5], side='right')].astype(object)
+        
+        # Invalid rows were scored as empty records; report them as errors
+        valid = columns['valid']
+        if not valid.all():
+            rounded[~valid] = 0
+            reasons[~valid] = _REASON_NONE
+            qualification[~valid] = 'error'
+        
+        return {
+            'property_id': columns['property_id'],
+            'valid': valid,
+            'overall_score': rounded[:, 5],
+            'qualification': qualification,
+            'disqualified': reasons != _REASON_NONE,
+            'disqualification_reason': _DISQUALIFICATION_REASONS[reasons],
+            'bill_score': rounded[:, 0],
+            'roof_score': rounded[:, 1],
+            'property_score': rounded[:, 2],
+            'metering_score': rounded[:, 3],
+            'homeowner_score': rounded[:, 4]
+        }
+    
+    def _quick_disqualify_batch(self, columns):
+        """
+        Apply the _quick_disqualify checks to a whole batch.
+        
+        Args:
+            columns: Dictionary of arrays as produced by encode_batch
+        
+        Returns:
+            int8 array of disqualification reason codes, _REASON_NONE for leads to score
+        """
+        return np.select(
+            [
+                columns['is_owner_occupied'] == 0,
+                columns['has_solar_permit'] == 1,
+                columns['monthly_bill'] < self.min_requirements['monthly_bill'],
+                columns['usable_roof_area'] < _MIN_ROOF_AREA,
+                columns['shading_percentage'] > _MAX_SHADING
+            ],
+            [_REASON_OWNER, _REASON_SOLAR, _REASON_BILL, _REASON_AREA, _REASON_SHADING],
+            default=_REASON_NONE
+        ).astype(np.int8)
+    
+    def _score_columns_jit(self, columns):
+        """
+        Score encoded columns with the compiled per-row kernel.
+        
+        Args:
+            columns: Dictionary of arrays as produced by encode_batch
+        
+        Returns:
+            Tuple of (n x 6 score matrix, disqualification reason codes)
+        """
+        n = len(columns['monthly_bill'])
+        scores = np.empty((n, 6), dtype=np.float32)
+        reasons = np.empty(n, dtype=np.int8)
+        
+        args = (
+            columns['monthly_bill'], columns['has_roof_data'], columns['roof_overall_score'],
+            columns['primary_orientation'], columns['usable_roof_area'], columns['shading_percentage'],
+            columns['roof_condition'], columns['is_owner_occupied'], columns['property_type'],
+            columns['property_value'], columns['has_solar_permit'], columns['has_utility_data'],
+            columns['net_metering_available'], columns['residential'], columns['has_owner_data'],
+            columns['has_phone'], columns['has_email'], columns['do_not_call'], columns['ownership_years'],
+            _ORIENT_SCORES, _COND_SCORES, _PTYPE_SCORES, self._weights_arr,
+            float(self.min_requirements['roof_score']),
+            scores, reasons
+        )
+        
+        if n < _PARALLEL_MIN_ROWS or self.n_workers <= 1:
+            _score_rows_serial(*args)
+        else:
+            previous_threads = get_num_threads()
+            set_num_threads(min(self.n_workers, numba_config.NUMBA_NUM_THREADS))
+            try:
+                _score_rows_parallel(*args)
+            finally:
+                set_num_threads(previous_threads)
+        
+        return scores, reasons
+    
+    def _score_columns_numpy(self, columns):
+        """
+        Score encoded columns with NumPy array expressions.
+        
+        Args:
+            columns: Dictionary of arrays as produced by encode_batch
+        
+        Returns:
+            Tuple of (n x 6 score matrix, disqualification reason codes)
+        """
+        # Bill size
+        bill = columns['monthly_bill']
+        bill_score = np.where(bill < _BILL_XP[0], 0, np.interp(bill, _BILL_XP, _BILL_FP))
+        
+        # Roof suitability; absent fields contribute nothing
+        area = columns['usable_roof_area']
+        area_score = np.where(area < _AREA_XP[0], 0, np.interp(area, _AREA_XP, _AREA_FP))
+        shading = columns['shading_percentage']
+        shading_score = np.interp(shading, _SHADING_XP, _SHADING_FP)
+        calculated_roof_score = (
+            _ORIENT_SCORES[columns['primary_orientation']] * 0.4 +
+            np.where(np.isnan(area), 0, area_score) * 0.3 +
+            np.where(np.isnan(shading), 0, shading_score) * 0.2 +
+            _COND_SCORES[columns['roof_condition']] * 0.1
+        )
+        roof_overall = columns['roof_overall_score']
+        roof_score = np.where(
+            ~columns['has_roof_data'], 50,
+            np.where(np.isnan(roof_overall), calculated_roof_score, roof_overall)
+        )
+        
+        # Property characteristics
+        value = columns['property_value']
+        value_score = _VALUE_SCORES[np.searchsorted(_VALUE_BINS, value, side='right')]
+        owner_occupied = columns['is_owner_occupied']
+        solar_permit = columns['has_solar_permit']
+        property_score = (
+            (owner_occupied == 1) * (100 * 0.4) +
+            _PTYPE_SCORES[columns['property_type']] * 0.3 +
+            np.where(np.isnan(value), 0, value_score) * 0.2 +
+            (solar_permit == 0) * (100 * 0.1)
+        )
+        property_score = np.where((owner_occupied == 0) | (solar_permit == 1), 0, property_score)
+        
+        # Net metering
+        rate = columns['residential']
+        rate_score = _RATE_SCORES[np.searchsorted(_RATE_BINS, rate, side='right')]
+        net_metering = columns['net_metering_available']
+        metering_score = np.where(
+            columns['has_utility_data'],
+            (net_metering == 1) * (100 * 0.6) + (net_metering == 0) * (30 * 0.6) +
+            np.where(np.isnan(rate), 0, rate_score) * 0.4,
+            50
+        )
+        
+        # Homeowner characteristics
+        has_phone, has_email = columns['has_phone'], columns['has_email']
+        contact_score = np.select([has_phone & has_email, has_phone, has_email], [100, 70, 60], default=0)
+        years = columns['ownership_years']
+        ownership_score = _YEARS_SCORES[np.searchsorted(_YEARS_BINS, years, side='right')]
+        homeowner_score = np.where(
+            columns['has_owner_data'],
+            contact_score * 0.4 + (columns['do_not_call'] == 0) * (100 * 0.3) +
+            np.where(np.isnan(years), 0, ownership_score) * 0.3,
+            50
+        )
+        
+        # Roof score disqualification; the hard requirements were checked up front
+        disqualified = roof_score < self.min_requirements['roof_score']
+        reasons = np.where(disqualified, _REASON_ROOF, _REASON_NONE).astype(np.int8)
+        
+        # Component matrix, then the weighted total as one matrix-vector product
+        scores = np.empty((len(bill), 6), dtype=np.float32)
+        for column, component in enumerate((bill_score, roof_score, property_score, metering_score,
+                                            homeowner_score)):
+            scores[:, column] = component
+        scores[:, 5] = np.where(disqualified, 0, scores[:, :5] @ self._weights_arr)
+        
+        return scores, reasons
+    
+    def to_records(self, batch_scores, timestamp=None):
+        """
+        Expand batch scores into per-lead result dictionaries.
+        
+        Args:
+            batch_scores: Dictionary of arrays from calculate_overall_score_batch
+            timestamp: Optional ISO timestamp shared by the batch (defaults to now)
+        
+        Returns:
+            List of dictionaries in the format returned by calculate_overall_score
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        
+        return [
+            {
+                'property_id': property_id,
+                'overall_score': overall,
                 'qualification': qualification,
                 'disqualified': disqualified,
-                'disqualification_reason': disqualification_reason,
+                'disqualification_reason': reason,
                 'component_scores': {
-                    'bill_score': round(bill_score),
-                    'roof_score': round(roof_score),
-                    'property_score': round(property_score),
-                    'metering_score': round(metering_score),
-                    'homeowner_score': round(homeowner_score)
+                    'bill_score': bill,
+                    'roof_score': roof,
+                    'property_score': prop,
+                    'metering_score': metering,
+                    'homeowner_score': homeowner
                 },
                 'weights': self.weights,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            logger.error(f"Error calculating lead score: {e}")
-            return {
-                'property_id': property_data.get('property_id', 'unknown'),
+                'timestamp': timestamp
+            } if valid else {
+                'property_id': property_id,
                 'overall_score': 0,
                 'qualification': 'error',
-                'error': str(e)
+                'error': _INVALID_LEAD_ERROR
             }
+            for property_id, valid, overall, qualification, disqualified, reason, bill, roof, prop, metering, homeowner
+            in zip(
+                batch_scores['property_id'].tolist(),
+                batch_scores['valid'].tolist(),
+                batch_scores['overall_score'].tolist(),
+                batch_scores['qualification'].tolist(),
+                batch_scores['disqualified'].tolist(),
+                batch_scores['disqualification_reason'].tolist(),
+                batch_scores['bill_score'].tolist(),
+                batch_scores['roof_score'].tolist(),
+                batch_scores['property_score'].tolist(),
+                batch_scores['metering_score'].tolist(),
+                batch_scores['homeowner_score'].tolist()
+            )
+        ]
     
     def calculate_bill_score(self, property_data, utility_data=None):
         """
@@ -146,18 +845,8 @@ class LeadScoringEngine:
         Returns:
             Score from 0-100 for this component
         """
-        # Get estimated monthly bill
-        if utility_data and 'estimated_monthly_bill' in utility_data:
-            monthly_bill = utility_data['estimated_monthly_bill']
-        else:
-            # Estimate based on property characteristics if no utility data
-            # This is a simplified estimation; in practice, would use more sophisticated model
-            if 'square_footage' in property_data:
-                square_footage = property_data['square_footage']
-                # Simple estimation: $0.10 per square foot per month
-                monthly_bill = square_footage * 0.10
-            else:
-                monthly_bill = 0
+        # Get estimated monthly bill, estimated from square footage if no utility data
+        monthly_bill = _monthly_bill(property_data, utility_data)
         
         # Score based on bill size
         # $120 = 50 points (minimum qualifying)
@@ -197,17 +886,7 @@ class LeadScoringEngine:
         # Orientation factor (south-facing is best)
         if 'primary_orientation' in roof_data:
             orientation = roof_data['primary_orientation']
-            orientation_scores = {
-                'S': 100,   # South is optimal
-                'SE': 90,   # Southeast is very good
-                'SW': 90,   # Southwest is very good
-                'E': 70,    # East is good
-                'W': 70,    # West is good
-                'NE': 40,   # Northeast is poor
-                'NW': 40,   # Northwest is poor
-                'N': 20     # North is very poor
-            }
-            orientation_score = orientation_scores.get(orientation, 50)
+            orientation_score = _ORIENT_SCORE_MAP.get(orientation, 50)
             score += orientation_score * 0.4  # 40% weight for orientation
         
         # Usable area factor
@@ -233,14 +912,7 @@ class LeadScoringEngine:
         # Roof condition factor
         if 'roof_condition' in roof_data:
             condition = roof_data['roof_condition'].lower()
-            condition_scores = {
-                'excellent': 100,
-                'good': 80,
-                'fair': 60,
-                'poor': 30,
-                'very poor': 10
-            }
-            condition_score = condition_scores.get(condition, 50)
+            condition_score = _COND_SCORE_MAP.get(condition, 50)
             score += condition_score * 0.1  # 10% weight for condition
         
         return score
@@ -267,12 +939,7 @@ class LeadScoringEngine:
         # Property type factor
         if 'property_type' in property_data:
             property_type = property_data['property_type']
-            if property_type == 'Single-Family':
-                score += 100 * 0.3  # 30% weight for single-family
-            elif property_type == 'Multi-Family':
-                score += 50 * 0.3   # Multi-family gets half points
-            else:
-                score += 0 * 0.3     # Other types get no points
+            score += _PTYPE_SCORE_MAP.get(property_type, 0) * 0.3  # 30% weight, other types get no points
         
         # Property value factor
         if 'property_value' in property_data:
@@ -396,30 +1063,53 @@ class LeadScoringEngine:
         Analyze the distribution of lead scores.
         
         Args:
-            scores: List of lead scores
+            scores: List or array of lead scores
             
         Returns:
             Dictionary with distribution analysis
         """
-        if not scores:
+        if len(scores) == 0:
             return {
                 'count': 0,
                 'message': 'No scores to analyze'
             }
         
-        # Convert to numpy array for analysis
-        scores_array = np.array(scores)
-        
-        # Calculate statistics
-        count = len(scores)
-        mean = np.mean(scores_array)
-        median = np.median(scores_array)
-        std_dev = np.std(scores_array)
-        min_score = np.min(scores_array)
-        max_score = np.max(scores_array)
-        
-        # Calculate percentiles
-        percentiles = {
-            '10th': np.percentile(scores_array, 10),
-            '25th': np.percentile
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+        # One sort serves the extremes, the quantiles and the category counts;
+        # scores are bounded 0-100 so float32 holds them exactly
+        scores_array = np.sort(np.asarray(scores, dtype=np.float32))
+        count = scores_array.size
+        mean = scores_array.mean(dtype=np.float64)
+        std_dev = scores_array.std(dtype=np.float64)
+        
+        # Linearly interpolated quantiles, read straight off the sorted array
+        positions = (count - 1) * _DISTRIBUTION_QUANTILES
+        lower = positions.astype(int)
+        upper = np.minimum(lower + 1, count - 1)
+        tenth, twenty_fifth, median, seventy_fifth, ninetieth = (
+            scores_array[lower] + (positions - lower) * (scores_array[upper] - scores_array[lower])
+        )
+        
+        # Leads below each threshold, from its insertion point in the sorted scores
+        below_poor, below_average, below_good, below_excellent = np.searchsorted(scores_array, self._thresh)
+        
+        return {
+            'count': count,
+            'mean': float(mean),
+            'median': float(median),
+            'std_dev': float(std_dev),
+            'min': float(scores_array[0]),
+            'max': float(scores_array[-1]),
+            'percentiles': {
+                '10th': float(tenth),
+                '25th': float(twenty_fifth),
+                '75th': float(seventy_fifth),
+                '90th': float(ninetieth)
+            },
+            'categories': {
+                'excellent': int(count - below_excellent),
+                'good': int(below_excellent - below_good),
+                'average': int(below_good - below_average),
+                'poor': int(below_average - below_poor),
+                'unsuitable': int(below_poor)
+            }
+        }
@@ -4,11 +4,20 @@ Combines bill estimation, roof analysis, and lead scoring into a unified workflo
 """
 
 import logging
+from collections import namedtuple
 from datetime import datetime
+import functools
+import itertools
 import json
 import os
 
-from src.lead_scoring import LeadScoringEngine
+try:
+    import orjson
+except ImportError:
+    # Streamed results fall back to the standard library encoder
+    orjson = None
+
+from src.lead_scoring import LeadScoringEngine, LeadScore
 from src.bill_estimator import BillEstimator
 from src.roof_analyzer import RoofAnalyzer
 
@@ -19,6 +28,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# A lead as a tuple instead of a dictionary. The batch methods accept any
+# tuple in this field order wherever they take lead dictionaries, so large
+# batches can be built from plain tuples without a dictionary per lead
+LeadBundle = namedtuple('LeadBundle', 'property_data owner_data roof_data utility_data',
+                        defaults=(None, None, None))
+
+
+def _unpack_lead(lead):
+    """Property, utility, roof and owner data of a lead tuple or dictionary."""
+    if isinstance(lead, tuple):
+        property_data, owner_data, roof_data, utility_data = lead
+        return property_data, utility_data, roof_data, owner_data
+    return lead.get('property_data'), lead.get('utility_data'), lead.get('roof_data'), lead.get('owner_data')
+
+
+def _json_line(result):
+    """Encode one result as a compact JSON line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(result, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(config_file, mtime):
+    """
+    Parse a JSON configuration file, cached per path and modification time.
+    
+    The returned dictionary is shared between callers and must not be modified.
+    
+    Args:
+        config_file: Path to JSON configuration file
+        mtime: Modification time of the file, so an edited file is parsed again
+        
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(config_file, 'r') as f:
+        return json.load(f)
+
+
+def _config_mtime(config_file):
+    """Modification time of a configuration file, or None if it does not exist."""
+    try:
+        return os.path.getmtime(config_file) if config_file else None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _default_service(config_file, mtime):
+    """Build the shared service for a configuration file version."""
+    return LeadScoringService(config_file)
+
+
+def get_default_service(config_file=None):
+    """
+    Get a shared LeadScoringService, so per-request callers don't rebuild the engines.
+    
+    A new service is built when the configuration file changes on disk.
+    
+    Args:
+        config_file: Optional path to JSON configuration file
+        
+    Returns:
+        LeadScoringService instance
+    """
+    return _default_service(config_file, _config_mtime(config_file))
+
+
 class LeadScoringService:
     """Class to integrate and manage all lead scoring components."""
     
@@ -31,10 +109,10 @@ class LeadScoringService:
         """
         # Load configuration if provided
         self.config = {}
-        if config_file and os.path.exists(config_file):
+        mtime = _config_mtime(config_file)
+        if mtime is not None:
             try:
-                with open(config_file, 'r') as f:
-                    self.config = json.load(f)
+                self.config = _load_config(config_file, mtime)
                 logger.info(f"Loaded configuration from {config_file}")
             except Exception as e:
                 logger.error(f"Error loading configuration: {e}")
@@ -46,7 +124,8 @@ class LeadScoringService:
         
         logger.info("Lead scoring service initialized")
     
-    def score_lead(self, property_data, utility_data=None, roof_data=None, owner_data=None):
+    def score_lead(self, property_data, utility_data=None, roof_data=None, owner_data=None, _timestamp=None,
+                   return_raw=False):
         """
         Score a potential lead using all available data.
         
@@ -55,108 +134,352 @@ class LeadScoringService:
             utility_data: Optional dictionary with utility information
             roof_data: Optional dictionary with roof information
             owner_data: Optional dictionary with homeowner information
+            _timestamp: Optional ISO timestamp shared by a batch (defaults to now)
+            return_raw: Return only the engine's LeadScore tuple, skipping roof
+                analysis, bill factor analysis and the report
             
         Returns:
-            Dictionary with comprehensive lead scoring results
+            Dictionary with comprehensive lead scoring results, or a LeadScore
+            when return_raw is set
         """
         logger.info(f"Scoring lead for property: {property_data.get('address_line_1', 'Unknown')}")
         
         try:
-            # Step 1: Ensure we have utility data with bill estimate
-            if not utility_data:
-                utility_data = {}
-            
-            if 'estimated_monthly_bill' not in utility_data and property_data:
-                monthly_bill = self.bill_estimator.estimate_monthly_bill(property_data, utility_data)
-                utility_data['estimated_monthly_bill'] = monthly_bill
-                
-                # Also add annual profile
-                annual_profile = self.bill_estimator.estimate_annual_bill_profile(property_data, utility_data)
-                utility_data['annual_bill_profile'] = annual_profile
-            
-            # Step 2: Analyze roof if data is available
-            roof_analysis = None
-            if roof_data:
-                roof_analysis = self.roof_analyzer.analyze_roof_suitability(roof_data)
-                
-                # Add system size estimate if we have energy usage data
-                annual_usage = None
-                if utility_data and 'annual_bill_profile' in utility_data:
-                    annual_usage = utility_data['annual_bill_profile'].get('annual_total', 0) / utility_data.get('residential', 0.12)
-                
-                system_size_estimate = self.roof_analyzer.estimate_system_size(roof_data, annual_usage)
-                roof_analysis['system_size_estimate'] = system_size_estimate
+            # Steps 1-2: Bill estimate and roof analysis
+            utility_data = self._prepare_utility_data(property_data, utility_data)
+            if return_raw:
+                return self.lead_engine.calculate_overall_score(
+                    property_data, utility_data, roof_data, owner_data, return_raw=True
+                )
+            roof_analysis = self._analyze_roof(roof_data, utility_data, _timestamp)
             
             # Step 3: Calculate lead score
             lead_score = self.lead_engine.calculate_overall_score(
-                property_data, utility_data, roof_data, owner_data
+                property_data, utility_data, roof_data, owner_data, _timestamp=_timestamp
             )
             
-            # Step 4: Analyze bill factors if we have property data
-            bill_analysis = None
-            if property_data:
-                bill_analysis = self.bill_estimator.analyze_bill_factors(property_data, utility_data)
-            
-            # Step 5: Combine all results into comprehensive report
-            result = {
-                'lead_score': lead_score,
-                'roof_analysis': roof_analysis,
-                'bill_analysis': bill_analysis,
-                'timestamp': datetime.now().isoformat(),
-                'data_completeness': {
-                    'property_data': bool(property_data),
-                    'utility_data': bool(utility_data),
-                    'roof_data': bool(roof_data),
-                    'owner_data': bool(owner_data)
-                }
-            }
-            
-            # Add summary for quick reference
-            result['summary'] = self._generate_summary(result)
-            
-            return result
+            # Steps 4-5: Bill factors and the combined report
+            return self._build_result(lead_score, roof_analysis, property_data, utility_data, roof_data, owner_data,
+                                      timestamp=_timestamp)
             
         except Exception as e:
             logger.error(f"Error scoring lead: {e}")
+            if return_raw:
+                return LeadScore(property_data.get('property_id', 'unknown'), 0, 'error', False, None, 0, 0, 0, 0, 0)
             return {
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _timestamp or datetime.now().isoformat()
             }
     
-    def batch_score_leads(self, leads_data):
+    def batch_score_leads(self, leads_data, return_full=True):
         """
         Score multiple leads in batch.
         
         Args:
-            leads_data: List of dictionaries, each containing property_data and optionally
-                        utility_data, roof_data, and owner_data
+            leads_data: List of dictionaries (or LeadBundle-ordered tuples), each containing
+                        property_data and optionally utility_data, roof_data, and
+                        owner_data; or columns from encode_leads, which are scored
+                        directly and yield lead scores only
+            return_full: Build the per-lead result dictionaries; when False the
+                         batch scores are returned as NumPy arrays, which
+                         lead_engine.to_records can expand later if needed
             
         Returns:
-            List of scoring results and batch analysis
+            List of scoring results (or score arrays) and batch analysis
         """
-        logger.info(f"Batch scoring {len(leads_data)} leads")
-        
-        results = []
-        for lead in leads_data:
-            property_data = lead.get('property_data')
-            utility_data = lead.get('utility_data')
-            roof_data = lead.get('roof_data')
-            owner_data = lead.get('owner_data')
+        if not return_full:
+            # Scores only: skip roof analysis and every per-lead dictionary
+            columns = leads_data if isinstance(leads_data, dict) else self.encode_leads(leads_data)
+            logger.info(f"Batch scoring {len(columns['monthly_bill'])} leads")
+            batch_scores = self.lead_engine.calculate_overall_score_batch(columns)
             
-            if property_data:
-                result = self.score_lead(property_data, utility_data, roof_data, owner_data)
-                results.append(result)
+            return {
+                'scores': batch_scores,
+                'analysis': self.lead_engine.analyze_lead_distribution(batch_scores['overall_score'])
+            }
+        
+        # One timestamp for every result in the batch
+        timestamp = datetime.now().isoformat()
+        
+        if isinstance(leads_data, dict):
+            # Already encoded at ingest: no per-lead preparation or re-encoding
+            logger.info(f"Batch scoring {len(leads_data['monthly_bill'])} encoded leads")
+            batch_scores = self.lead_engine.calculate_overall_score_batch(leads_data)
+            lead_scores = self.lead_engine.to_records(batch_scores, timestamp)
+            results = [{'lead_score': lead_score, 'timestamp': timestamp} for lead_score in lead_scores]
+            overall_scores = batch_scores['overall_score']
+        else:
+            logger.info(f"Batch scoring {len(leads_data)} leads")
+            results, overall_scores = self._score_batch(leads_data, timestamp)
         
         # Analyze the distribution of scores
-        scores_analysis = self.lead_engine.analyze_lead_distribution(
-            [r['lead_score'] for r in results if 'lead_score' in r]
-        )
+        scores_analysis = self.lead_engine.analyze_lead_distribution(overall_scores)
         
         return {
             'results': results,
             'analysis': scores_analysis
         }
     
+    def encode_leads(self, leads_data):
+        """
+        Encode leads into scoring columns once, e.g. at import time.
+        
+        Bill estimates are filled in as for batch_score_leads, then every field
+        the score depends on is stored as a NumPy column (categories as int8
+        codes). The columns can be passed to batch_score_leads any number of
+        times without touching the per-lead dictionaries again.
+        
+        Args:
+            leads_data: List of dictionaries (or LeadBundle-ordered tuples), each containing
+                        property_data and optionally utility_data, roof_data, and owner_data
+            
+        Returns:
+            Dictionary of NumPy arrays, one element per encoded lead
+        """
+        properties, utilities, roofs, owners = [], [], [], []
+        estimates = {}
+        for lead in leads_data:
+            property_data, utility_data, roof_data, owner_data = _unpack_lead(lead)
+            if not property_data:
+                continue
+            
+            try:
+                utility_data = self._prepare_utility_data(property_data, utility_data, estimates)
+            except Exception as e:
+                logger.error(f"Error encoding lead: {e}")
+                continue
+            
+            properties.append(property_data)
+            utilities.append(utility_data)
+            roofs.append(roof_data)
+            owners.append(owner_data)
+        
+        logger.info(f"Encoded {len(properties)} leads for scoring")
+        return self.lead_engine.encode_batch(properties, utilities, roofs, owners)
+    
+    def batch_score_leads_stream(self, leads_iter, out_path, chunk_size=1000):
+        """
+        Score leads and stream the results to a JSON Lines file.
+        
+        Leads are scored in chunks through the same vectorized path as
+        batch_score_leads, and each result is written as one compact JSON
+        line, so memory use is bounded by the chunk size.
+        
+        Args:
+            leads_iter: Iterable of dictionaries (or LeadBundle-ordered tuples), each containing
+                        property_data and optionally utility_data, roof_data, and owner_data
+            out_path: Path to the output .jsonl file
+            chunk_size: Number of leads scored per vectorized batch
+            
+        Returns:
+            Dictionary with the output path, number of results written and score analysis
+        """
+        logger.info(f"Streaming lead scores to {out_path}")
+        
+        leads_iter = iter(leads_iter)
+        overall_scores = []
+        written = 0
+        
+        with open(out_path, 'wb') as f:
+            while True:
+                chunk = list(itertools.islice(leads_iter, chunk_size))
+                if not chunk:
+                    break
+                
+                results, chunk_scores = self._score_batch(chunk, datetime.now().isoformat())
+                f.writelines(_json_line(result) for result in results)
+                written += len(results)
+                overall_scores.extend(chunk_scores.tolist())
+        
+        logger.info(f"Wrote {written} lead scoring results to {out_path}")
+        
+        return {
+            'output_file': out_path,
+            'count': written,
+            'analysis': self.lead_engine.analyze_lead_distribution(overall_scores)
+        }
+    
+    def _score_batch(self, leads_data, timestamp):
+        """
+        Score a list of leads with one vectorized scoring call.
+        
+        Args:
+            leads_data: List of leads as accepted by batch_score_leads
+            timestamp: ISO timestamp shared by every result
+            
+        Returns:
+            Tuple of (per-lead results, array of overall scores of the scored leads)
+        """
+        # Bill estimates and roof analysis stay per lead, with the estimates
+        # shared by leads whose bill inputs match; a lead that fails here gets
+        # an error result and is left out of the scoring batch
+        slots = []
+        prepared = []
+        estimates = {}
+        for lead in leads_data:
+            property_data, utility_data, roof_data, owner_data = _unpack_lead(lead)
+            if not property_data:
+                continue
+            
+            try:
+                utility_data = self._prepare_utility_data(property_data, utility_data, estimates)
+                roof_analysis = self._analyze_roof(roof_data, utility_data, timestamp)
+            except Exception as e:
+                logger.error(f"Error scoring lead: {e}")
+                slots.append({'error': str(e), 'timestamp': timestamp})
+                continue
+            
+            slots.append(None)
+            prepared.append((property_data, utility_data, roof_data, owner_data, roof_analysis))
+        
+        properties, utilities, roofs, owners, roof_analyses = (
+            [list(column) for column in zip(*prepared)] if prepared else ([], [], [], [], [])
+        )
+        
+        # Score the whole batch in one vectorized pass; leads with unusable
+        # values come back as error records instead of raising
+        columns = self.lead_engine.encode_batch(properties, utilities, roofs, owners)
+        batch_scores = self.lead_engine.calculate_overall_score_batch(columns)
+        lead_scores = self.lead_engine.to_records(batch_scores, timestamp)
+        
+        scored = iter(zip(lead_scores, roof_analyses, properties, utilities, roofs, owners))
+        results = [
+            slot if slot is not None else self._build_result(*next(scored), timestamp=timestamp, estimates=estimates)
+            for slot in slots
+        ]
+        
+        return results, batch_scores['overall_score']
+    
+    def _prepare_utility_data(self, property_data, utility_data=None, estimates=None):
+        """
+        Ensure utility data carries a monthly bill estimate and annual profile.
+        
+        Args:
+            property_data: Dictionary with property information
+            utility_data: Optional dictionary with utility information (updated in place)
+            estimates: Optional per-batch cache shared with _build_result
+            
+        Returns:
+            Utility data dictionary with the bill estimate filled in
+        """
+        if not utility_data:
+            utility_data = {}
+        
+        if 'estimated_monthly_bill' not in utility_data and property_data:
+            monthly_bill, annual_profile = self._cached_estimate(
+                estimates, 'bill', property_data, utility_data,
+                lambda: (self.bill_estimator.estimate_monthly_bill(property_data, utility_data),
+                         self.bill_estimator.estimate_annual_bill_profile(property_data, utility_data))
+            )
+            utility_data['estimated_monthly_bill'] = monthly_bill
+            
+            # Also add annual profile
+            utility_data['annual_bill_profile'] = annual_profile
+        
+        return utility_data
+    
+    def _cached_estimate(self, estimates, stage, property_data, utility_data, estimate):
+        """
+        Run a bill estimator step once per distinct set of bill inputs.
+        
+        Results are shared, not copied, between the leads of a batch with the
+        same BillEstimator.bill_inputs_key.
+        
+        Args:
+            estimates: Per-batch cache dictionary, or None to always compute
+            stage: Name of the estimator step, part of the cache key
+            property_data: Dictionary with property information
+            utility_data: Utility data dictionary
+            estimate: Callable computing the step's result
+            
+        Returns:
+            Result of estimate for these inputs
+        """
+        if estimates is None:
+            return estimate()
+        
+        try:
+            key = (stage, self.bill_estimator.bill_inputs_key(property_data, utility_data))
+            cached = key in estimates
+        except Exception:
+            # Inputs that cannot be keyed go straight to the estimator, which reports them
+            return estimate()
+        
+        if not cached:
+            estimates[key] = estimate()
+        return estimates[key]
+    
+    def _analyze_roof(self, roof_data, utility_data, timestamp=None):
+        """
+        Analyze roof suitability and estimate system size.
+        
+        Args:
+            roof_data: Optional dictionary with roof information
+            utility_data: Utility data dictionary with bill estimates
+            timestamp: Optional ISO timestamp for the analysis (defaults to now)
+            
+        Returns:
+            Roof analysis dictionary, or None without roof data
+        """
+        if not roof_data:
+            return None
+        
+        roof_analysis = self.roof_analyzer.analyze_roof_suitability(roof_data, timestamp)
+        
+        # Add system size estimate if we have energy usage data
+        annual_usage = None
+        if utility_data and 'annual_bill_profile' in utility_data:
+            annual_usage = utility_data['annual_bill_profile'].get('annual_total', 0) / utility_data.get('residential', 0.12)
+        
+        system_size_estimate = self.roof_analyzer.estimate_system_size(roof_data, annual_usage)
+        roof_analysis['system_size_estimate'] = system_size_estimate
+        
+        return roof_analysis
+    
+    def _build_result(self, lead_score, roof_analysis, property_data, utility_data, roof_data, owner_data,
+                      timestamp=None, estimates=None):
+        """
+        Combine the scoring steps for one lead into the comprehensive report.
+        
+        Args:
+            lead_score: Lead score dictionary from the scoring engine
+            roof_analysis: Roof analysis dictionary or None
+            property_data: Dictionary with property information
+            utility_data: Utility data dictionary
+            roof_data: Optional dictionary with roof information
+            owner_data: Optional dictionary with homeowner information
+            timestamp: Optional ISO timestamp for the report (defaults to now)
+            estimates: Optional per-batch cache shared with _prepare_utility_data
+            
+        Returns:
+            Dictionary with comprehensive lead scoring results
+        """
+        # Analyze bill factors if we have property data
+        bill_analysis = None
+        if property_data:
+            bill_analysis = self._cached_estimate(
+                estimates, 'factors', property_data, utility_data,
+                lambda: self.bill_estimator.analyze_bill_factors(property_data, utility_data)
+            )
+        
+        result = {
+            'lead_score': lead_score,
+            'roof_analysis': roof_analysis,
+            'bill_analysis': bill_analysis,
+            'timestamp': timestamp or datetime.now().isoformat(),
+            'data_completeness': {
+                'property_data': bool(property_data),
+                'utility_data': bool(utility_data),
+                'roof_data': bool(roof_data),
+                'owner_data': bool(owner_data)
+            }
+        }
+        
+        # Add summary for quick reference
+        result['summary'] = self._generate_summary(result)
+        
+        return result
+    
     def _generate_summary(self, result):
         """
         Generate a summary of the lead scoring result.
@@ -197,20 +520,24 @@ class LeadScoringService:
         
         return summary
     
-    def save_result_to_file(self, result, filename):
+    def save_result_to_file(self, result, filename, compact=False):
         """
         Save lead scoring result to a JSON file.
         
         Args:
             result: Lead scoring result dictionary
             filename: Path to output file
+            compact: Write without indentation or spaces (smaller and faster for large results)
             
         Returns:
             Boolean indicating success
         """
         try:
             with open(filename, 'w') as f:
-                json.dump(result, f, indent=2)
+                if compact:
+                    json.dump(result, f, separators=(',', ':'))
+                else:
+                    json.dump(result, f, indent=2)
             logger.info(f"Saved lead scoring result to {filename}")
             return True
         except Exception as e:
@@ -103,7 +103,8 @@ def main():
     else:
         logger.info("No specific action requested. Use --help for options.")
     
-    # Close database connection
+    # Close the pipeline's worker threads and the database connection
+    pipeline.close()
     db.close()
 
 if __name__ == "__main__":
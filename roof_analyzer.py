@@ -3,11 +3,27 @@ Roof suitability analysis module for the Solar Lead Generation System.
 Implements algorithms for evaluating roof characteristics for solar installation.
 """
 
+import os
+import functools
 import logging
+import multiprocessing
+import types
 import numpy as np
+from collections import namedtuple
 from datetime import datetime
 import math
 
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Batch roof scoring then stays with the NumPy column expressions
+    _NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,9 +31,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Panel size, rating and yearly output used to size systems (Texas averages)
+_PANEL_AREA = 17.5               # sq ft per panel
+_PANEL_POWER = 0.3               # kW per panel
+_ANNUAL_PRODUCTION_PER_KW = 1400  # kWh per kW installed per year
+
+# Suitability categories, worst first; an analysis reports the position of
+# its category here as suitability_code
+SUITABILITY_LEVELS = ('unsuitable', 'poor', 'average', 'good', 'excellent')
+_SUITABILITY_CODES = {label: code for code, label in enumerate(SUITABILITY_LEVELS)}
+
+# Batch scoring: suitability labels by number of thresholds reached, and
+# condition scores by roof age bin (age <= 2, 5, 10, 15, 20, older), with a
+# trailing 50 that bin code -1 (age not recorded) selects
+_SUITABILITY_THRESHOLDS = np.array([35, 50, 65, 80])
+_SUITABILITY_LABELS = np.array(SUITABILITY_LEVELS, dtype=object)
+_AGE_BINS = np.array([2, 5, 10, 15, 20])
+_AGE_SCORES = np.array([100, 90, 75, 60, 40, 20, 50], dtype=float)
+
+# Numeric roof fields; analyze_roof_suitability reports an error for a
+# present value that is not a real number, and the batch path flags it
+_ROOF_NUMERIC_FIELDS = ('azimuth', 'usable_roof_area', 'total_roof_area', 'shading_percentage', 'pitch', 'roof_age')
+
+
+def _is_number(value):
+    """True for a real, non-NaN number."""
+    return isinstance(value, (int, float, np.number)) and value == value
+
+
+def _roof_column(roofs, key):
+    """Float column of a roof field, NaN where absent."""
+    return np.array([r[key] if key in r else np.nan for r in roofs], dtype=float)
+
+
+def _renamed(func, name):
+    """
+    Copy a function under another name.
+    
+    Numba names its on-disk cache after the function's qualified name and
+    line, not its compile options, so the serial and parallel builds of one
+    kernel need distinct names or each loads whichever build was cached first.
+    """
+    copy = types.FunctionType(func.__code__, func.__globals__, name, func.__defaults__, func.__closure__)
+    copy.__qualname__ = name
+    copy.__doc__ = func.__doc__
+    return copy
+
+
+def _score_roof_rows(azimuth, orientation_score, usable_area, shading_pct, pitch, condition_score,
+                     optimal_azimuth, min_area, max_shading, optimal_pitch, weights, component_scores, overall_score):
+    """Fill component scores (n x 5) and overall scores for encoded roofs; NaN marks an absent field."""
+    for i in prange(azimuth.shape[0]):
+        # Orientation: azimuth deviation from optimal, else the cardinal direction score
+        if np.isnan(azimuth[i]):
+            orientation = orientation_score[i]
+        else:
+            deviation = abs(azimuth[i] - optimal_azimuth)
+            if deviation > 180:
+                deviation = 360 - deviation
+            orientation = 100 - (deviation / 180) * 100
+        
+        # Usable area (no area data or too small scores 0)
+        area = usable_area[i]
+        if area >= 1200:
+            area_score = 100.0
+        elif area >= 800:
+            area_score = 80 + (area - 800) * 20 / 400
+        elif area >= min_area:
+            area_score = 50 + (area - min_area) * 30 / (800 - min_area)
+        else:
+            area_score = 0.0
+        
+        # Shading
+        if np.isnan(shading_pct[i]):
+            shading_score = 50.0
+        elif shading_pct[i] > max_shading:
+            shading_score = 0.0
+        else:
+            shading_score = 100 - (shading_pct[i] / max_shading) * 100
+        
+        # Pitch
+        if np.isnan(pitch[i]):
+            pitch_score = 50.0
+        else:
+            deviation = abs(pitch[i] - optimal_pitch)
+            pitch_score = 0.0 if deviation >= 30 else 100 - (deviation / 30) * 100
+        
+        component_scores[i, 0] = orientation
+        component_scores[i, 1] = area_score
+        component_scores[i, 2] = shading_score
+        component_scores[i, 3] = pitch_score
+        component_scores[i, 4] = condition_score[i]
+        
+        # Too little area or too much shade disqualifies the roof
+        if area_score == 0 or shading_score == 0:
+            overall_score[i] = 0.0
+        else:
+            overall_score[i] = (
+                orientation * weights[0] +
+                area_score * weights[1] +
+                shading_score * weights[2] +
+                pitch_score * weights[3] +
+                condition_score[i] * weights[4]
+            )
+
+
+# Large batches split across threads; small ones are not worth the fan-out
+_PARALLEL_MIN_ROWS = 512
+_score_roof_rows_serial = njit(cache=True)(_score_roof_rows)
+_score_roof_rows_parallel = njit(cache=True, parallel=True)(_renamed(_score_roof_rows, '_score_roof_rows_parallel'))
+
+# Roofs handed to a worker process per task, to amortize pickling overhead
+_POOL_CHUNKSIZE = 256
+
+# Columnar roof input for analyze_roofs_batch, one array per attribute, as
+# built by RoofAnalyzer.encode_roofs. Numeric fields are float arrays, NaN
+# where not recorded, with usable_area already estimated from the total area
+# where unmeasured. Orientation and condition are int8 category codes and
+# roof age an int8 _AGE_BINS index, each -1 when not recorded. Rows with
+# valid False score as errors.
+RoofBatch = namedtuple('RoofBatch', [
+    'azimuth', 'orientation_code', 'usable_area', 'shading_percentage', 'pitch',
+    'condition_code', 'age_code', 'valid'
+])
+
+
 class RoofAnalyzer:
     """Class to analyze roof characteristics for solar suitability."""
     
+    # Category scores by primary orientation and by roof condition
+    _ORIENT_SCORES = {
+        'S': 100,   # South is optimal
+        'SE': 90,   # Southeast is very good
+        'SW': 90,   # Southwest is very good
+        'E': 70,    # East is good
+        'W': 70,    # West is good
+        'NE': 40,   # Northeast is poor
+        'NW': 40,   # Northwest is poor
+        'N': 20     # North is very poor
+    }
+    _CONDITION_SCORES = {
+        'excellent': 100,
+        'good': 80,
+        'fair': 60,
+        'poor': 30,
+        'very poor': 10
+    }
+    
+    # Integer encodings of the same categories for RoofBatch. Each score table
+    # has a slot after the known categories for an unrecognized value and a
+    # trailing slot that code -1 (not recorded) selects; a missing condition
+    # is NaN so the batch scorer falls back to roof age.
+    _ORIENT_CODES = {name: code for code, name in enumerate(_ORIENT_SCORES)}
+    _ORIENT_TABLE = np.array(list(_ORIENT_SCORES.values()) + [50, 50], dtype=float)
+    _CONDITION_CODES = {name: code for code, name in enumerate(_CONDITION_SCORES)}
+    _CONDITION_TABLE = np.array(list(_CONDITION_SCORES.values()) + [50, np.nan], dtype=float)
+    
     def __init__(self, config=None):
         """
         Initialize with optional configuration parameters.
@@ -47,18 +216,29 @@ class RoofAnalyzer:
             'azimuth': 180,         # South-facing (180°) is optimal
             'pitch': 25,            # ~25° pitch is optimal for Texas
         })
+        
+        # Scoring constants read on every roof, resolved once; weights in
+        # orientation, area, shading, pitch, condition order
+        self._w = (self.weights['orientation'], self.weights['area'], self.weights['shading'],
+                   self.weights['pitch'], self.weights['condition'])
+        self._min_area = self.min_requirements['usable_area']
+        self._area_lo_span = 800 - self._min_area
+        self._max_shading = self.min_requirements['max_shading']
+        self._opt_az = self.optimal_values['azimuth']
+        self._opt_pitch = self.optimal_values['pitch']
     
-    def analyze_roof_suitability(self, roof_data):
+    def analyze_roof_suitability(self, roof_data, timestamp=None):
         """
         Analyze roof suitability for solar installation.
         
         Args:
             roof_data: Dictionary with roof information
+            timestamp: Optional ISO timestamp shared by a batch (defaults to now)
             
         Returns:
             Dictionary with suitability scores and analysis
         """
-        logger.info(f"Analyzing roof suitability")
+        logger.debug("Analyzing roof suitability")
         
         if not roof_data:
             return {
@@ -73,6 +253,13 @@ class RoofAnalyzer:
             shading_score = self.calculate_shading_score(roof_data)
             pitch_score = self.calculate_pitch_score(roof_data)
             condition_score = self.calculate_condition_score(roof_data)
+            component_scores = {
+                'orientation': orientation_score,
+                'area': area_score,
+                'shading': shading_score,
+                'pitch': pitch_score,
+                'condition': condition_score
+            }
             
             # Check if any component scores disqualify the roof
             if area_score == 0 or shading_score == 0:
@@ -81,12 +268,13 @@ class RoofAnalyzer:
                 message = "Roof does not meet minimum requirements for solar installation"
             else:
                 # Calculate weighted overall score
+                w_orientation, w_area, w_shading, w_pitch, w_condition = self._w
                 overall_score = (
-                    orientation_score * self.weights['orientation'] +
-                    area_score * self.weights['area'] +
-                    shading_score * self.weights['shading'] +
-                    pitch_score * self.weights['pitch'] +
-                    condition_score * self.weights['condition']
+                    orientation_score * w_orientation +
+                    area_score * w_area +
+                    shading_score * w_shading +
+                    pitch_score * w_pitch +
+                    condition_score * w_condition
                 )
                 
                 # Determine suitability category
@@ -110,17 +298,12 @@ class RoofAnalyzer:
             return {
                 'overall_score': round(overall_score),
                 'suitability': suitability,
+                'suitability_code': _SUITABILITY_CODES[suitability],
                 'message': message,
-                'component_scores': {
-                    'orientation': round(orientation_score),
-                    'area': round(area_score),
-                    'shading': round(shading_score),
-                    'pitch': round(pitch_score),
-                    'condition': round(condition_score)
-                },
+                'component_scores': {name: round(score) for name, score in component_scores.items()},
                 'weights': self.weights,
-                'recommendations': self.generate_recommendations(roof_data, overall_score),
-                'timestamp': datetime.now().isoformat()
+                'recommendations': self.generate_recommendations(roof_data, overall_score, component_scores),
+                'timestamp': timestamp or datetime.now().isoformat()
             }
             
         except Exception as e:
@@ -130,6 +313,204 @@ class RoofAnalyzer:
                 'error': str(e)
             }
     
+    def analyze_roofs(self, roof_list, workers=None):
+        """
+        Run analyze_roof_suitability over many roofs in a process pool.
+        
+        Each roof is analyzed independently, so the list is split across
+        worker processes in chunks. Lists too small to fill a chunk per
+        worker are analyzed in this process.
+        
+        Args:
+            roof_list: List of roof dictionaries
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of roof analyses in the same order as roof_list
+        """
+        # One timestamp for every analysis in the batch
+        analyze = functools.partial(self.analyze_roof_suitability, timestamp=datetime.now().isoformat())
+        
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(roof_list) < 2 * _POOL_CHUNKSIZE:
+            return [analyze(roof) for roof in roof_list]
+        
+        with multiprocessing.Pool(workers) as pool:
+            return list(pool.imap(analyze, roof_list, chunksize=_POOL_CHUNKSIZE))
+    
+    def analyze_roofs_batch(self, roofs):
+        """
+        Score many roofs at once with NumPy column operations.
+        
+        Applies the same rules as analyze_roof_suitability, without the
+        recommendations and report text.
+        
+        Args:
+            roofs: List of roof dictionaries, or a RoofBatch of columns
+            
+        Returns:
+            Dictionary of NumPy arrays: component_scores (n x 5, columns in
+            orientation, area, shading, pitch, condition order), overall_score,
+            suitability, suitability_code (index into SUITABILITY_LEVELS), and
+            valid (False for roofs with missing or malformed data, which score 0
+            with suitability 'error' and suitability_code -1)
+        """
+        batch = roofs if isinstance(roofs, RoofBatch) else self.encode_roofs(roofs)
+        valid = batch.valid
+        logger.info(f"Analyzing roof suitability for {len(valid)} roofs")
+        
+        # Category codes to scores; roof age stands in for a missing condition
+        age_score = _AGE_SCORES[batch.age_code]
+        condition_score = self._CONDITION_TABLE[batch.condition_code]
+        columns = {
+            'azimuth': batch.azimuth,
+            'orientation_score': self._ORIENT_TABLE[batch.orientation_code],
+            'usable_area': batch.usable_area,
+            'shading_percentage': batch.shading_percentage,
+            'pitch': batch.pitch,
+            'condition_score': np.where(np.isnan(condition_score), age_score, condition_score)
+        }
+        weights = np.array(self._w)
+        
+        if _NUMBA_AVAILABLE:
+            component_scores, overall_score = self._score_roofs_jit(columns, weights)
+        else:
+            component_scores, overall_score = self._score_roofs_numpy(columns, weights)
+        
+        suitability_code = np.searchsorted(_SUITABILITY_THRESHOLDS, overall_score, side='right')
+        suitability = _SUITABILITY_LABELS[suitability_code]
+        if not valid.all():
+            overall_score[~valid] = 0
+            component_scores[~valid] = 0
+            suitability[~valid] = 'error'
+            suitability_code[~valid] = -1
+        
+        return {
+            'component_scores': component_scores,
+            'overall_score': overall_score,
+            'suitability': suitability,
+            'suitability_code': suitability_code,
+            'valid': valid
+        }
+    
+    def encode_roofs(self, roofs):
+        """
+        Transpose roof dictionaries into a RoofBatch of columns.
+        
+        Args:
+            roofs: List of roof dictionaries
+            
+        Returns:
+            RoofBatch; roofs with missing or malformed data are flagged in
+            valid and encoded as empty records
+        """
+        valid = np.fromiter(
+            (
+                bool(r) and isinstance(r, dict) and
+                all(_is_number(r[field]) for field in _ROOF_NUMERIC_FIELDS if field in r) and
+                isinstance(r.get('roof_condition', ''), str)
+                for r in roofs
+            ),
+            dtype=bool,
+            count=len(roofs)
+        )
+        roofs = [r if ok else {} for r, ok in zip(roofs, valid.tolist())]
+        
+        # Usable area, estimated as 60% of the total area if not measured
+        usable_area = _roof_column(roofs, 'usable_roof_area')
+        usable_area = np.where(np.isnan(usable_area), _roof_column(roofs, 'total_roof_area') * 0.6, usable_area)
+        
+        # Only the bin matters for scoring, so the age is stored as its bin
+        roof_age = _roof_column(roofs, 'roof_age')
+        
+        orient_codes, orient_unknown = self._ORIENT_CODES, len(self._ORIENT_CODES)
+        condition_codes, condition_unknown = self._CONDITION_CODES, len(self._CONDITION_CODES)
+        return RoofBatch(
+            azimuth=_roof_column(roofs, 'azimuth'),
+            orientation_code=np.array([
+                orient_codes.get(r['primary_orientation'], orient_unknown) if 'primary_orientation' in r else -1
+                for r in roofs
+            ], dtype=np.int8),
+            usable_area=usable_area,
+            shading_percentage=_roof_column(roofs, 'shading_percentage'),
+            pitch=_roof_column(roofs, 'pitch'),
+            condition_code=np.array([
+                condition_codes.get(r['roof_condition'].lower(), condition_unknown) if 'roof_condition' in r else -1
+                for r in roofs
+            ], dtype=np.int8),
+            age_code=np.where(np.isnan(roof_age), -1, np.searchsorted(_AGE_BINS, roof_age)).astype(np.int8),
+            valid=valid
+        )
+    
+    def _score_roofs_jit(self, columns, weights):
+        """
+        Score encoded roofs with the compiled per-row kernel.
+        
+        Args:
+            columns: Dictionary of score-ready arrays built by analyze_roofs_batch
+            weights: Component weights in column order
+            
+        Returns:
+            Tuple of (n x 5 component scores, overall scores)
+        """
+        n = len(columns['azimuth'])
+        component_scores = np.empty((n, 5))
+        overall_score = np.empty(n)
+        
+        kernel = _score_roof_rows_parallel if n >= _PARALLEL_MIN_ROWS else _score_roof_rows_serial
+        kernel(
+            columns['azimuth'], columns['orientation_score'], columns['usable_area'],
+            columns['shading_percentage'], columns['pitch'], columns['condition_score'],
+            float(self._opt_az), float(self._min_area), float(self._max_shading), float(self._opt_pitch),
+            weights, component_scores, overall_score
+        )
+        
+        return component_scores, overall_score
+    
+    def _score_roofs_numpy(self, columns, weights):
+        """
+        Score encoded roofs with NumPy array expressions.
+        
+        Args:
+            columns: Dictionary of score-ready arrays built by analyze_roofs_batch
+            weights: Component weights in column order
+            
+        Returns:
+            Tuple of (n x 5 component scores, overall scores)
+        """
+        # Orientation: azimuth deviation from optimal (folded into 0-180), else the cardinal direction score
+        deviation = np.abs(columns['azimuth'] - self._opt_az)
+        deviation = np.where(deviation > 180, 360 - deviation, deviation)
+        azimuth_score = 100 - (deviation / 180) * 100
+        orientation_score = np.where(np.isnan(azimuth_score), columns['orientation_score'], azimuth_score)
+        
+        # Usable area: linear 50-80 up to 800 sq ft, 80-100 up to 1200, capped
+        # above; no area data or too small scores 0
+        usable_area = columns['usable_area']
+        min_area = self._min_area
+        area_score = np.where(usable_area >= min_area, np.interp(usable_area, [min_area, 800, 1200], [50, 80, 100]), 0)
+        
+        # Shading
+        shading_pct = columns['shading_percentage']
+        max_shading = self._max_shading
+        shading_score = np.where(shading_pct > max_shading, 0, 100 - (shading_pct / max_shading) * 100)
+        shading_score = np.where(np.isnan(shading_pct), 50, shading_score)
+        
+        # Pitch
+        pitch = columns['pitch']
+        pitch_score = np.clip(100 - np.abs(pitch - self._opt_pitch) / 30 * 100, 0, 100)
+        pitch_score = np.where(np.isnan(pitch), 50, pitch_score)
+        
+        component_scores = np.column_stack([
+            orientation_score, area_score, shading_score, pitch_score, columns['condition_score']
+        ])
+        
+        # Too little area or too much shade disqualifies the roof
+        disqualified = (area_score == 0) | (shading_score == 0)
+        overall_score = np.where(disqualified, 0, component_scores @ weights)
+        
+        return component_scores, overall_score
+    
     def calculate_orientation_score(self, roof_data):
         """
         Calculate score component based on roof orientation.
@@ -145,8 +526,7 @@ class RoofAnalyzer:
             azimuth = roof_data['azimuth']
             
             # Calculate deviation from optimal (180° is south-facing)
-            optimal_azimuth = self.optimal_values['azimuth']
-            deviation = abs(azimuth - optimal_azimuth)
+            deviation = abs(azimuth - self._opt_az)
             
             # Normalize deviation to 0-180 range (180° is worst case)
             if deviation > 180:
@@ -162,19 +542,7 @@ class RoofAnalyzer:
             
         elif 'primary_orientation' in roof_data:
             # Score based on cardinal direction
-            orientation = roof_data['primary_orientation']
-            orientation_scores = {
-                'S': 100,   # South is optimal
-                'SE': 90,   # Southeast is very good
-                'SW': 90,   # Southwest is very good
-                'E': 70,    # East is good
-                'W': 70,    # West is good
-                'NE': 40,   # Northeast is poor
-                'NW': 40,   # Northwest is poor
-                'N': 20     # North is very poor
-            }
-            
-            return orientation_scores.get(orientation, 50)
+            return self._ORIENT_SCORES.get(roof_data['primary_orientation'], 50)
         
         else:
             # No orientation data
@@ -193,7 +561,7 @@ class RoofAnalyzer:
         # Check if we have usable area
         if 'usable_roof_area' in roof_data:
             usable_area = roof_data['usable_roof_area']
-            min_area = self.min_requirements['usable_area']
+            min_area = self._min_area
             
             # Check minimum requirement
             if usable_area < min_area:
@@ -209,7 +577,7 @@ class RoofAnalyzer:
             elif usable_area >= 800:
                 return 80 + (usable_area - 800) * 20 / 400
             else:
-                return 50 + (usable_area - min_area) * 30 / (800 - min_area)
+                return 50 + (usable_area - min_area) * 30 / self._area_lo_span
         
         elif 'total_roof_area' in roof_data:
             # Estimate usable area as 60% of total area
@@ -217,7 +585,7 @@ class RoofAnalyzer:
             estimated_usable = total_area * 0.6
             
             # Use the same scoring logic
-            min_area = self.min_requirements['usable_area']
+            min_area = self._min_area
             
             if estimated_usable < min_area:
                 return 0
@@ -226,7 +594,7 @@ class RoofAnalyzer:
             elif estimated_usable >= 800:
                 return 80 + (estimated_usable - 800) * 20 / 400
             else:
-                return 50 + (estimated_usable - min_area) * 30 / (800 - min_area)
+                return 50 + (estimated_usable - min_area) * 30 / self._area_lo_span
         
         else:
             # No area data
@@ -245,7 +613,7 @@ class RoofAnalyzer:
         # Check if we have shading data
         if 'shading_percentage' in roof_data:
             shading_pct = roof_data['shading_percentage']
-            max_shading = self.min_requirements['max_shading']
+            max_shading = self._max_shading
             
             # Check maximum requirement
             if shading_pct > max_shading:
@@ -275,10 +643,9 @@ class RoofAnalyzer:
         # Check if we have pitch data
         if 'pitch' in roof_data:
             pitch = roof_data['pitch']
-            optimal_pitch = self.optimal_values['pitch']
             
             # Calculate deviation from optimal
-            deviation = abs(pitch - optimal_pitch)
+            deviation = abs(pitch - self._opt_pitch)
             
             # Score decreases with deviation
             # 0° deviation = 100 points
@@ -306,18 +673,8 @@ class RoofAnalyzer:
         """
         # Check if we have condition data
         if 'roof_condition' in roof_data:
-            condition = roof_data['roof_condition'].lower()
-            
             # Score based on condition
-            condition_scores = {
-                'excellent': 100,
-                'good': 80,
-                'fair': 60,
-                'poor': 30,
-                'very poor': 10
-            }
-            
-            return condition_scores.get(condition, 50)
+            return self._CONDITION_SCORES.get(roof_data['roof_condition'].lower(), 50)
         
         # Check if we have age data as a proxy for condition
         elif 'roof_age' in roof_data:
@@ -341,13 +698,15 @@ class RoofAnalyzer:
             # No condition data
             return 50  # Neutral score
     
-    def generate_recommendations(self, roof_data, overall_score):
+    def generate_recommendations(self, roof_data, overall_score, component_scores=None):
         """
         Generate recommendations based on roof analysis.
         
         Args:
             roof_data: Dictionary with roof information
             overall_score: Overall suitability score
+            component_scores: Optional unrounded component scores already computed
+                for this roof, by component name; missing ones are calculated
             
         Returns:
             List of recommendation strings
@@ -361,7 +720,10 @@ class RoofAnalyzer:
         
         # Orientation recommendations
         if 'azimuth' in roof_data or 'primary_orientation' in roof_data:
-            orientation_score = self.calculate_orientation_score(roof_data)
+            if component_scores and 'orientation' in component_scores:
+                orientation_score = component_scores['orientation']
+            else:
+                orientation_score = self.calculate_orientation_score(roof_data)
             
             if orientation_score < 50:
                 recommendations.append("Roof orientation is not ideal. Consider panel tilt optimization to improve energy production.")
@@ -411,5 +773,66 @@ class RoofAnalyzer:
             if pitch < 10:
                 recommendations.append(f"Low roof pitch ({pitch}°) may lead to debris accumulation and reduced self-cleaning. Consider more frequent maintenance.")
             elif pitch > 40:
-                recommendations.append(f"Steep roof pitch (
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+                recommendations.append(f"Steep roof pitch ({pitch}°) increases installation complexity and cost. Specialized mounting equipment may be required.")
+        
+        # Condition recommendations
+        if 'roof_condition' in roof_data:
+            condition = roof_data['roof_condition'].lower()
+            
+            if condition in ['poor', 'very poor']:
+                recommendations.append("Roof condition is poor. Consider replacing the roof before installation to avoid removing and reinstalling the panels later.")
+            elif condition == 'fair':
+                recommendations.append("Roof condition is fair. Have the roof inspected before installation, as it may need replacement during the system's lifetime.")
+        
+        elif 'roof_age' in roof_data:
+            age = roof_data['roof_age']
+            
+            if age > 15:
+                recommendations.append(f"Roof is {age} years old. Consider replacing the roof before installation, since panels typically last 25+ years.")
+        
+        return recommendations
+    
+    def estimate_system_size(self, roof_data, annual_usage=None):
+        """
+        Estimate the solar system size for a roof.
+        
+        The roof's usable area sets the largest system that fits; with a known
+        annual usage the recommendation is capped at what covers that usage.
+        
+        Args:
+            roof_data: Dictionary with roof information
+            annual_usage: Optional annual electricity usage (kWh)
+            
+        Returns:
+            Dictionary with system size and production estimates
+        """
+        # Usable area, estimated as 60% of the total area if not measured
+        if 'usable_roof_area' in roof_data:
+            usable_area = roof_data['usable_roof_area']
+        elif 'total_roof_area' in roof_data:
+            usable_area = roof_data['total_roof_area'] * 0.6
+        else:
+            usable_area = 0
+        
+        # Typical solar panel is about 17.5 sq ft and produces about 300W
+        max_panels = int(usable_area / _PANEL_AREA)
+        
+        # Annual production per kW installed, reduced by shading
+        shading_pct = roof_data.get('shading_percentage', 0)
+        production_per_kw = _ANNUAL_PRODUCTION_PER_KW * (1 - shading_pct / 100)
+        
+        # Size to the household's usage when known, within what the roof can hold
+        num_panels = max_panels
+        if annual_usage and production_per_kw > 0:
+            num_panels = min(max_panels, math.ceil(annual_usage / (production_per_kw * _PANEL_POWER)))
+        
+        recommended_system_size = num_panels * _PANEL_POWER
+        estimated_annual_production = recommended_system_size * production_per_kw
+        
+        return {
+            'max_system_size': round(max_panels * _PANEL_POWER, 1),
+            'recommended_system_size': round(recommended_system_size, 1),
+            'num_panels': num_panels,
+            'estimated_annual_production': round(estimated_annual_production),
+            'usage_offset': round(estimated_annual_production / annual_usage * 100) if annual_usage else None
+        }
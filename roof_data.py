@@ -7,43 +7,261 @@ import requests
 import json
 import os
 import logging
-import random
+import sqlite3
+import threading
+import time
+import numpy as np
+from bisect import bisect_right
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Batch solar estimates then use NumPy array expressions
+    _NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Handlers and levels are left to the application entry point
 logger = logging.getLogger(__name__)
 
+# (connect, read) seconds for Solar API requests
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Square feet per square meter
+_M2_TO_FT2 = 10.7639104167
+
+# Seconds a cached Solar API result stays valid; building insights only
+# change when the imagery is refreshed
+_CACHE_TTL = 180 * 24 * 3600
+
+# Mock roof orientations with their frequencies (south is most common) and
+# the azimuth each faces (180° is south)
+_MOCK_ORIENTATIONS = np.array(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'])
+_MOCK_ORIENTATION_WEIGHTS = np.array([0.05, 0.1, 0.1, 0.15, 0.3, 0.15, 0.1, 0.05])
+_MOCK_ORIENTATION_LIST = _MOCK_ORIENTATIONS.tolist()
+
+# Cumulative weights, so sampling an orientation is a single sorted search
+_MOCK_ORIENTATION_CUM = np.cumsum(_MOCK_ORIENTATION_WEIGHTS)
+_MOCK_ORIENTATION_CUM_LIST = _MOCK_ORIENTATION_CUM.tolist()
+_MOCK_AZIMUTHS = np.array([0, 45, 90, 135, 180, 225, 270, 315], dtype=float)
+_MOCK_ROOF_TYPES = np.array(['asphalt shingle', 'metal', 'tile', 'flat'])
+_MOCK_ROOF_CONDITIONS = np.array(['excellent', 'good', 'fair', 'poor'])
+_MOCK_ROOF_TYPE_LIST = _MOCK_ROOF_TYPES.tolist()
+_MOCK_ROOF_CONDITION_LIST = _MOCK_ROOF_CONDITIONS.tolist()
+
+# Cardinal direction for each 45° sector of azimuth, starting at north
+_CARDINALS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+
+# The same labels as an array, with 'Unknown' after the eight sectors
+_CARDINAL_LABELS = np.array(_CARDINALS + ('Unknown',))
+
+# Production factor by primary roof orientation
+_ORIENTATION_FACTORS = {
+    'S': 1.0,
+    'SE': 0.95,
+    'SW': 0.95,
+    'E': 0.85,
+    'W': 0.85,
+    'NE': 0.75,
+    'NW': 0.75,
+    'N': 0.65,
+    'Unknown': 0.9
+}
+
+# The same factors indexed by integer orientation code for batch estimates;
+# unrecognized orientations take the 'Unknown' code
+_ORIENTATION_CODES = {name: code for code, name in enumerate(_ORIENTATION_FACTORS)}
+_ORIENTATION_FACTOR_TABLE = np.array(list(_ORIENTATION_FACTORS.values()))
+_UNKNOWN_ORIENTATION = _ORIENTATION_CODES['Unknown']
+
+# System sizing for Texas: panel footprint (sq ft) and rating (kW), daily
+# irradiance (kWh/m²/day) and the share of output left after system losses
+_PANEL_AREA = 17.5
+_PANEL_POWER = 0.3
+_SOLAR_IRRADIANCE = 5.0
+_SYSTEM_EFFICIENCY = 0.75
+
+
+@njit(cache=True)
+def _solar_rows(usable_area, orientation_code, pitch, factor_table, system_size, annual_production, num_panels):
+    """Fill system size, annual production and panel count for each roof."""
+    for i in range(usable_area.shape[0]):
+        # Pitch is best around 20-30 degrees for Texas
+        pitch_factor = 1.0
+        if pitch[i] < 10:
+            pitch_factor = 0.9
+        elif pitch[i] > 40:
+            pitch_factor = 0.95
+        
+        panels = int(usable_area[i] / _PANEL_AREA)
+        size = panels * _PANEL_POWER
+        num_panels[i] = panels
+        system_size[i] = size
+        annual_production[i] = (size * _SOLAR_IRRADIANCE * 365 * factor_table[orientation_code[i]] *
+                                pitch_factor * _SYSTEM_EFFICIENCY)
+
+
+@njit(parallel=True, cache=True)
+def _financials(system_size, annual_production, rate, cost_per_watt, annual_savings, system_cost, payback_period):
+    """Fill annual savings, installed cost and payback years for each roof."""
+    for i in prange(system_size.shape[0]):
+        savings = annual_production[i] * rate
+        cost = system_size[i] * 1000 * cost_per_watt
+        annual_savings[i] = savings
+        system_cost[i] = cost
+        payback_period[i] = cost / savings if savings > 0 else 0.0
+
+
+def _primary_orientation_batch(azimuth_array):
+    """
+    Cardinal direction for many azimuths at once.
+    
+    Matches _get_primary_orientation's nearest-45° rounding; masking the
+    sector index with & 7 wraps negative and over-360 azimuths without a
+    modulo.
+    
+    Args:
+        azimuth_array: NumPy array of azimuths in degrees, NaN where unknown
+        
+    Returns:
+        NumPy array of orientation strings
+    """
+    unknown = np.isnan(azimuth_array)
+    idx = np.floor(np.where(unknown, 0.0, azimuth_array) * (1.0 / 45.0) + 0.5).astype(np.int64) & 7
+    idx[unknown] = len(_CARDINALS)
+    return _CARDINAL_LABELS[idx]
+
+
 class RoofDataCollector:
     """Class to collect roof data and solar potential information."""
     
-    def __init__(self, api_keys=None):
-        """Initialize with API keys for different services."""
+    def __init__(self, api_keys=None, cache_path=None, cache_ttl=_CACHE_TTL):
+        """
+        Initialize with API keys for different services.
+        
+        Args:
+            api_keys: Dictionary of API keys by service
+            cache_path: Optional SQLite file that keeps Solar API results across runs
+            cache_ttl: Seconds before a cached result is fetched again
+        """
         self.api_keys = api_keys or {}
         
-    def fetch_roof_data(self, latitude, longitude, address=None):
+        # Mock roofs take all their draws from one generator call
+        self._rng = np.random.default_rng()
+        
+        # Keep-alive pool so repeated Solar API lookups skip the TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Solar API results by location rounded to about 10 m
+        self._cache_ttl = cache_ttl
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        if cache_path:
+            self._open_cache(cache_path)
+    
+    def close(self):
+        """Close the pooled HTTP connections and the Solar API cache."""
+        self._session.close()
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _open_cache(self, cache_path):
+        """
+        Open the on-disk Solar API cache.
+        
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        try:
+            self._cache_db = sqlite3.connect(cache_path, check_same_thread=False, isolation_level=None)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS solar_cache (key TEXT PRIMARY KEY, value TEXT, fetched_at REAL)"
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error opening Solar API cache {cache_path}: {e}")
+            self._cache_db = None
+    
+    def _cache_get(self, key):
+        """Cached roof data for key if it is younger than the TTL; None otherwise."""
+        if self._cache_db is None:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT value FROM solar_cache WHERE key = ? AND fetched_at >= ?",
+                    (key, time.time() - self._cache_ttl)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading Solar API cache: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _cache_put(self, key, value):
+        """Store roof data on disk with its fetch time."""
+        if self._cache_db is None:
+            return
+        try:
+            with self._cache_lock:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO solar_cache (key, value, fetched_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error writing Solar API cache: {e}")
+    
+    def fetch_roof_data(self, latitude, longitude, address=None, force_refresh=False):
         """
         Fetch roof data using Google Maps Platform Solar API.
         
+        API results are served from the Solar API cache while they are
+        younger than the cache TTL; four decimal places of latitude and
+        longitude (about 11 m) identify a building.
+        
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
             address: Optional address for logging purposes
+            force_refresh: Call the API even if a cached result exists
             
         Returns:
             Dictionary with roof data or None if not found
         """
-        address_str = address if address else f"{latitude}, {longitude}"
-        logger.info(f"Fetching roof data for: {address_str}")
+        if address:
+            logger.debug("Fetching roof data for: %s", address)
+        else:
+            logger.debug("Fetching roof data for: %s, %s", latitude, longitude)
         
         try:
             # Check if we have a Google Maps API key
             if 'google_maps' in self.api_keys:
                 api_key = self.api_keys['google_maps']
                 
+                key = f"solar|{round(latitude, 4)}|{round(longitude, 4)}"
+                if not force_refresh:
+                    roof_data = self._cache_get(key)
+                    if roof_data is not None:
+                        return roof_data
+                
                 # Construct API URL and parameters for Google Solar API
                 url = "https://solar.googleapis.com/v1/buildingInsights:findClosest"
                 params = {
@@ -53,12 +271,16 @@ class RoofDataCollector:
                 }
                 
                 # Make the API request
-                # response = requests.get(url, params=params)
+                # response = self._session.get(url, params=params, timeout=_REQUEST_TIMEOUT)
                 # if response.status_code == 200:
-                #     return self._parse_google_solar_response(response.json())
+                #     roof_data = self._parse_google_solar_response(response.json())
+                #     self._cache_put(key, roof_data)
+                #     return roof_data
                 
                 # For now, return mock data
-                return self._mock_roof_data(latitude, longitude)
+                roof_data = self._mock_roof_data(latitude, longitude)
+                self._cache_put(key, roof_data)
+                return roof_data
             else:
                 logger.warning("No Google Maps API key provided")
                 return self._mock_roof_data(latitude, longitude)
@@ -86,8 +308,8 @@ class RoofDataCollector:
             
             # Extract roof information
             roof_data = {
-                'total_roof_area': building_insights.get('roofSegmentStats', {}).get('totalAreaMeters2', 0) * 10.764,  # Convert m² to ft²
-                'usable_roof_area': building_insights.get('solarPotential', {}).get('maxArrayAreaMeters2', 0) * 10.764,  # Convert m² to ft²
+                'total_roof_area': building_insights.get('roofSegmentStats', {}).get('totalAreaMeters2', 0) * _M2_TO_FT2,
+                'usable_roof_area': building_insights.get('solarPotential', {}).get('maxArrayAreaMeters2', 0) * _M2_TO_FT2,
                 'primary_orientation': self._get_primary_orientation(building_insights.get('roofSegmentStats', {}).get('pitches', [])),
                 'azimuth': building_insights.get('roofSegmentStats', {}).get('azimuthDegrees', 0),
                 'pitch': building_insights.get('roofSegmentStats', {}).get('pitchDegrees', 0),
@@ -101,6 +323,59 @@ class RoofDataCollector:
             logger.error(f"Error parsing Google Solar API response: {e}")
             return None
     
+    def _parse_google_solar_response_batch(self, responses):
+        """
+        Parse many Google Solar API responses, e.g. from a grid scan.
+        
+        The area conversions and the azimuth-to-orientation mapping run as
+        NumPy passes over all buildings; otherwise each result matches
+        _parse_google_solar_response.
+        
+        Args:
+            responses: List of JSON responses from Google Solar API
+            
+        Returns:
+            List of dictionaries with parsed roof data
+        """
+        try:
+            insights = [response_data.get('buildingInsights', {}) for response_data in responses]
+            roof_stats = [building_insights.get('roofSegmentStats', {}) for building_insights in insights]
+            potentials = [building_insights.get('solarPotential', {}) for building_insights in insights]
+            
+            n = len(insights)
+            total_areas = np.fromiter((stats.get('totalAreaMeters2', 0) for stats in roof_stats), dtype=float, count=n)
+            usable_areas = np.fromiter((potential.get('maxArrayAreaMeters2', 0) for potential in potentials), dtype=float, count=n)
+            total_areas *= _M2_TO_FT2
+            usable_areas *= _M2_TO_FT2
+            
+            # Azimuth of each building's largest roof segment, NaN without segments
+            pitch_lists = [stats.get('pitches', []) for stats in roof_stats]
+            azimuths = np.fromiter(
+                (max(pitches, key=lambda x: x.get('areaMeters2', 0)).get('azimuthDegrees', 0) if pitches else np.nan
+                 for pitches in pitch_lists),
+                dtype=float, count=n
+            )
+            orientations = _primary_orientation_batch(azimuths).tolist()
+            
+            return [
+                {
+                    'total_roof_area': total_area,
+                    'usable_roof_area': usable_area,
+                    'primary_orientation': orientation,
+                    'azimuth': stats.get('azimuthDegrees', 0),
+                    'pitch': stats.get('pitchDegrees', 0),
+                    'estimated_solar_potential': potential.get('maxSunshineHoursPerYear', 0),
+                    'data_source': 'google_solar_api'
+                }
+                for total_area, usable_area, orientation, stats, potential in zip(
+                    total_areas.tolist(), usable_areas.tolist(), orientations, roof_stats, potentials
+                )
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error parsing Google Solar API responses: {e}")
+            return None
+    
     def _get_primary_orientation(self, pitches):
         """
         Determine primary roof orientation from pitch data.
@@ -122,10 +397,8 @@ class RoofDataCollector:
         largest_segment = max(pitches, key=lambda x: x.get('areaMeters2', 0))
         azimuth = largest_segment.get('azimuthDegrees', 0)
         
-        # Convert azimuth to cardinal direction
-        directions = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW', 'N']
-        index = round(azimuth / 45)
-        return directions[index]
+        # Convert azimuth to cardinal direction (nearest 45° sector)
+        return _CARDINALS[int((azimuth % 360) / 45 + 0.5) % 8]
     
     def estimate_solar_potential(self, roof_data, utility_data=None):
         """
@@ -138,7 +411,7 @@ class RoofDataCollector:
         Returns:
             Dictionary with solar potential estimates
         """
-        logger.info("Estimating solar potential")
+        logger.debug("Estimating solar potential")
         
         try:
             # Extract roof characteristics
@@ -151,18 +424,7 @@ class RoofDataCollector:
             solar_irradiance = 5.0  # kWh/m²/day (typical for Texas)
             
             # Adjust for orientation
-            orientation_factors = {
-                'S': 1.0,
-                'SE': 0.95,
-                'SW': 0.95,
-                'E': 0.85,
-                'W': 0.85,
-                'NE': 0.75,
-                'NW': 0.75,
-                'N': 0.65,
-                'Unknown': 0.9
-            }
-            orientation_factor = orientation_factors.get(orientation, 0.9)
+            orientation_factor = _ORIENTATION_FACTORS.get(orientation, 0.9)
             
             # Adjust for pitch (optimal is around 20-30 degrees for Texas)
             pitch_factor = 1.0
@@ -218,31 +480,98 @@ class RoofDataCollector:
             logger.error(f"Error estimating solar potential: {e}")
             return {}
     
+    def estimate_solar_potential_batch(self, roofs, utility_data=None):
+        """
+        Estimate solar potential for many roofs at once.
+        
+        Applies the same rules as estimate_solar_potential to whole columns.
+        
+        Args:
+            roofs: List of roof dictionaries, or a dictionary of arrays such
+                as _mock_roof_data_batch returns
+            utility_data: Optional dictionary with utility rate information,
+                applied to every roof
+            
+        Returns:
+            Dictionary of NumPy arrays: system_size, annual_production and
+            num_panels, plus annual_savings, system_cost and payback_period
+            when utility data is given
+        """
+        logger.info(f"Estimating solar potential for {len(roofs)} roofs")
+        
+        if isinstance(roofs, dict):
+            usable_area = np.asarray(roofs['usable_roof_area'], dtype=float)
+            orientations = roofs['primary_orientation']
+            pitch = np.asarray(roofs['pitch'], dtype=float)
+        else:
+            usable_area = np.array([r.get('usable_roof_area', 0) for r in roofs], dtype=float)
+            orientations = [r.get('primary_orientation', 'S') for r in roofs]
+            pitch = np.array([r.get('pitch', 20) for r in roofs], dtype=float)
+        orientation_code = np.array([_ORIENTATION_CODES.get(o, _UNKNOWN_ORIENTATION) for o in orientations],
+                                    dtype=np.int8)
+        
+        n = len(usable_area)
+        if _NUMBA_AVAILABLE:
+            system_size = np.empty(n)
+            annual_production = np.empty(n)
+            num_panels = np.empty(n, dtype=np.int64)
+            _solar_rows(usable_area, orientation_code, pitch, _ORIENTATION_FACTOR_TABLE,
+                        system_size, annual_production, num_panels)
+        else:
+            pitch_factor = np.where(pitch < 10, 0.9, np.where(pitch > 40, 0.95, 1.0))
+            num_panels = (usable_area / _PANEL_AREA).astype(np.int64)
+            system_size = num_panels * _PANEL_POWER
+            annual_production = (system_size * _SOLAR_IRRADIANCE * 365 * _ORIENTATION_FACTOR_TABLE[orientation_code] *
+                                 pitch_factor * _SYSTEM_EFFICIENCY)
+        
+        estimates = {
+            'system_size': system_size,
+            'annual_production': annual_production,
+            'num_panels': num_panels
+        }
+        
+        # Financial metrics ($3 per watt installed)
+        if utility_data:
+            rate = utility_data.get('residential', 0.12)
+            if _NUMBA_AVAILABLE:
+                annual_savings = np.empty(n)
+                system_cost = np.empty(n)
+                payback_period = np.empty(n)
+                _financials(system_size, annual_production, float(rate), 3.0, annual_savings, system_cost, payback_period)
+            else:
+                annual_savings = annual_production * rate
+                system_cost = system_size * 1000 * 3
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    payback_period = np.where(annual_savings > 0, system_cost / annual_savings, 0)
+            estimates.update(annual_savings=annual_savings, system_cost=system_cost, payback_period=payback_period)
+        
+        return estimates
+    
     def _mock_roof_data(self, latitude, longitude):
         """Generate mock roof data for testing."""
-        # Generate realistic mock data
+        # Generate realistic mock data; every draw is a scaled uniform from
+        # one batch
+        u = self._rng.random(9).tolist()
         
         # Roof area (typical single-family home)
-        total_roof_area = random.uniform(1500, 3500)  # sq ft
+        total_roof_area = 1500 + u[0] * 2000  # sq ft
         
         # Usable area (typically 40-80% of total)
-        usable_percentage = random.uniform(0.4, 0.8)
+        usable_percentage = 0.4 + u[1] * 0.4
         usable_roof_area = total_roof_area * usable_percentage
         
-        # Orientation (south-facing is optimal)
-        orientations = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-        orientation_weights = [0.05, 0.1, 0.1, 0.15, 0.3, 0.15, 0.1, 0.05]  # South is most common
-        primary_orientation = random.choices(orientations, weights=orientation_weights)[0]
+        # Orientation (south-facing is optimal and most common)
+        primary_orientation = _MOCK_ORIENTATION_LIST[bisect_right(_MOCK_ORIENTATION_CUM_LIST, u[2] * _MOCK_ORIENTATION_CUM_LIST[-1])]
         
         # Azimuth (180° is south)
         azimuth_map = {'N': 0, 'NE': 45, 'E': 90, 'SE': 135, 'S': 180, 'SW': 225, 'W': 270, 'NW': 315}
-        azimuth = azimuth_map[primary_orientation] + random.uniform(-10, 10)
+        azimuth = azimuth_map[primary_orientation] + (u[3] * 20 - 10)
         
         # Pitch (typical roof pitch is 4/12 to 9/12, which is about 18-37 degrees)
-        pitch = random.uniform(15, 40)
+        pitch = 15 + u[4] * 25
         
         # Shading (0-100%)
-        shading_percentage = random.uniform(0, 30)
+        shading_percentage = u[5] * 30
         
         # Estimated solar potential (based on orientation and shading)
         orientation_factor = 1.0 - (abs(azimuth - 180) / 180) * 0.4  # South (180°) is optimal
@@ -250,9 +579,9 @@ class RoofDataCollector:
         estimated_solar_potential = 1800 * orientation_factor * shading_factor  # Base value of 1800 kWh/kW/year
         
         return {
-            'roof_type': random.choice(['asphalt shingle', 'metal', 'tile', 'flat']),
-            'roof_age': random.randint(0, 25),
-            'roof_condition': random.choice(['excellent', 'good', 'fair', 'poor']),
+            'roof_type': _MOCK_ROOF_TYPE_LIST[int(u[6] * 4)],
+            'roof_age': int(u[7] * 26),
+            'roof_condition': _MOCK_ROOF_CONDITION_LIST[int(u[8] * 4)],
             'total_roof_area': total_roof_area,
             'usable_roof_area': usable_roof_area,
             'primary_orientation': primary_orientation,
@@ -262,3 +591,56 @@ class RoofDataCollector:
             'estimated_solar_potential': estimated_solar_potential,
             'data_source': 'mock_data'
         }
+    
+    def _mock_roof_data_batch(self, n, seed=None):
+        """
+        Generate mock roof data for n roofs at once.
+        
+        Each field is drawn for the whole batch in one NumPy call, from the
+        same distributions as _mock_roof_data.
+        
+        Args:
+            n: Number of roofs
+            seed: Optional seed for reproducible batches
+            
+        Returns:
+            Dictionary of NumPy arrays keyed like _mock_roof_data's fields
+        """
+        rng = np.random.default_rng(seed)
+        
+        # Roof area (typical single-family home), 40-80% of it usable
+        total_roof_area = rng.uniform(1500, 3500, n)
+        usable_roof_area = total_roof_area * rng.uniform(0.4, 0.8, n)
+        
+        # Orientation, and an azimuth within 10° of it
+        orientation_idx = np.searchsorted(_MOCK_ORIENTATION_CUM, rng.random(n) * _MOCK_ORIENTATION_CUM[-1], side='right')
+        azimuth = _MOCK_AZIMUTHS[orientation_idx] + rng.uniform(-10, 10, n)
+        
+        pitch = rng.uniform(15, 40, n)
+        shading_percentage = rng.uniform(0, 30, n)
+        
+        # Estimated solar potential (based on orientation and shading), as
+        # 1800 * (1 - |azimuth - 180| * 0.4/180) * (1 - shading/100) worked
+        # in place on two buffers rather than a temporary per operation
+        estimated_solar_potential = azimuth - 180.0
+        np.abs(estimated_solar_potential, out=estimated_solar_potential)
+        estimated_solar_potential *= -0.4 / 180.0
+        estimated_solar_potential += 1.0
+        shading_factor = shading_percentage * -0.01
+        shading_factor += 1.0
+        estimated_solar_potential *= shading_factor
+        estimated_solar_potential *= 1800.0
+        
+        return {
+            'roof_type': _MOCK_ROOF_TYPES[rng.integers(0, len(_MOCK_ROOF_TYPES), n)],
+            'roof_age': rng.integers(0, 26, n),
+            'roof_condition': _MOCK_ROOF_CONDITIONS[rng.integers(0, len(_MOCK_ROOF_CONDITIONS), n)],
+            'total_roof_area': total_roof_area,
+            'usable_roof_area': usable_roof_area,
+            'primary_orientation': _MOCK_ORIENTATIONS[orientation_idx],
+            'azimuth': azimuth,
+            'pitch': pitch,
+            'shading_percentage': shading_percentage,
+            'estimated_solar_potential': estimated_solar_potential,
+            'data_source': np.full(n, 'mock_data')
+        }
@@ -6,58 +6,220 @@ Handles finding and enriching contact information for property owners.
 import requests
 import json
 import os
+import asyncio
+import concurrent.futures
+import functools
 import logging
 import random
+import re
+import sqlite3
+import string
+import threading
+import time
+import numpy as np
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    import aiohttp
+except ImportError:
+    # The async batch then traces through the blocking path
+    aiohttp = None
+
+# Handlers and levels are left to the application entry point
 logger = logging.getLogger(__name__)
 
+# Skip-trace requests in flight at once during a batch
+_MAX_CONCURRENT_TRACES = 32
+_DATAZAPP_URL = "https://api.datazapp.com/v1/skip-trace"
+
+# (connect, read) seconds for blocking Datazapp requests
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Seconds a cached trace stays valid; owner contact details rarely change
+# within a few months
+_CACHE_TTL = 180 * 24 * 3600
+
+_PUNCTUATION = str.maketrans('', '', string.punctuation)
+
+# Contact format checks, compiled once
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Every non-digit byte; deleting them with bytes.translate is the regex-free
+# path for ASCII phone numbers
+_KEEP_DIGITS = bytes(c for c in range(256) if not 48 <= c <= 57)
+
+# Mock owner name, phone and mailing address pools
+_FIRST_NAMES = ('James', 'John', 'Robert', 'Michael', 'William', 'David', 'Richard', 'Joseph', 'Thomas', 'Charles',
+                'Mary', 'Patricia', 'Jennifer', 'Linda', 'Elizabeth', 'Barbara', 'Susan', 'Jessica', 'Sarah', 'Karen')
+_LAST_NAMES = ('Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson', 'Moore', 'Taylor',
+               'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson', 'Garcia', 'Martinez', 'Robinson')
+# Lowercase forms for building email addresses, index-aligned with the names
+_FIRST_NAMES_LOWER = tuple(name.lower() for name in _FIRST_NAMES)
+_LAST_NAMES_LOWER = tuple(name.lower() for name in _LAST_NAMES)
+_AREA_CODES = ('512', '737', '214', '469', '972', '713', '281', '832', '210', '830',
+               '915', '430', '903', '806', '325', '361', '409', '432', '936', '956')
+_MAILING_STREETS = ('Oak', 'Maple', 'Pine', 'Cedar', 'Elm')
+_MAILING_STREET_TYPES = ('St', 'Ave', 'Blvd', 'Dr', 'Ln')
+_MAILING_CITIES = ('Austin', 'Houston', 'Dallas', 'San Antonio', 'Fort Worth', 'El Paso')
+
+
+@functools.lru_cache(maxsize=None)
+def _number_strings():
+    """Decimal strings for 0-79999 by value, so batch mocks format numbers by indexing."""
+    return np.arange(80000).astype(str)
+
+
 class SkipTracer:
     """Class to perform skip tracing operations to find property owner contact information."""
     
-    def __init__(self, api_keys=None):
-        """Initialize with API keys for different skip tracing services."""
+    def __init__(self, api_keys=None, cache_path=None, cache_ttl=_CACHE_TTL):
+        """
+        Initialize with API keys for different skip tracing services.
+        
+        Args:
+            api_keys: Dictionary of API keys by service
+            cache_path: Optional SQLite file that keeps traces across runs
+            cache_ttl: Seconds before a cached trace is fetched again
+        """
         self.api_keys = api_keys or {}
         
-    def trace_property_owner(self, property_data):
+        # Mock traces take all their draws from one generator call
+        self._rng = np.random.default_rng()
+        
+        # Shared connection pool so batch traces reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_MAX_CONCURRENT_TRACES,
+            pool_maxsize=2 * _MAX_CONCURRENT_TRACES,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Traces by normalized address; batch traces share it across threads
+        self._cache_ttl = cache_ttl
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        if cache_path:
+            self._open_cache(cache_path)
+    
+    def close(self):
+        """Close the pooled HTTP connections and the trace cache."""
+        self._session.close()
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _open_cache(self, cache_path):
+        """
+        Open the on-disk trace cache.
+        
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        try:
+            self._cache_db = sqlite3.connect(cache_path, check_same_thread=False, isolation_level=None)
+            self._cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS trace_cache (key TEXT PRIMARY KEY, value TEXT, fetched_at REAL)"
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error opening trace cache {cache_path}: {e}")
+            self._cache_db = None
+    
+    def _cache_key(self, property_data):
+        """Cache key for a property: its address uppercased, punctuation stripped, whitespace collapsed."""
+        return '|'.join(
+            ' '.join(str(property_data.get(field) or '').upper().translate(_PUNCTUATION).split())
+            for field in ('address_line_1', 'city', 'state', 'zip_code')
+        )
+    
+    def _cache_get(self, key):
+        """Cached trace for key if it is younger than the TTL; None otherwise."""
+        if self._cache_db is None:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT value FROM trace_cache WHERE key = ? AND fetched_at >= ?",
+                    (key, time.time() - self._cache_ttl)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading trace cache: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+    
+    def _cache_put(self, key, value):
+        """Store a trace on disk with its fetch time."""
+        if self._cache_db is None:
+            return
+        try:
+            with self._cache_lock:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO trace_cache (key, value, fetched_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error writing trace cache: {e}")
+    
+    def _trace_payload(self, property_data):
+        """Datazapp skip-trace request body for a property."""
+        return {
+            "api_key": self.api_keys['datazapp'],
+            "address": property_data.get('address_line_1', ''),
+            "city": property_data.get('city', ''),
+            "state": property_data.get('state', ''),
+            "zip": property_data.get('zip_code', '')
+        }
+    
+    def trace_property_owner(self, property_data, force_refresh=False):
         """
         Find contact information for a property owner.
         
+        Datazapp traces are served from the trace cache while they are
+        younger than the cache TTL.
+        
         Args:
             property_data: Dictionary with property information
+            force_refresh: Trace again even if a cached result exists
             
         Returns:
             Dictionary with owner contact information
         """
-        logger.info(f"Tracing owner for property: {property_data.get('address_line_1')}, {property_data.get('city')}")
+        logger.debug("Tracing owner for property: %s, %s", property_data.get('address_line_1'), property_data.get('city'))
         
         try:
             # Check if we have a skip tracing API key
             if 'datazapp' in self.api_keys:
-                api_key = self.api_keys['datazapp']
+                key = self._cache_key(property_data)
+                if not force_refresh:
+                    owner_data = self._cache_get(key)
+                    if owner_data is not None:
+                        return owner_data
                 
                 # Construct API URL and parameters
-                url = "https://api.datazapp.com/v1/skip-trace"
-                payload = {
-                    "api_key": api_key,
-                    "address": property_data.get('address_line_1', ''),
-                    "city": property_data.get('city', ''),
-                    "state": property_data.get('state', ''),
-                    "zip": property_data.get('zip_code', '')
-                }
+                url = _DATAZAPP_URL
+                payload = self._trace_payload(property_data)
                 
                 # Make the API request
-                # response = requests.post(url, json=payload)
+                # response = self._session.post(url, json=payload, timeout=_REQUEST_TIMEOUT)
                 # if response.status_code == 200:
-                #     return response.json()
+                #     owner_data = response.json()
+                #     self._cache_put(key, owner_data)
+                #     return owner_data
                 
                 # For now, return mock data
-                return self._mock_owner_data(property_data)
+                owner_data = self._mock_owner_data(property_data)
+                self._cache_put(key, owner_data)
+                return owner_data
             else:
                 logger.warning("No skip tracing API key provided")
                 return self._mock_owner_data(property_data)
@@ -70,6 +232,10 @@ class SkipTracer:
         """
         Perform skip tracing on a batch of properties.
         
+        With a Datazapp API key the traces are network-bound, so up to
+        _MAX_CONCURRENT_TRACES run at once on worker threads sharing the
+        session's connection pool.
+        
         Args:
             property_list: List of property dictionaries
             
@@ -78,14 +244,93 @@ class SkipTracer:
         """
         logger.info(f"Batch tracing {len(property_list)} properties")
         
-        results = []
-        for property_data in property_list:
-            owner_data = self.trace_property_owner(property_data)
-            if owner_data:
-                results.append({
-                    'property_data': property_data,
-                    'owner_data': owner_data
-                })
+        if 'datazapp' in self.api_keys and len(property_list) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_TRACES) as executor:
+                owners = list(executor.map(self.trace_property_owner, property_list))
+        else:
+            owners = [self.trace_property_owner(property_data) for property_data in property_list]
+        
+        return self._pair_traces(property_list, owners)
+    
+    async def batch_trace_properties_async(self, property_list):
+        """
+        Perform skip tracing on a batch of properties from a running event loop.
+        
+        With aiohttp installed and a Datazapp API key configured, up to
+        _MAX_CONCURRENT_TRACES requests share one aiohttp session; otherwise
+        the properties are traced one by one with trace_property_owner.
+        
+        Args:
+            property_list: List of property dictionaries
+            
+        Returns:
+            List of dictionaries with owner contact information
+        """
+        logger.info(f"Batch tracing {len(property_list)} properties")
+        
+        if aiohttp is None or 'datazapp' not in self.api_keys:
+            owners = [self.trace_property_owner(property_data) for property_data in property_list]
+            return self._pair_traces(property_list, owners)
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TRACES)
+        connector = aiohttp.TCPConnector(limit_per_host=_MAX_CONCURRENT_TRACES)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30)) as session:
+            owners = await asyncio.gather(
+                *(self.trace_property_owner_async(session, semaphore, property_data) for property_data in property_list),
+                return_exceptions=True
+            )
+        
+        for i, owner_data in enumerate(owners):
+            if isinstance(owner_data, Exception):
+                logger.error(f"Error tracing property owner: {owner_data}")
+                owners[i] = None
+        
+        return self._pair_traces(property_list, owners)
+    
+    async def trace_property_owner_async(self, session, semaphore, property_data):
+        """
+        Find contact information for a property owner with a Datazapp request,
+        or from the trace cache when it holds a fresh result.
+        
+        Args:
+            session: aiohttp.ClientSession to send the request on
+            semaphore: asyncio.Semaphore capping concurrent requests
+            property_data: Dictionary with property information
+            
+        Returns:
+            Dictionary with owner contact information or None if not found
+        """
+        key = self._cache_key(property_data)
+        owner_data = self._cache_get(key)
+        if owner_data is not None:
+            return owner_data
+        
+        async with semaphore:
+            async with session.post(_DATAZAPP_URL, json=self._trace_payload(property_data)) as response:
+                if response.status != 200:
+                    logger.warning(f"Skip trace for {property_data.get('address_line_1')} failed with status {response.status}")
+                    return None
+                owner_data = await response.json()
+        
+        self._cache_put(key, owner_data)
+        return owner_data
+    
+    def _pair_traces(self, property_list, owners):
+        """
+        Pair each property with its traced owner, dropping failed traces.
+        
+        Args:
+            property_list: List of property dictionaries
+            owners: Owner data (or None) for each property, in the same order
+            
+        Returns:
+            List of dictionaries with owner contact information
+        """
+        results = [
+            {'property_data': property_data, 'owner_data': owner_data}
+            for property_data, owner_data in zip(property_list, owners)
+            if owner_data
+        ]
         
         logger.info(f"Completed batch tracing with {len(results)} successful traces")
         return results
@@ -100,12 +345,28 @@ class SkipTracer:
         Returns:
             Boolean indicating if number is on DNC list
         """
-        logger.info(f"Checking DNC status for phone number: {phone_number}")
+        logger.debug("Checking DNC status for phone number: %s", phone_number)
         
         # This would typically involve checking against the DNC registry
         # For now, return a random result with 20% chance of being on DNC
         return random.random() < 0.2
     
+    def check_do_not_call_batch(self, phone_numbers):
+        """
+        Check many phone numbers against the Do Not Call registry at once.
+        
+        Args:
+            phone_numbers: List of phone numbers to check
+            
+        Returns:
+            NumPy boolean array, True where the number is on the DNC list
+        """
+        logger.info(f"Checking DNC status for {len(phone_numbers)} phone numbers")
+        
+        # A registry lookup would send every number in one request; for now
+        # draw the same 20% chance for each number in one call
+        return self._rng.random(len(phone_numbers)) < 0.2
+    
     def enrich_contact_data(self, basic_contact_data):
         """
         Enrich basic contact data with additional information.
@@ -116,7 +377,7 @@ class SkipTracer:
         Returns:
             Dictionary with enriched contact information
         """
-        logger.info(f"Enriching contact data for: {basic_contact_data.get('first_name')} {basic_contact_data.get('last_name')}")
+        logger.debug("Enriching contact data for: %s %s", basic_contact_data.get('first_name'), basic_contact_data.get('last_name'))
         
         # This would typically involve additional API calls to data enrichment services
         # For now, just add some mock additional fields
@@ -147,15 +408,13 @@ class SkipTracer:
         Returns:
             Dictionary with validation results
         """
-        logger.info(f"Validating email: {email}")
+        logger.debug("Validating email: %s", email)
         
         # This would typically involve an email validation service
         # For now, return mock validation results
         
         # Simple format check
-        import re
-        email_pattern = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
-        format_valid = bool(email_pattern.match(email))
+        format_valid = bool(_EMAIL_RE.match(email))
         
         return {
             'email': email,
@@ -164,25 +423,29 @@ class SkipTracer:
             'confidence_score': random.uniform(0.5, 1.0) if format_valid else random.uniform(0, 0.5)
         }
     
-    def validate_phone(self, phone):
+    def validate_phone(self, phone, do_not_call=None):
         """
         Validate if a phone number is likely to be valid and active.
         
         Args:
             phone: Phone number to validate
+            do_not_call: DNC status if already known (e.g. the owner record's
+                do_not_call flag), to skip a repeat registry check
             
         Returns:
             Dictionary with validation results
         """
-        logger.info(f"Validating phone: {phone}")
+        logger.debug("Validating phone: %s", phone)
         
         # This would typically involve a phone validation service
         # For now, return mock validation results
         
         # Simple format check for US numbers
-        import re
-        # Remove any non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        # Remove any non-digit characters; only non-ASCII input needs the regex
+        if phone.isascii():
+            digits_only = phone.encode('ascii').translate(None, _KEEP_DIGITS).decode('ascii')
+        else:
+            digits_only = _NON_DIGIT_RE.sub('', phone)
         format_valid = len(digits_only) == 10 or (len(digits_only) == 11 and digits_only[0] == '1')
         
         return {
@@ -190,57 +453,55 @@ class SkipTracer:
             'format_valid': format_valid,
             'line_type': random.choice(['mobile', 'landline', 'voip']) if format_valid else 'invalid',
             'active': format_valid and random.random() < 0.8,  # 80% chance of being active if format is valid
-            'do_not_call': self.check_do_not_call(phone),
+            'do_not_call': self.check_do_not_call(phone) if do_not_call is None else do_not_call,
             'confidence_score': random.uniform(0.5, 1.0) if format_valid else random.uniform(0, 0.5)
         }
     
     def _mock_owner_data(self, property_data):
         """Generate mock owner data for testing."""
-        # Generate realistic mock data
-        first_names = ['James', 'John', 'Robert', 'Michael', 'William', 'David', 'Richard', 'Joseph', 'Thomas', 'Charles',
-                      'Mary', 'Patricia', 'Jennifer', 'Linda', 'Elizabeth', 'Barbara', 'Susan', 'Jessica', 'Sarah', 'Karen']
-        last_names = ['Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson', 'Moore', 'Taylor',
-                     'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin', 'Thompson', 'Garcia', 'Martinez', 'Robinson']
-        
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        
-        # Generate email with various patterns
-        email_patterns = [
-            f"{first_name.lower()}.{last_name.lower()}@gmail.com",
-            f"{first_name.lower()}{last_name.lower()}@yahoo.com",
-            f"{first_name.lower()[0]}{last_name.lower()}@outlook.com",
-            f"{last_name.lower()}{random.randint(1, 99)}@hotmail.com"
-        ]
-        email = random.choice(email_patterns)
+        # Generate realistic mock data; every draw comes from one batch of
+        # uniforms, so each pick is a scaled uniform rather than a random call
+        u = self._rng.random(17).tolist()
+        first_idx = int(u[0] * len(_FIRST_NAMES))
+        last_idx = int(u[1] * len(_LAST_NAMES))
+        first_name = _FIRST_NAMES[first_idx]
+        last_name = _LAST_NAMES[last_idx]
+        first_lower = _FIRST_NAMES_LOWER[first_idx]
+        last_lower = _LAST_NAMES_LOWER[last_idx]
+        
+        # Generate email with one of several patterns, formatting only the one picked
+        pattern = int(u[2] * 4)
+        if pattern == 0:
+            email = f"{first_lower}.{last_lower}@gmail.com"
+        elif pattern == 1:
+            email = f"{first_lower}{last_lower}@yahoo.com"
+        elif pattern == 2:
+            email = f"{first_lower[0]}{last_lower}@outlook.com"
+        else:
+            email = f"{last_lower}{1 + int(u[3] * 99)}@hotmail.com"
         
         # Generate phone numbers
-        area_codes = ['512', '737', '214', '469', '972', '713', '281', '832', '210', '830', '915', '430', '903', '806', '325', '361', '409', '432', '936', '956']
-        area_code = random.choice(area_codes)
-        phone_mobile = f"{area_code}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
+        area_code = _AREA_CODES[int(u[4] * len(_AREA_CODES))]
+        phone_mobile = f"{area_code}-{100 + int(u[5] * 900)}-{1000 + int(u[6] * 9000)}"
         
         # 70% chance of having a landline
-        has_landline = random.random() < 0.7
-        phone_landline = f"{area_code}-{random.randint(100, 999)}-{random.randint(1000, 9999)}" if has_landline else None
+        has_landline = u[7] < 0.7
+        phone_landline = f"{area_code}-{100 + int(u[8] * 900)}-{1000 + int(u[9] * 9000)}" if has_landline else None
         
         # Determine if mailing address is different from property address
-        different_mailing = random.random() < 0.15  # 15% chance of different mailing address
+        different_mailing = u[10] < 0.15  # 15% chance of different mailing address
         
-        mailing_data = {}
         if different_mailing:
-            mailing_data = {
-                'mailing_address_line_1': f"{random.randint(100, 9999)} {random.choice(['Oak', 'Maple', 'Pine', 'Cedar', 'Elm'])} {random.choice(['St', 'Ave', 'Blvd', 'Dr', 'Ln'])}",
-                'mailing_city': random.choice(['Austin', 'Houston', 'Dallas', 'San Antonio', 'Fort Worth', 'El Paso']),
-                'mailing_state': 'TX',
-                'mailing_zip_code': f"{random.randint(73301, 79999)}"
-            }
+            mailing_address = (f"{100 + int(u[11] * 9900)} {_MAILING_STREETS[int(u[12] * len(_MAILING_STREETS))]} "
+                               f"{_MAILING_STREET_TYPES[int(u[13] * len(_MAILING_STREET_TYPES))]}")
+            mailing_city = _MAILING_CITIES[int(u[14] * len(_MAILING_CITIES))]
+            mailing_state = 'TX'
+            mailing_zip_code = f"{73301 + int(u[15] * 6699)}"
         else:
-            mailing_data = {
-                'mailing_address_line_1': property_data.get('address_line_1', ''),
-                'mailing_city': property_data.get('city', ''),
-                'mailing_state': property_data.get('state', ''),
-                'mailing_zip_code': property_data.get('zip_code', '')
-            }
+            mailing_address = property_data.get('address_line_1', '')
+            mailing_city = property_data.get('city', '')
+            mailing_state = property_data.get('state', '')
+            mailing_zip_code = property_data.get('zip_code', '')
         
         # Generate owner data
         owner_data = {
@@ -249,11 +510,90 @@ class SkipTracer:
             'email': email,
             'phone_mobile': phone_mobile,
             'phone_landline': phone_landline,
-            'length_of_ownership': random.randint(1, 20),
+            'length_of_ownership': 1 + int(u[16] * 20),
             'do_not_call': self.check_do_not_call(phone_mobile),
             'skip_trace_status': 'completed',
             'data_source': 'mock_skip_trace',
-            **mailing_data
+            'mailing_address_line_1': mailing_address,
+            'mailing_city': mailing_city,
+            'mailing_state': mailing_state,
+            'mailing_zip_code': mailing_zip_code
         }
         
         return owner_data
+    
+    def mock_owner_data_batch(self, property_list, seed=None):
+        """
+        Generate mock owner data for many properties at once.
+        
+        Each field is drawn for the whole batch in one NumPy call, from the
+        same distributions as _mock_owner_data, and the result stays
+        columnar instead of becoming one dictionary per owner.
+        
+        Args:
+            property_list: List of property dictionaries
+            seed: Optional seed for reproducible batches
+            
+        Returns:
+            Dictionary of NumPy arrays keyed like _mock_owner_data's fields,
+            with None in phone_landline for owners without a landline
+        """
+        rng = np.random.default_rng(seed)
+        n = len(property_list)
+        numbers = _number_strings()
+        
+        first_idx = rng.integers(0, len(_FIRST_NAMES), n)
+        last_idx = rng.integers(0, len(_LAST_NAMES), n)
+        first_lower = np.asarray(_FIRST_NAMES_LOWER)[first_idx]
+        last_lower = np.asarray(_LAST_NAMES_LOWER)[last_idx]
+        
+        # Generate email with one of several patterns
+        pattern = rng.integers(0, 4, n)
+        email = np.select(
+            [pattern == 0, pattern == 1, pattern == 2],
+            [
+                np.char.add(np.char.add(np.char.add(first_lower, '.'), last_lower), '@gmail.com'),
+                np.char.add(np.char.add(first_lower, last_lower), '@yahoo.com'),
+                np.char.add(np.char.add(first_lower.astype('<U1'), last_lower), '@outlook.com')
+            ],
+            np.char.add(np.char.add(last_lower, numbers[rng.integers(1, 100, n)]), '@hotmail.com')
+        )
+        
+        # Generate phone numbers, 70% with a landline
+        area_code = np.asarray(_AREA_CODES)[rng.integers(0, len(_AREA_CODES), n)]
+        phone_mobile = np.char.add(np.char.add(area_code, np.char.add('-', numbers[rng.integers(100, 1000, n)])), np.char.add('-', numbers[rng.integers(1000, 10000, n)]))
+        phone_landline = np.char.add(np.char.add(area_code, np.char.add('-', numbers[rng.integers(100, 1000, n)])), np.char.add('-', numbers[rng.integers(1000, 10000, n)])).astype(object)
+        phone_landline[rng.random(n) >= 0.7] = None
+        
+        # Mailing address is the property address, except for the 15% of
+        # owners with a different one
+        mailing_address = np.array([property_data.get('address_line_1', '') for property_data in property_list], dtype=object)
+        mailing_city = np.array([property_data.get('city', '') for property_data in property_list], dtype=object)
+        mailing_state = np.array([property_data.get('state', '') for property_data in property_list], dtype=object)
+        mailing_zip_code = np.array([property_data.get('zip_code', '') for property_data in property_list], dtype=object)
+        
+        different_mailing = rng.random(n) < 0.15
+        k = int(different_mailing.sum())
+        mailing_address[different_mailing] = np.char.add(
+            np.char.add(np.char.add(numbers[rng.integers(100, 10000, k)], ' '), np.asarray(_MAILING_STREETS)[rng.integers(0, len(_MAILING_STREETS), k)]),
+            np.char.add(' ', np.asarray(_MAILING_STREET_TYPES)[rng.integers(0, len(_MAILING_STREET_TYPES), k)])
+        )
+        mailing_city[different_mailing] = np.asarray(_MAILING_CITIES)[rng.integers(0, len(_MAILING_CITIES), k)]
+        mailing_state[different_mailing] = 'TX'
+        mailing_zip_code[different_mailing] = numbers[rng.integers(73301, 80000, k)]
+        
+        return {
+            'first_name': np.asarray(_FIRST_NAMES)[first_idx],
+            'last_name': np.asarray(_LAST_NAMES)[last_idx],
+            'email': email,
+            'phone_mobile': phone_mobile,
+            'phone_landline': phone_landline,
+            'length_of_ownership': rng.integers(1, 21, n),
+            'do_not_call': self.check_do_not_call_batch(phone_mobile),
+            'skip_trace_status': np.full(n, 'completed'),
+            'data_source': np.full(n, 'mock_skip_trace'),
+            'mailing_address_line_1': mailing_address,
+            'mailing_city': mailing_city,
+            'mailing_state': mailing_state,
+            'mailing_zip_code': mailing_zip_code
+        }
@@ -3,21 +3,33 @@ Test script for the Solar Lead Generation System.
 Validates the system's functionality with sample data.
 """
 
+import functools
 import logging
 import os
 import sys
 import json
+import hashlib
+import inspect
+import pickle
 import sqlite3
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Test results are written with the standard library encoder
+    orjson = None
+
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.test_data_generator import TestDataGenerator
 from src.lead_scoring import LeadScoringEngine
 from src.bill_estimator import BillEstimator
-from src.roof_analyzer import RoofAnalyzer
-from src.lead_scoring_service import LeadScoringService
+from src.roof_analyzer import RoofAnalyzer, SUITABILITY_LEVELS
+from src.lead_scoring_service import get_default_service
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +38,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _shared_component(component_class):
+    """
+    Build a scoring component once per process and share it between testers.
+    
+    The testers only call scoring methods on the components and never change
+    their configuration, so one instance of each can serve them all.
+    
+    Args:
+        component_class: Component class with a no-argument constructor
+        
+    Returns:
+        Shared instance of component_class
+    """
+    return component_class()
+
+
 class SystemTester:
     """Class to test the Solar Lead Generation System."""
     
@@ -39,6 +69,7 @@ class SystemTester:
         """
         self.test_data_dir = test_data_dir
         self.db_file = db_file
+        self._db_conn = None
         
         # Create test data directory if it doesn't exist
         if not os.path.exists(test_data_dir):
@@ -48,33 +79,90 @@ class SystemTester:
         self.data_generator = TestDataGenerator()
         
         # Initialize lead scoring components
-        self.lead_scoring_engine = LeadScoringEngine()
-        self.bill_estimator = BillEstimator()
-        self.roof_analyzer = RoofAnalyzer()
-        self.lead_scoring_service = LeadScoringService()
+        self.lead_scoring_engine = _shared_component(LeadScoringEngine)
+        self.bill_estimator = _shared_component(BillEstimator)
+        self.roof_analyzer = _shared_component(RoofAnalyzer)
+        self.lead_scoring_service = get_default_service()
         
         logger.info("System tester initialized")
     
-    def generate_test_data(self, count=100):
+    def generate_test_data(self, count=100, use_cache=True):
         """
         Generate test data for the system.
         
+        Generated data is pickled in the test data directory, keyed by the
+        record count, generator configuration and generator source, so
+        repeated runs load it instead of regenerating; the database is only
+        rebuilt when it was created from other data.
+        
         Args:
             count: Number of properties to generate
+            use_cache: Reuse previously generated data for the same inputs
             
         Returns:
             Dictionary with all generated data
         """
-        logger.info(f"Generating {count} test records")
-        
-        # Generate all test data
-        data = self.data_generator.generate_all_test_data(count, self.test_data_dir)
-        
-        # Create SQLite database
-        self.data_generator.create_sqlite_database(data, os.path.join(self.test_data_dir, self.db_file))
+        db_path = os.path.join(self.test_data_dir, self.db_file)
+        cache_key = self._test_data_cache_key(count)
+        cache_file = os.path.join(self.test_data_dir, f"cache_{cache_key}.pkl")
+        
+        if use_cache and os.path.exists(cache_file):
+            logger.info(f"Loading {count} cached test records from {cache_file}")
+            with open(cache_file, 'rb') as f:
+                data = pickle.load(f)
+        else:
+            logger.info(f"Generating {count} test records")
+            
+            # Generate all test data
+            data = self.data_generator.generate_all_test_data(count, self.test_data_dir)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._remove_db_stamp(db_path)
+        
+        # Create SQLite database, unless it already holds this data
+        stamp_file = db_path + ".key"
+        if not (os.path.exists(db_path) and self._read_db_stamp(stamp_file) == cache_key):
+            # The database is rebuilt from scratch whenever it is stale, so
+            # durability is not needed while loading it; the shared connection
+            # is closed first so the journal mode can be changed
+            self.close()
+            conn = sqlite3.connect(db_path)
+            try:
+                conn.execute("PRAGMA synchronous=OFF")
+                conn.execute("PRAGMA journal_mode=MEMORY")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                self.data_generator.create_sqlite_database(data, db_path, conn=conn)
+            finally:
+                conn.close()
+            with open(stamp_file, 'w') as f:
+                f.write(cache_key)
         
         return data
     
+    def _test_data_cache_key(self, count):
+        """Fingerprint of everything generated test data depends on."""
+        generator_stat = os.stat(inspect.getsourcefile(TestDataGenerator))
+        fingerprint = json.dumps(
+            [count, self.data_generator.config, generator_stat.st_mtime_ns, generator_stat.st_size],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+    
+    def _read_db_stamp(self, stamp_file):
+        """Cache key the database was built from, or None if unknown."""
+        try:
+            with open(stamp_file) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+    
+    def _remove_db_stamp(self, db_path):
+        """Mark the database as not built from the cached data."""
+        try:
+            os.remove(db_path + ".key")
+        except OSError:
+            pass
+    
     def test_bill_estimator(self, properties, utilities):
         """
         Test the bill estimator component.
@@ -99,47 +187,43 @@ class SystemTester:
         # Create lookup for utilities
         utility_lookup = {u["property_id"]: u for u in utilities}
         
-        # Test a sample of properties
+        # Test a sample of properties, keeping those with utility data
         sample_size = min(20, len(properties))
-        sample_properties = properties[:sample_size]
-        
-        for prop in sample_properties:
-            property_id = prop["property_id"]
-            utility_data = utility_lookup.get(property_id)
-            
-            if utility_data:
-                # Get the actual bill from test data
-                actual_bill = utility_data["estimated_monthly_bill"]
-                
-                # Estimate bill using our algorithm
-                estimated_bill = self.bill_estimator.estimate_monthly_bill(prop, utility_data)
-                
-                # Calculate percentage difference
-                if actual_bill > 0:
-                    percent_diff = abs(estimated_bill - actual_bill) / actual_bill * 100
-                else:
-                    percent_diff = 100
-                
-                # Categorize result
-                results["total_tested"] += 1
-                if percent_diff <= 10:
-                    results["within_10_percent"] += 1
-                elif percent_diff <= 20:
-                    results["within_20_percent"] += 1
-                else:
-                    results["over_20_percent"] += 1
-                
-                # Add example
-                if len(results["examples"]) < 5:
-                    results["examples"].append({
-                        "property_id": property_id,
-                        "address": prop["address_line_1"],
-                        "square_footage": prop["square_footage"],
-                        "year_built": prop["year_built"],
-                        "actual_bill": actual_bill,
-                        "estimated_bill": estimated_bill,
-                        "percent_diff": round(percent_diff, 2)
-                    })
+        tested = [(prop, utility_lookup.get(prop["property_id"])) for prop in properties[:sample_size]]
+        tested = [(prop, utility_data) for prop, utility_data in tested if utility_data]
+        n = len(tested)
+        
+        # Estimate all bills in one vectorized pass
+        estimated = self.bill_estimator.estimate_monthly_bill_batch(
+            np.fromiter((prop.get("square_footage", 0) for prop, _ in tested), dtype=float, count=n),
+            np.fromiter((prop.get("year_built", 2000) for prop, _ in tested), dtype=float, count=n),
+            np.fromiter((prop.get("bedrooms", 3) for prop, _ in tested), dtype=float, count=n),
+            [prop.get("zip_code", "") for prop, _ in tested],
+            np.fromiter((u["residential"] if "residential" in u else 0.12 for _, u in tested), dtype=float, count=n)
+        )
+        actual = np.fromiter((u["estimated_monthly_bill"] for _, u in tested), dtype=float, count=n)
+        
+        # Percentage difference from the actual bill, 100% when there is none
+        percent_diff = np.where(actual > 0, np.abs(estimated - actual) / np.where(actual > 0, actual, 1) * 100, 100.0)
+        
+        # Categorize results: 0 within 10%, 1 within 20%, 2 over 20%
+        within_10, within_20, over_20 = np.bincount((percent_diff > 10).astype(int) + (percent_diff > 20), minlength=3).tolist()
+        results["total_tested"] = n
+        results["within_10_percent"] = within_10
+        results["within_20_percent"] = within_20
+        results["over_20_percent"] = over_20
+        
+        # Add examples
+        for (prop, utility_data), estimated_bill, diff in zip(tested[:5], estimated[:5].tolist(), np.round(percent_diff[:5], 2).tolist()):
+            results["examples"].append({
+                "property_id": prop["property_id"],
+                "address": prop["address_line_1"],
+                "square_footage": prop["square_footage"],
+                "year_built": prop["year_built"],
+                "actual_bill": utility_data["estimated_monthly_bill"],
+                "estimated_bill": estimated_bill,
+                "percent_diff": diff
+            })
         
         # Calculate accuracy percentages
         if results["total_tested"] > 0:
@@ -171,45 +255,34 @@ class SystemTester:
             "examples": []
         }
         
-        # Create lookup for properties
-        property_lookup = {p["property_id"]: p for p in properties}
-        
-        # Test all roofs
-        for roof in roofs:
-            property_id = roof["property_id"]
-            property_data = property_lookup.get(property_id)
-            
-            if property_data:
-                # Analyze roof suitability
-                analysis = self.roof_analyzer.analyze_roof_suitability(roof)
-                
-                # Categorize result
-                results["total_tested"] += 1
-                suitability = analysis.get("suitability", "unknown")
-                
-                if suitability == "excellent":
-                    results["excellent_count"] += 1
-                elif suitability == "good":
-                    results["good_count"] += 1
-                elif suitability == "average":
-                    results["average_count"] += 1
-                elif suitability == "poor":
-                    results["poor_count"] += 1
-                elif suitability == "unsuitable":
-                    results["unsuitable_count"] += 1
-                
-                # Add example
-                if len(results["examples"]) < 5:
-                    results["examples"].append({
-                        "property_id": property_id,
-                        "address": property_data["address_line_1"],
-                        "roof_type": roof["roof_type"],
-                        "orientation": roof["primary_orientation"],
-                        "usable_area": roof["usable_roof_area"],
-                        "suitability": suitability,
-                        "overall_score": analysis.get("overall_score", 0),
-                        "recommendations": analysis.get("recommendations", [])
-                    })
+        # Test all roofs with property data, scored together in the batch analyzer
+        property_ids = {p["property_id"] for p in properties}
+        tested = [roof for roof in roofs if roof["property_id"] in property_ids]
+        batch = self.roof_analyzer.analyze_roofs_batch(tested)
+        
+        # Categorize results
+        results["total_tested"] = len(tested)
+        codes = batch["suitability_code"][batch["valid"]]
+        counts = np.bincount(codes, minlength=len(SUITABILITY_LEVELS)).tolist()
+        for suitability, count in zip(SUITABILITY_LEVELS, counts):
+            results[f"{suitability}_count"] = count
+        
+        # Add examples, with the full analysis for their recommendations; only
+        # their properties are looked up, and generated roofs follow property
+        # order, so each search stops near the front of the list
+        for roof in tested[:5]:
+            property_data = next(p for p in properties if p["property_id"] == roof["property_id"])
+            analysis = self.roof_analyzer.analyze_roof_suitability(roof)
+            results["examples"].append({
+                "property_id": roof["property_id"],
+                "address": property_data["address_line_1"],
+                "roof_type": roof["roof_type"],
+                "orientation": roof["primary_orientation"],
+                "usable_area": roof["usable_roof_area"],
+                "suitability": analysis.get("suitability", "unknown"),
+                "overall_score": analysis.get("overall_score", 0),
+                "recommendations": analysis.get("recommendations", [])
+            })
         
         # Calculate percentages
         if results["total_tested"] > 0:
@@ -247,78 +320,74 @@ class SystemTester:
             "score_distribution": {}
         }
         
+        # Properties with solar permits and non-owner-occupied properties
+        # are never leads, so drop them before joining
+        eligible_props = [
+            p for p in properties
+            if not p.get("has_solar_permit", False) and p.get("is_owner_occupied", True)
+        ]
+        
         # Create lookups
-        property_lookup = {p["property_id"]: p for p in properties}
         homeowner_lookup = {h["property_id"]: h for h in homeowners}
         roof_lookup = {r["property_id"]: r for r in roofs}
         utility_lookup = {u["property_id"]: u for u in utilities}
         
-        # Prepare data for lead scoring
-        leads_data = []
-        
-        for property_id, prop in property_lookup.items():
-            # Skip properties with solar permits
-            if prop.get("has_solar_permit", False):
-                continue
-                
-            # Skip non-owner-occupied properties
-            if not prop.get("is_owner_occupied", True):
-                continue
-                
-            homeowner = homeowner_lookup.get(property_id)
-            roof = roof_lookup.get(property_id)
-            utility = utility_lookup.get(property_id)
-            
-            if homeowner and roof and utility:
-                leads_data.append({
-                    "property_data": prop,
-                    "owner_data": homeowner,
-                    "roof_data": roof,
-                    "utility_data": utility
-                })
-        
-        # Score leads in batch
-        batch_results = self.lead_scoring_service.batch_score_leads(leads_data)
+        # Join the four sources on property_id: a property becomes a lead
+        # when all three other sources have a record for it
+        joined_ids = homeowner_lookup.keys() & roof_lookup.keys() & utility_lookup.keys()
+        
+        # Prepare data for lead scoring, as plain tuples in LeadBundle field
+        # order (property, owner, roof, utility)
+        leads_data = [
+            (
+                prop,
+                homeowner_lookup[prop["property_id"]],
+                roof_lookup[prop["property_id"]],
+                utility_lookup[prop["property_id"]]
+            )
+            for prop in eligible_props
+            if prop["property_id"] in joined_ids
+        ]
+        
+        # Score leads in batch on the columnar path: encode once, score with
+        # the compiled kernel and only expand the examples into dictionaries
+        columns = self.lead_scoring_service.encode_leads(leads_data)
+        batch_results = self.lead_scoring_service.batch_score_leads(columns, return_full=False)
+        batch_scores = batch_results["scores"]
         
         # Process results
-        results["total_tested"] = len(batch_results["results"])
-        
-        for lead_result in batch_results["results"]:
-            if "lead_score" in lead_result:
-                score = lead_result["lead_score"].get("overall_score", 0)
-                qualification = lead_result["lead_score"].get("qualification", "unknown")
-                
-                # Count by qualification
-                if qualification == "excellent":
-                    results["excellent_count"] += 1
-                elif qualification == "good":
-                    results["good_count"] += 1
-                elif qualification == "average":
-                    results["average_count"] += 1
-                elif qualification == "poor":
-                    results["poor_count"] += 1
-                elif qualification == "unsuitable":
-                    results["unsuitable_count"] += 1
-                
-                # Track score distribution
-                score_range = f"{(score // 10) * 10}-{(score // 10) * 10 + 9}"
-                results["score_distribution"][score_range] = results["score_distribution"].get(score_range, 0) + 1
-                
-                # Add example
-                if len(results["examples"]) < 10:
-                    property_id = lead_result["lead_score"].get("property_id", "unknown")
-                    prop = property_lookup.get(property_id, {})
-                    utility = utility_lookup.get(property_id, {})
-                    
-                    results["examples"].append({
-                        "property_id": property_id,
-                        "address": prop.get("address_line_1", "Unknown"),
-                        "city": prop.get("city", "Unknown"),
-                        "overall_score": score,
-                        "qualification": qualification,
-                        "estimated_bill": utility.get("estimated_monthly_bill", 0),
-                        "component_scores": lead_result["lead_score"].get("component_scores", {})
-                    })
+        results["total_tested"] = len(batch_scores["overall_score"])
+        
+        # Count by qualification
+        labels, counts = np.unique(batch_scores["qualification"], return_counts=True)
+        for qualification, count in zip(labels.tolist(), counts.tolist()):
+            if f"{qualification}_count" in results:
+                results[f"{qualification}_count"] = count
+        
+        # Track score distribution in 10-point ranges
+        range_counts = np.bincount(batch_scores["overall_score"] // 10, minlength=11).tolist()
+        results["score_distribution"] = {f"{i * 10}-{i * 10 + 9}": count for i, count in enumerate(range_counts) if count}
+        
+        # Add examples, expanding only their scores into dictionaries
+        lead_scores = self.lead_scoring_service.lead_engine.to_records(
+            {key: column[:10] for key, column in batch_scores.items()}
+        )
+        example_ids = {lead_score["property_id"] for lead_score in lead_scores}
+        property_lookup = {p["property_id"]: p for p in eligible_props if p["property_id"] in example_ids}
+        for lead_score in lead_scores:
+            property_id = lead_score.get("property_id", "unknown")
+            prop = property_lookup.get(property_id, {})
+            utility = utility_lookup.get(property_id, {})
+            
+            results["examples"].append({
+                "property_id": property_id,
+                "address": prop.get("address_line_1", "Unknown"),
+                "city": prop.get("city", "Unknown"),
+                "overall_score": lead_score.get("overall_score", 0),
+                "qualification": lead_score.get("qualification", "unknown"),
+                "estimated_bill": utility.get("estimated_monthly_bill", 0),
+                "component_scores": lead_score.get("component_scores", {})
+            })
         
         # Calculate percentages
         if results["total_tested"] > 0:
@@ -348,11 +417,10 @@ class SystemTester:
             "examples": []
         }
         
-        db_path = os.path.join(self.test_data_dir, self.db_file)
-        
         try:
-            # Connect to database
-            conn = sqlite3.connect(db_path)
+            # Reuse the tester's connection and its warm page cache
+            conn = self._get_conn()
+            self._ensure_indexes(conn)
             cursor = conn.cursor()
             
             # Test query 1: Count properties by city
@@ -362,47 +430,180 @@ class SystemTester:
             GROUP BY city
             ORDER BY count DESC
             ''')
-            query1_result = cursor.fetchall()
+            query1_result = [dict(row) for row in cursor]
             
             results["queries_tested"] += 1
-            if query1_result and len(query1_result) > 0:
+            if query1_result:
                 results["queries_passed"] += 1
                 results["examples"].append({
                     "query": "Count properties by city",
-                    "result": [{"city": city, "count": count} for city, count in query1_result]
+                    "result": query1_result
                 })
             
             # Test query 2: Find properties with high bills
             cursor.execute('''
-            SELECT p.property_id, p.address_line_1, p.city, u.estimated_monthly_bill
+            SELECT p.property_id, p.address_line_1 AS address, p.city, u.estimated_monthly_bill AS bill
             FROM properties p
             JOIN utilities u ON p.property_id = u.property_id
             WHERE u.estimated_monthly_bill > 150
             ORDER BY u.estimated_monthly_bill DESC
             LIMIT 5
             ''')
-            query2_result = cursor.fetchall()
+            query2_result = [dict(row) for row in cursor]
             
             results["queries_tested"] += 1
-            if query2_result and len(query2_result) > 0:
+            if query2_result:
                 results["queries_passed"] += 1
                 results["examples"].append({
                     "query": "Find properties with high bills",
-                    "result": [{"property_id": pid, "address": addr, "city": city, "bill": bill} 
-                              for pid, addr, city, bill in query2_result]
+                    "result": query2_result
                 })
             
             # Test query 3: Find south-facing roofs
             cursor.execute('''
-            SELECT p.property_id, p.address_line_1, r.primary_orientation, r.usable_roof_area
+            SELECT p.property_id, p.address_line_1 AS address, r.primary_orientation AS orientation,
+                   r.usable_roof_area AS usable_area
             FROM properties p
             JOIN roofs r ON p.property_id = r.property_id
             WHERE r.primary_orientation IN ('S', 'SE', 'SW')
             AND p.has_solar_permit = 0
             LIMIT 5
             ''')
-            query3_result = cursor.fetchall()
+            query3_result = [dict(row) for row in cursor]
             
             results["queries_tested"] += 1
-            if query3_result and len(quer
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+            if query3_result:
+                results["queries_passed"] += 1
+                results["examples"].append({
+                    "query": "Find south-facing roofs without solar",
+                    "result": query3_result
+                })
+            
+        except Exception as e:
+            logger.error(f"Error testing database integration: {e}")
+            results["error"] = str(e)
+        
+        # Calculate pass rate
+        if results["queries_tested"] > 0:
+            results["pass_rate"] = round(results["queries_passed"] / results["queries_tested"] * 100, 2)
+        
+        return results
+    
+    def _get_conn(self):
+        """
+        Get the tester's database connection, opening it on first use.
+        
+        The connection is in autocommit mode with WAL journaling and a 20 MB
+        page cache, and may be used from the test worker threads (one at a
+        time).
+        
+        Returns:
+            sqlite3.Connection returning sqlite3.Row rows
+        """
+        if self._db_conn is None:
+            db_path = os.path.join(self.test_data_dir, self.db_file)
+            conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.row_factory = sqlite3.Row
+            self._db_conn = conn
+        return self._db_conn
+    
+    def close(self):
+        """Close the tester's database connection, if open."""
+        if self._db_conn is not None:
+            self._db_conn.close()
+            self._db_conn = None
+    
+    def __del__(self):
+        self.close()
+    
+    def _ensure_indexes(self, conn):
+        """
+        Create the indexes the integration queries filter and sort on.
+        
+        Args:
+            conn: Open connection to the test database
+        """
+        conn.executescript('''
+        CREATE INDEX IF NOT EXISTS idx_util_bill ON utilities(estimated_monthly_bill DESC);
+        CREATE INDEX IF NOT EXISTS idx_roof_orient ON roofs(primary_orientation, property_id);
+        CREATE INDEX IF NOT EXISTS idx_prop_solar ON properties(has_solar_permit, city);
+        ''')
+    
+    def run_all(self, data):
+        """
+        Run every component test concurrently on already generated data.
+        
+        The tests only read the shared data, and the database test opens
+        its own connection in its worker thread.
+        
+        Args:
+            data: Dictionary returned by generate_test_data
+            
+        Returns:
+            Dictionary with the results of each test
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "bill_estimator": executor.submit(self.test_bill_estimator, data["properties"], data["utilities"]),
+                "roof_analyzer": executor.submit(self.test_roof_analyzer, data["properties"], data["roofs"]),
+                "lead_scoring": executor.submit(
+                    self.test_lead_scoring, data["properties"], data["homeowners"], data["roofs"], data["utilities"]
+                ),
+                "database_integration": executor.submit(self.test_database_integration)
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
+    def run_all_tests(self, count=100):
+        """
+        Generate test data, run every component test and save the results.
+        
+        Args:
+            count: Number of properties to generate
+            
+        Returns:
+            Dictionary with the results of each test
+        """
+        logger.info("Running all system tests")
+        start_time = datetime.now()
+        
+        data = self.generate_test_data(count)
+        
+        results = {
+            "timestamp": start_time.isoformat(),
+            "record_count": count
+        }
+        results.update(self.run_all(data))
+        results["duration_seconds"] = round((datetime.now() - start_time).total_seconds(), 2)
+        
+        # Save results
+        results_file = os.path.join(self.test_data_dir, "test_results.json")
+        if orjson is not None:
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(results, f, indent=2)
+        logger.info(f"Saved test results to {results_file}")
+        
+        return results
+
+
+def main():
+    """Run the system tests and print a summary."""
+    tester = SystemTester()
+    results = tester.run_all_tests(100)
+    
+    print("\nSystem Test Summary")
+    print("===================")
+    print(f"Bill estimator accuracy (within 10%): {results['bill_estimator'].get('accuracy_10_percent', 0)}%")
+    print(f"Bill estimator accuracy (within 20%): {results['bill_estimator'].get('accuracy_20_percent', 0)}%")
+    print(f"Roofs analyzed: {results['roof_analyzer']['total_tested']}")
+    print(f"Leads scored: {results['lead_scoring']['total_tested']}")
+    print(f"Database queries passed: {results['database_integration']['queries_passed']}/{results['database_integration']['queries_tested']}")
+    print(f"Completed in {results['duration_seconds']} seconds")
+
+
+if __name__ == "__main__":
+    main()
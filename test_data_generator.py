@@ -4,21 +4,108 @@ Creates realistic sample data for testing the system.
 """
 
 import logging
-import random
 import json
 import os
 import sqlite3
 import csv
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
+from operator import itemgetter
 import numpy as np
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+try:
+    import orjson
+except ImportError:
+    # Generated records are encoded with the standard library
+    orjson = None
+
+# Handlers and levels are left to the application entry point
 logger = logging.getLogger(__name__)
 
+# Database column order of each generated record type
+_TABLE_FIELDS = {
+    "properties": (
+        "property_id", "address_line_1", "city", "state", "zip_code", "latitude", "longitude",
+        "year_built", "square_footage", "bedrooms", "bathrooms", "property_type",
+        "is_owner_occupied", "property_value", "has_solar_permit", "last_sale_date"
+    ),
+    "homeowners": (
+        "property_id", "first_name", "last_name", "full_name", "phone", "email",
+        "ownership_years", "do_not_call"
+    ),
+    "roofs": (
+        "property_id", "roof_type", "roof_age", "total_roof_area", "usable_roof_area",
+        "primary_orientation", "azimuth", "pitch", "shading_percentage", "roof_condition"
+    ),
+    "utilities": (
+        "property_id", "utility_provider", "residential", "estimated_monthly_bill", "net_metering_available"
+    )
+}
+
+
+# Roof condition by roof age: below 3, 8, 15 and 20 years, then older
+_ROOF_AGE_BOUNDS = np.array([3, 8, 15, 20])
+
+# Azimuth in degrees of each roof orientation, index-aligned with
+# TestDataGenerator.roof_orientations (N, NE, E, SE, S, SW, W, NW)
+_ROOF_AZIMUTHS = np.array([0, 45, 90, 135, 180, 225, 270, 315])
+
+# Orientation indices of the SE, S and SW roofs that get extra usable area
+_SOUTH_FACING = (3, 4, 5)
+
+# Seasonal bill factor by month (index 0 unused): summer months in Texas
+# run highest, winter months slightly above the spring/fall baseline
+_SEASONAL_FACTORS = (1.0, 1.1, 1.1, 1.0, 1.0, 1.0, 1.3, 1.3, 1.3, 1.3, 1.0, 1.0, 1.1)
+
+
+def _numbered_ids(prefix, count, width=6):
+    """
+    Build the IDs prefix + 000001 ... for count records in one pass.
+    
+    Args:
+        prefix: ID prefix, e.g. "PROP-"
+        count: Number of IDs
+        width: Zero-padded width of the number
+        
+    Returns:
+        NumPy object array of ID strings
+    """
+    if not count:
+        # np.char.zfill cannot size an empty array
+        return np.empty(0, dtype=object)
+    return np.char.add(prefix, np.char.zfill(np.arange(1, count + 1).astype(str), width)).astype(object)
+
+
+def _write_json_records(records, output_file):
+    """
+    Write records to a JSON array file one record at a time.
+    
+    Each record is encoded on its own line, so the whole array is never
+    held in memory as one string and records may come from a generator.
+    
+    Args:
+        records: Iterable of JSON-serializable dictionaries
+        output_file: Path of the file to write
+        
+    Returns:
+        Number of records written
+    """
+    if orjson is not None:
+        dumps = functools.partial(orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        dumps = lambda record: json.dumps(record).encode('utf-8')
+    
+    count = 0
+    with open(output_file, 'wb') as f:
+        f.write(b'[')
+        for record in records:
+            f.write(b',\n' if count else b'\n')
+            f.write(dumps(record))
+            count += 1
+        f.write(b'\n]\n')
+    return count
+
+
 class TestDataGenerator:
     """Class to generate test data for the Solar Lead Generation System."""
     
@@ -50,6 +137,28 @@ class TestDataGenerator:
             {"name": "El Paso Electric", "cities": ["El Paso"], "rate": 0.13, "net_metering": False}
         ]
         
+        # Provider serving each city (the first listed one, if several do)
+        self._city_to_provider = {}
+        for provider in self.utility_providers:
+            for city in provider["cities"]:
+                self._city_to_provider.setdefault(city, provider)
+        
+        # City fields as arrays by city position, so generated properties
+        # look their city up by index rather than through the dictionaries
+        cities = self.texas_cities
+        self._city_names = np.array([city["name"] for city in cities], dtype=object)
+        self._city_lats = np.array([city["lat"] for city in cities])
+        self._city_lngs = np.array([city["lng"] for city in cities])
+        self._city_zip_counts = np.array([len(city["zip_codes"]) for city in cities])
+        self._city_zip_offsets = np.cumsum(self._city_zip_counts) - self._city_zip_counts
+        self._zip_codes = np.array([zip_code for city in cities for zip_code in city["zip_codes"]], dtype=object)
+        
+        # Property value location factor by city
+        self._city_location_factors = np.array([
+            1.3 if city["name"] in ["Austin", "Dallas"] else 1.1 if city["name"] in ["Houston", "San Antonio"] else 1.0
+            for city in cities
+        ])
+        
         # Common street names
         self.street_names = [
             "Main", "Oak", "Pine", "Maple", "Cedar", "Elm", "Washington", "Lake", "Hill", 
@@ -90,90 +199,110 @@ class TestDataGenerator:
         
         # Current date for reference
         self.current_date = datetime.now()
+        
+        # Parts of the reference date used by the generators, read once
+        self._year = self.current_date.year
+        self._month = self.current_date.month
+        self._today = np.datetime64(self.current_date.date(), 'D')
+        
+        # Random generator for the vectorized draws; a "seed" in the config
+        # makes the generated data reproducible
+        self._rng = np.random.default_rng(self.config.get("seed"))
     
-    def generate_properties(self, count=100, output_file=None):
+    def generate_property_columns(self, count=100):
         """
-        Generate sample property data.
+        Generate sample property data as columns.
         
         Args:
             count: Number of properties to generate
-            output_file: Optional file path to save the data
             
         Returns:
-            List of property dictionaries
+            Dictionary of NumPy arrays, one per property field, in the field
+            order of the property dictionaries
         """
         logger.info(f"Generating {count} sample properties")
         
-        properties = []
+        rng = self._rng
         
-        for i in range(count):
-            # Select a random city
-            city = random.choice(self.texas_cities)
-            
-            # Generate coordinates with some random variation
-            lat_variation = random.uniform(-0.05, 0.05)
-            lng_variation = random.uniform(-0.05, 0.05)
-            latitude = city["lat"] + lat_variation
-            longitude = city["lng"] + lng_variation
-            
-            # Generate address
-            street_number = random.randint(100, 9999)
-            street_name = random.choice(self.street_names)
-            street_type = random.choice(self.street_types)
-            zip_code = random.choice(city["zip_codes"])
-            
-            # Generate property characteristics
-            year_built = random.randint(1950, 2020)
-            square_footage = random.randint(1000, 4000)
-            bedrooms = random.randint(2, 5)
-            bathrooms = random.randint(1, 4)
-            
-            # Determine if it's a single-family home (90% chance)
-            is_single_family = random.random() < 0.9
-            
-            # Determine if it's owner-occupied (80% chance)
-            is_owner_occupied = random.random() < 0.8
-            
-            # Generate property value based on size, age, and location
-            base_value = square_footage * 100
-            age_factor = max(0.5, 1 - (self.current_date.year - year_built) / 100)
-            location_factor = 1.0
-            if city["name"] in ["Austin", "Dallas"]:
-                location_factor = 1.3
-            elif city["name"] in ["Houston", "San Antonio"]:
-                location_factor = 1.1
-            
-            property_value = int(base_value * age_factor * location_factor)
-            
-            # Generate a property ID
-            property_id = f"PROP-{i+1:06d}"
+        # Draw every random field for all properties at once
+        city_idx = rng.integers(0, len(self._city_names), count)
+        latitude = self._city_lats[city_idx] + rng.uniform(-0.05, 0.05, count)
+        longitude = self._city_lngs[city_idx] + rng.uniform(-0.05, 0.05, count)
+        
+        street_number = rng.integers(100, 10000, count)
+        street_names = np.array(self.street_names, dtype=object)[rng.integers(0, len(self.street_names), count)]
+        street_types = np.array(self.street_types, dtype=object)[rng.integers(0, len(self.street_types), count)]
+        zip_idx = (rng.random(count) * self._city_zip_counts[city_idx]).astype(np.int64)
+        
+        year_built = rng.integers(1950, 2021, count)
+        square_footage = rng.integers(1000, 4001, count)
+        bedrooms = rng.integers(2, 6, count)
+        bathrooms = rng.integers(1, 5, count)
+        
+        # Single-family homes (90%), owner-occupied (80%), solar permits (5%)
+        is_single_family = rng.random(count) < 0.9
+        is_owner_occupied = rng.random(count) < 0.8
+        has_solar_permit = rng.random(count) < 0.05
+        
+        # Property value based on size, age, and location
+        age_factor = np.maximum(0.5, 1 - (self._year - year_built) / 100)
+        property_value = (square_footage * 100 * age_factor * self._city_location_factors[city_idx]).astype(np.int64)
+        
+        # Last sale 30 days to 10 years ago, formatted as YYYY-MM-DD
+        last_sale_date = (self._today - rng.integers(30, 3651, count)).astype(str).astype(object)
+        
+        return {
+            "property_id": _numbered_ids("PROP-", count),
+            "address_line_1": np.array([
+                f"{number} {name} {street_type}"
+                for number, name, street_type in zip(street_number.tolist(), street_names.tolist(), street_types.tolist())
+            ], dtype=object),
+            "city": self._city_names[city_idx],
+            "state": np.full(count, "TX", dtype=object),
+            "zip_code": self._zip_codes[self._city_zip_offsets[city_idx] + zip_idx],
+            "latitude": latitude,
+            "longitude": longitude,
+            "year_built": year_built,
+            "square_footage": square_footage,
+            "bedrooms": bedrooms,
+            "bathrooms": bathrooms,
+            "property_type": np.where(is_single_family, "Single-Family", "Multi-Family").astype(object),
+            "is_owner_occupied": is_owner_occupied,
+            "property_value": property_value,
+            "has_solar_permit": has_solar_permit,
+            "last_sale_date": last_sale_date
+        }
+    
+    @staticmethod
+    def to_records(columns):
+        """
+        Materialize columns from a generate_*_columns method as dictionaries.
+        
+        Args:
+            columns: Dictionary of equal-length NumPy arrays
             
-            # Create property dictionary
-            property_data = {
-                "property_id": property_id,
-                "address_line_1": f"{street_number} {street_name} {street_type}",
-                "city": city["name"],
-                "state": "TX",
-                "zip_code": zip_code,
-                "latitude": latitude,
-                "longitude": longitude,
-                "year_built": year_built,
-                "square_footage": square_footage,
-                "bedrooms": bedrooms,
-                "bathrooms": bathrooms,
-                "property_type": "Single-Family" if is_single_family else "Multi-Family",
-                "is_owner_occupied": is_owner_occupied,
-                "property_value": property_value,
-                "has_solar_permit": random.random() < 0.05,  # 5% chance of having a solar permit
-                "last_sale_date": (self.current_date - timedelta(days=random.randint(30, 3650))).strftime("%Y-%m-%d")
-            }
+        Returns:
+            List of dictionaries with plain Python values, one per row
+        """
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*(columns[name].tolist() for name in names))]
+    
+    def generate_properties(self, count=100, output_file=None):
+        """
+        Generate sample property data.
+        
+        Args:
+            count: Number of properties to generate
+            output_file: Optional file path to save the data
             
-            properties.append(property_data)
+        Returns:
+            List of property dictionaries
+        """
+        properties = self.to_records(self.generate_property_columns(count))
         
         # Save to file if specified
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(properties, f, indent=2)
+            _write_json_records(properties, output_file)
             logger.info(f"Saved {count} properties to {output_file}")
         
         return properties
@@ -189,49 +318,15 @@ class TestDataGenerator:
         Returns:
             List of homeowner dictionaries
         """
-        logger.info(f"Generating homeowner data for {len(properties)} properties")
-        
-        homeowners = []
-        
-        for property_data in properties:
-            # Skip if not owner-occupied
-            if not property_data.get("is_owner_occupied", True):
-                continue
-            
-            # Generate homeowner name
-            first_name = random.choice(self.first_names)
-            last_name = random.choice(self.last_names)
-            
-            # Generate contact information
-            phone = f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}"
-            email_domain = random.choice(self.email_domains)
-            email = f"{first_name.lower()}.{last_name.lower()}@{email_domain}"
-            
-            # Calculate length of ownership based on last sale date
-            last_sale_date = datetime.strptime(property_data["last_sale_date"], "%Y-%m-%d")
-            ownership_years = (self.current_date - last_sale_date).days / 365
-            
-            # Determine if on do-not-call list (10% chance)
-            do_not_call = random.random() < 0.1
-            
-            # Create homeowner dictionary
-            homeowner_data = {
-                "property_id": property_data["property_id"],
-                "first_name": first_name,
-                "last_name": last_name,
-                "full_name": f"{first_name} {last_name}",
-                "phone": phone,
-                "email": email,
-                "ownership_years": round(ownership_years, 1),
-                "do_not_call": do_not_call
-            }
-            
-            homeowners.append(homeowner_data)
+        homeowners = self._homeowner_records({
+            "property_id": np.array([p["property_id"] for p in properties]),
+            "is_owner_occupied": np.array([p.get("is_owner_occupied", True) for p in properties], dtype=bool),
+            "last_sale_date": np.array([p["last_sale_date"] for p in properties])
+        })
         
         # Save to file if specified
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(homeowners, f, indent=2)
+            _write_json_records(homeowners, output_file)
             logger.info(f"Saved {len(homeowners)} homeowners to {output_file}")
         
         return homeowners
@@ -247,89 +342,12 @@ class TestDataGenerator:
         Returns:
             List of roof data dictionaries
         """
-        logger.info(f"Generating roof data for {len(properties)} properties")
-        
-        roof_data_list = []
-        
-        for property_data in properties:
-            # Generate roof characteristics
-            roof_type = random.choice(self.roof_types)
-            
-            # Determine roof age (typically younger than the house)
-            property_age = self.current_date.year - property_data["year_built"]
-            roof_age = min(property_age, random.randint(0, 25))
-            
-            # Calculate total roof area based on square footage
-            total_roof_area = property_data["square_footage"] * random.uniform(1.1, 1.4)
-            
-            # South-facing roofs are more common in newer homes
-            if property_data["year_built"] > 2000:
-                orientation_weights = [0.05, 0.05, 0.05, 0.15, 0.4, 0.15, 0.05, 0.1]  # Higher weight for South
-            else:
-                orientation_weights = [0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125]  # Equal weights
-            
-            primary_orientation = random.choices(self.roof_orientations, weights=orientation_weights, k=1)[0]
-            
-            # Convert orientation to azimuth
-            orientation_to_azimuth = {
-                "N": 0, "NE": 45, "E": 90, "SE": 135, 
-                "S": 180, "SW": 225, "W": 270, "NW": 315
-            }
-            azimuth = orientation_to_azimuth[primary_orientation] + random.randint(-10, 10)
-            
-            # Generate pitch (steeper in northern areas)
-            if property_data["city"] in ["Dallas", "Fort Worth"]:
-                pitch = random.randint(20, 40)
-            else:
-                pitch = random.randint(15, 30)
-            
-            # Calculate usable area (less for older roofs and non-south facing)
-            usable_factor = 0.7  # Base factor
-            if primary_orientation in ["S", "SE", "SW"]:
-                usable_factor += 0.1
-            if roof_age < 10:
-                usable_factor += 0.1
-            
-            usable_roof_area = total_roof_area * usable_factor
-            
-            # Generate shading percentage (higher for older neighborhoods)
-            if property_data["year_built"] < 1980:
-                shading_percentage = random.randint(10, 40)
-            else:
-                shading_percentage = random.randint(5, 25)
-            
-            # Determine roof condition based on age
-            if roof_age < 3:
-                condition = "excellent"
-            elif roof_age < 8:
-                condition = "good"
-            elif roof_age < 15:
-                condition = "fair"
-            elif roof_age < 20:
-                condition = "poor"
-            else:
-                condition = "very poor"
-            
-            # Create roof data dictionary
-            roof_data = {
-                "property_id": property_data["property_id"],
-                "roof_type": roof_type,
-                "roof_age": roof_age,
-                "total_roof_area": round(total_roof_area),
-                "usable_roof_area": round(usable_roof_area),
-                "primary_orientation": primary_orientation,
-                "azimuth": azimuth,
-                "pitch": pitch,
-                "shading_percentage": shading_percentage,
-                "roof_condition": condition
-            }
-            
-            roof_data_list.append(roof_data)
+        columns = self._property_fields(properties, "property_id", "city", "year_built", "square_footage")
+        roof_data_list = self._roof_records(columns, self._year - columns["year_built"])
         
         # Save to file if specified
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(roof_data_list, f, indent=2)
+            _write_json_records(roof_data_list, output_file)
             logger.info(f"Saved {len(roof_data_list)} roof data records to {output_file}")
         
         return roof_data_list
@@ -345,37 +363,363 @@ class TestDataGenerator:
         Returns:
             List of utility data dictionaries
         """
-        logger.info(f"Generating utility data for {len(properties)} properties")
+        columns = self._property_fields(properties, "property_id", "city", "year_built", "square_footage")
+        utility_data_list = self._utility_records(columns, self._year - columns["year_built"])
+        
+        # Save to file if specified
+        if output_file:
+            _write_json_records(utility_data_list, output_file)
+            logger.info(f"Saved {len(utility_data_list)} utility data records to {output_file}")
+        
+        return utility_data_list
+    
+    def generate_all(self, count=100):
+        """
+        Generate a linked set of test data in one pass over the properties.
         
-        utility_data_list = []
+        The property columns are generated once and shared by the homeowner,
+        roof and utility generators, which read them directly instead of
+        going back through the property dictionaries. Draws happen in the
+        same order as calling generate_properties, generate_homeowners,
+        generate_roof_data and generate_utility_data in turn.
         
-        for property_data in properties:
-            # Find the utility provider for this city
-            city = property_data["city"]
-            provider = None
+        Args:
+            count: Number of properties to generate
             
-            for util in self.utility_providers:
-                if city in util["cities"]:
-                    provider = util
-                    break
+        Returns:
+            Dictionary with properties, homeowners, roofs and utilities lists
+        """
+        columns = self.generate_property_columns(count)
+        property_age = self._year - columns["year_built"]
+        
+        return {
+            "properties": self.to_records(columns),
+            "homeowners": self._homeowner_records(columns),
+            "roofs": self._roof_records(columns, property_age),
+            "utilities": self._utility_records(columns, property_age)
+        }
+    
+    @staticmethod
+    def _property_fields(properties, *fields):
+        """
+        Gather fields of property dictionaries into columns.
+        
+        Args:
+            properties: List of property dictionaries
+            *fields: Names of the fields to gather
             
-            # If no specific provider found, use a random one
-            if not provider:
-                provider = random.choice(self.utility_providers)
+        Returns:
+            Dictionary of NumPy arrays, one per field
+        """
+        return {field: np.array([p[field] for p in properties]) for field in fields}
+    
+    def _homeowner_records(self, columns):
+        """
+        Generate homeowner dictionaries from property columns.
+        
+        Every field is drawn for all owner-occupied properties at once.
+        
+        Args:
+            columns: Mapping with property_id, is_owner_occupied and
+                last_sale_date arrays
             
-            # Calculate base rate with some variation
-            base_rate = provider["rate"] * random.uniform(0.95, 1.05)
+        Returns:
+            List of homeowner dictionaries, one per owner-occupied property
+        """
+        logger.info(f"Generating homeowner data for {len(columns['property_id'])} properties")
+        
+        # Only owner-occupied properties get a homeowner
+        owned = columns["is_owner_occupied"]
+        count = int(np.count_nonzero(owned))
+        rng = self._rng
+        
+        # Generate homeowner names
+        first_idx = rng.integers(0, len(self.first_names), count)
+        last_idx = rng.integers(0, len(self.last_names), count)
+        first_names = np.array(self.first_names, dtype=object)[first_idx].tolist()
+        last_names = np.array(self.last_names, dtype=object)[last_idx].tolist()
+        
+        # Generate contact information (f-strings build these faster than np.char)
+        phones = [
+            f"({area}) {exchange}-{line}"
+            for area, exchange, line in zip(
+                rng.integers(200, 1000, count).tolist(),
+                rng.integers(200, 1000, count).tolist(),
+                rng.integers(1000, 10000, count).tolist()
+            )
+        ]
+        first_lower = np.array([name.lower() for name in self.first_names], dtype=object)[first_idx].tolist()
+        last_lower = np.array([name.lower() for name in self.last_names], dtype=object)[last_idx].tolist()
+        domains = np.array(self.email_domains, dtype=object)[rng.integers(0, len(self.email_domains), count)].tolist()
+        
+        # Length of ownership based on last sale date
+        ownership_days = self._today - np.asarray(columns["last_sale_date"][owned]).astype('datetime64[D]')
+        
+        return self.to_records({
+            "property_id": np.asarray(columns["property_id"][owned], dtype=object),
+            "first_name": np.array(first_names, dtype=object),
+            "last_name": np.array(last_names, dtype=object),
+            "full_name": np.array([f"{first} {last}" for first, last in zip(first_names, last_names)], dtype=object),
+            "phone": np.array(phones, dtype=object),
+            "email": np.array([
+                f"{first}.{last}@{domain}" for first, last, domain in zip(first_lower, last_lower, domains)
+            ], dtype=object),
+            "ownership_years": np.round(ownership_days.astype(np.int64) / 365, 1),
+            # Do-not-call list (10% chance)
+            "do_not_call": rng.random(count) < 0.1
+        })
+    
+    def _roof_records(self, columns, property_age):
+        """
+        Generate roof data dictionaries from property columns.
+        
+        Args:
+            columns: Mapping with property_id, city, year_built and
+                square_footage arrays
+            property_age: Array of property ages in years
             
-            # Calculate estimated monthly bill based on property characteristics
-            # Larger and older homes have higher bills
-            base_bill = property_data["square_footage"] * 0.1
-            age_factor = 1 + max(0, (self.current_date.year - property_data["year_built"] - 10) / 100)
+        Returns:
+            List of roof data dictionaries, one per property
+        """
+        year_built = columns["year_built"]
+        count = len(year_built)
+        logger.info(f"Generating roof data for {count} properties")
+        
+        # South-facing roofs are more common in newer homes: draw all
+        # orientation indices up front, one weighted draw per age group
+        rng = self._rng
+        newer = year_built > 2000
+        orientation_idx = np.empty(count, dtype=np.intp)
+        orientation_idx[newer] = rng.choice(
+            len(_ROOF_AZIMUTHS), size=int(newer.sum()), p=[0.05, 0.05, 0.05, 0.15, 0.4, 0.15, 0.05, 0.1]
+        )
+        orientation_idx[~newer] = rng.choice(len(_ROOF_AZIMUTHS), size=int((~newer).sum()))  # Equal weights
+        azimuths = _ROOF_AZIMUTHS[orientation_idx] + rng.integers(-10, 11, count)
+        
+        # Determine roof age (typically younger than the house) and the
+        # condition that goes with it
+        roof_ages = np.minimum(property_age, rng.integers(0, 26, count))
+        conditions = np.array(self.roof_conditions, dtype=object)[np.searchsorted(_ROOF_AGE_BOUNDS, roof_ages, side='right')]
+        
+        # Calculate total roof area based on square footage
+        total_roof_area = columns["square_footage"] * rng.uniform(1.1, 1.4, count)
+        
+        # Generate pitch (steeper in northern areas)
+        northern = np.isin(columns["city"], ["Dallas", "Fort Worth"])
+        pitch = np.where(northern, rng.integers(20, 41, count), rng.integers(15, 31, count))
+        
+        # Calculate usable area (less for older roofs and non-south facing)
+        usable_factor = np.full(count, 0.7)  # Base factor
+        usable_factor[np.isin(orientation_idx, _SOUTH_FACING)] += 0.1
+        usable_factor[roof_ages < 10] += 0.1
+        
+        # Generate shading percentage (higher for older neighborhoods)
+        shading_percentage = np.where(year_built < 1980, rng.integers(10, 41, count), rng.integers(5, 26, count))
+        
+        return self.to_records({
+            "property_id": np.asarray(columns["property_id"], dtype=object),
+            "roof_type": np.array(self.roof_types, dtype=object)[rng.integers(0, len(self.roof_types), count)],
+            "roof_age": roof_ages,
+            "total_roof_area": np.rint(total_roof_area).astype(np.int64),
+            "usable_roof_area": np.rint(total_roof_area * usable_factor).astype(np.int64),
+            "primary_orientation": np.array(self.roof_orientations, dtype=object)[orientation_idx],
+            "azimuth": azimuths,
+            "pitch": pitch,
+            "shading_percentage": shading_percentage,
+            "roof_condition": conditions
+        })
+    
+    def _utility_records(self, columns, property_age):
+        """
+        Generate utility data dictionaries from property columns.
+        
+        Args:
+            columns: Mapping with property_id, city and square_footage arrays
+            property_age: Array of property ages in years
             
-            # Seasonal factors (assuming current month)
-            month = self.current_date.month
-            if month in [6, 7, 8, 9]:  # Summer months in Texas
-                seasonal_factor = 1.3
-            elif month in [12, 1, 2]:  # Winter months
-                seasonal_factor = 1.1
-            else: 
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+        Returns:
+            List of utility data dictionaries, one per property
+        """
+        count = len(property_age)
+        logger.info(f"Generating utility data for {count} properties")
+        
+        rng = self._rng
+        
+        # Find the utility provider for each city, or use a random one
+        fallback_idx = rng.integers(0, len(self.utility_providers), count)
+        providers = [
+            self._city_to_provider.get(city) or self.utility_providers[i]
+            for city, i in zip(columns["city"].tolist(), fallback_idx.tolist())
+        ]
+        
+        # Calculate base rate with some variation
+        base_rate = np.array([provider["rate"] for provider in providers]) * rng.uniform(0.95, 1.05, count)
+        
+        # Calculate estimated monthly bill based on property characteristics
+        # Larger and older homes have higher bills; seasonal factor assumes
+        # the current month
+        base_bill = columns["square_footage"] * 0.1
+        age_factor = 1 + np.maximum(0, (property_age - 10) / 100)
+        seasonal_factor = _SEASONAL_FACTORS[self._month]
+        estimated_monthly_bill = base_bill * age_factor * seasonal_factor * rng.uniform(0.85, 1.15, count)
+        
+        return self.to_records({
+            "property_id": np.asarray(columns["property_id"], dtype=object),
+            "utility_provider": np.array([provider["name"] for provider in providers], dtype=object),
+            "residential": np.round(base_rate, 4),
+            "estimated_monthly_bill": np.round(estimated_monthly_bill, 2),
+            "net_metering_available": np.array([provider["net_metering"] for provider in providers], dtype=bool)
+        })
+    
+    def generate_all_test_data(self, count=100, output_dir=None):
+        """
+        Generate a complete, linked set of test data.
+        
+        Args:
+            count: Number of properties to generate
+            output_dir: Optional directory to save the data files in
+        
+        Returns:
+            Dictionary with properties, homeowners, roofs and utilities lists
+        """
+        logger.info(f"Generating complete test data set with {count} properties")
+        
+        data = self.generate_all(count)
+        properties = data["properties"]
+        
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            for name, records in data.items():
+                output_file = os.path.join(output_dir, f"{name}.json")
+                _write_json_records(records, output_file)
+                logger.info(f"Saved {len(records)} {name} records to {output_file}")
+        
+        # Also export properties as CSV for the property import path
+        if output_dir and properties:
+            csv_file = os.path.join(output_dir, "properties.csv")
+            with open(csv_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=list(properties[0].keys()))
+                writer.writeheader()
+                writer.writerows(properties)
+            logger.info(f"Saved {len(properties)} properties to {csv_file}")
+        
+        return data
+    
+    def create_sqlite_database(self, data, db_file, conn=None):
+        """
+        Load generated test data into a SQLite database.
+        
+        Existing tables are dropped and recreated, so the database always
+        holds exactly the data passed in.
+        
+        Args:
+            data: Dictionary returned by generate_all_test_data
+            db_file: Path to the SQLite database file
+            conn: Optional open connection to load into instead of db_file;
+                the caller keeps ownership of it
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Creating SQLite database at {db_file}")
+        
+        own_conn = conn is None
+        try:
+            if own_conn:
+                conn = sqlite3.connect(db_file)
+            cursor = conn.cursor()
+            
+            cursor.executescript('''
+            DROP TABLE IF EXISTS properties;
+            DROP TABLE IF EXISTS homeowners;
+            DROP TABLE IF EXISTS roofs;
+            DROP TABLE IF EXISTS utilities;
+            
+            CREATE TABLE properties (
+                property_id TEXT PRIMARY KEY,
+                address_line_1 TEXT,
+                city TEXT,
+                state TEXT,
+                zip_code TEXT,
+                latitude REAL,
+                longitude REAL,
+                year_built INTEGER,
+                square_footage INTEGER,
+                bedrooms INTEGER,
+                bathrooms REAL,
+                property_type TEXT,
+                is_owner_occupied INTEGER,
+                property_value INTEGER,
+                has_solar_permit INTEGER,
+                last_sale_date TEXT
+            );
+            
+            CREATE TABLE homeowners (
+                property_id TEXT PRIMARY KEY,
+                first_name TEXT,
+                last_name TEXT,
+                full_name TEXT,
+                phone TEXT,
+                email TEXT,
+                ownership_years REAL,
+                do_not_call INTEGER
+            );
+            
+            CREATE TABLE roofs (
+                property_id TEXT PRIMARY KEY,
+                roof_type TEXT,
+                roof_age INTEGER,
+                total_roof_area INTEGER,
+                usable_roof_area INTEGER,
+                primary_orientation TEXT,
+                azimuth INTEGER,
+                pitch INTEGER,
+                shading_percentage INTEGER,
+                roof_condition TEXT
+            );
+            
+            CREATE TABLE utilities (
+                property_id TEXT PRIMARY KEY,
+                utility_provider TEXT,
+                residential REAL,
+                estimated_monthly_bill REAL,
+                net_metering_available INTEGER
+            );
+            ''')
+            
+            # One executemany per table, all in a single transaction
+            for table, fields in _TABLE_FIELDS.items():
+                placeholders = ", ".join("?" * len(fields))
+                cursor.executemany(
+                    f"INSERT INTO {table} VALUES ({placeholders})",
+                    map(itemgetter(*fields), data.get(table, []))
+                )
+            
+            conn.commit()
+            logger.info(f"Created SQLite database with {len(data.get('properties', []))} properties")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error creating SQLite database: {e}")
+            return False
+        
+        finally:
+            if own_conn and conn is not None:
+                conn.close()
+
+
+def main():
+    """Generate a test data set and load it into a SQLite database."""
+    generator = TestDataGenerator()
+    output_dir = "test_data"
+    
+    data = generator.generate_all_test_data(100, output_dir)
+    generator.create_sqlite_database(data, os.path.join(output_dir, "solar_leads.db"))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    main()
@@ -6,16 +6,62 @@ Handles fetching utility rate data from various sources.
 import requests
 import json
 import os
+import concurrent.futures
+import functools
+import random
 from datetime import datetime
 import logging
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Handlers and levels are left to the application entry point
 logger = logging.getLogger(__name__)
 
+_NREL_URL = "https://developer.nrel.gov/api/utility_rates/v3.json"
+
+# (connect, read) seconds for NREL requests
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# NREL lookups in flight at once during a bulk fetch
+_MAX_CONCURRENT_FETCHES = 16
+
+# Decimal places kept when caching rates by location (about 1 km); utility
+# service areas are far larger than that
+_COORD_DECIMALS = 2
+
+# Texas utilities with net metering or similar programs; mock data until
+# a database of utility policies is available
+_NET_METERING_UTILITIES = {
+    'Austin Energy': {
+        'has_net_metering': True,
+        'net_metering_rate': 0.097,
+        'notes': 'Value of Solar Tariff instead of traditional net metering'
+    },
+    'CPS Energy': {
+        'has_net_metering': True,
+        'net_metering_rate': 0.09,
+        'notes': 'Net billing at avoided cost rate'
+    },
+    'El Paso Electric': {
+        'has_net_metering': True,
+        'net_metering_rate': 0.08,
+        'notes': 'Limited net metering available'
+    },
+    'Green Mountain Energy': {
+        'has_net_metering': True,
+        'net_metering_rate': 0.11,
+        'notes': 'Renewable Rewards buyback program'
+    }
+}
+
+# Response for utilities without specific net metering programs
+_NO_NET_METERING = {
+    'has_net_metering': False,
+    'net_metering_rate': 0.0,
+    'notes': 'No net metering program available'
+}
+
 class UtilityDataCollector:
     """Class to collect utility data from various sources."""
     
@@ -23,6 +69,29 @@ class UtilityDataCollector:
         """Initialize with API keys for different services."""
         self.api_keys = api_keys or {}
         
+        # Keep-alive pool shared by the bulk fetch worker threads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_MAX_CONCURRENT_FETCHES,
+            pool_maxsize=2 * _MAX_CONCURRENT_FETCHES,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504))
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # NREL rates by rounded location, per collector so the key and session stay bound
+        self._cached_nrel_rates = functools.lru_cache(maxsize=4096)(self._request_nrel_rates)
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def fetch_utility_rates_by_location(self, latitude, longitude):
         """
         Fetch utility rates by geographic location using NREL API.
@@ -34,28 +103,14 @@ class UtilityDataCollector:
         Returns:
             Dictionary with utility rate data or None if not found
         """
-        logger.info(f"Fetching utility rates for location: {latitude}, {longitude}")
+        logger.debug("Fetching utility rates for location: %s, %s", latitude, longitude)
         
         try:
             # Check if we have an NREL API key
             if 'nrel' in self.api_keys:
-                api_key = self.api_keys['nrel']
-                
-                # Construct API URL and parameters for NREL Utility Rates API
-                url = "https://developer.nrel.gov/api/utility_rates/v3.json"
-                params = {
-                    "api_key": api_key,
-                    "lat": latitude,
-                    "lon": longitude
-                }
-                
-                # Make the API request
-                # response = requests.get(url, params=params)
-                # if response.status_code == 200:
-                #     return response.json().get('outputs', {})
-                
-                # For now, return mock data
-                return self._mock_utility_data(latitude, longitude)
+                rates = self._cached_nrel_rates(round(latitude, _COORD_DECIMALS), round(longitude, _COORD_DECIMALS))
+                # Callers add fields to the result, so hand out a copy of the cached dict
+                return dict(rates) if rates is not None else None
             else:
                 logger.warning("No NREL API key provided")
                 return self._mock_utility_data(latitude, longitude)
@@ -64,6 +119,55 @@ class UtilityDataCollector:
             logger.error(f"Error fetching utility rates: {e}")
             return None
     
+    def fetch_utility_rates_bulk(self, coords):
+        """
+        Fetch utility rates for many locations.
+        
+        With an NREL API key the lookups are network-bound, so up to
+        _MAX_CONCURRENT_FETCHES run at once on worker threads sharing the
+        session's connection pool.
+        
+        Args:
+            coords: Sequence of (latitude, longitude) pairs
+            
+        Returns:
+            List of utility rate dictionaries (or None), in input order
+        """
+        logger.info(f"Fetching utility rates for {len(coords)} locations")
+        
+        if 'nrel' in self.api_keys and len(coords) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_FETCHES) as executor:
+                return list(executor.map(lambda coord: self.fetch_utility_rates_by_location(*coord), coords))
+        
+        return [self.fetch_utility_rates_by_location(latitude, longitude) for latitude, longitude in coords]
+    
+    def _request_nrel_rates(self, latitude, longitude):
+        """
+        Request utility rates for a location from the NREL Utility Rates API.
+        
+        Called through the per-collector LRU cache with rounded coordinates.
+        
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+            
+        Returns:
+            Dictionary with utility rate data or None if not found
+        """
+        params = {
+            "api_key": self.api_keys['nrel'],
+            "lat": latitude,
+            "lon": longitude
+        }
+        
+        # Make the API request
+        # response = self._session.get(_NREL_URL, params=params, timeout=_REQUEST_TIMEOUT)
+        # if response.status_code == 200:
+        #     return response.json().get('outputs', {})
+        
+        # For now, return mock data
+        return self._mock_utility_data(latitude, longitude)
+    
     def fetch_utility_rates_by_zip(self, zip_code):
         """
         Fetch utility rates by ZIP code.
@@ -74,12 +178,11 @@ class UtilityDataCollector:
         Returns:
             Dictionary with utility rate data or None if not found
         """
-        logger.info(f"Fetching utility rates for ZIP code: {zip_code}")
+        logger.debug("Fetching utility rates for ZIP code: %s", zip_code)
         
         try:
             # In a real implementation, we would convert ZIP to lat/lon
             # For now, use mock coordinates for Texas
-            import random
             # Approximate coordinates for Texas
             latitude = 31.0 + random.uniform(-3, 3)
             longitude = -100.0 + random.uniform(-5, 5)
@@ -101,7 +204,7 @@ class UtilityDataCollector:
         Returns:
             Estimated monthly bill in dollars
         """
-        logger.info(f"Estimating monthly bill for {square_footage} sq ft home")
+        logger.debug("Estimating monthly bill for %s sq ft home", square_footage)
         
         try:
             # Default values if utility_rates not provided
@@ -121,7 +224,7 @@ class UtilityDataCollector:
             # Calculate estimated bill
             estimated_bill = monthly_usage * rate
             
-            logger.info(f"Estimated monthly bill: ${estimated_bill:.2f}")
+            logger.debug("Estimated monthly bill: $%.2f", estimated_bill)
             return estimated_bill
             
         except Exception as e:
@@ -137,45 +240,10 @@ class UtilityDataCollector:
             state: State code (default: TX for Texas)
             
         Returns:
-            Dictionary with net metering information
-        """
-        logger.info(f"Checking net metering for {utility_provider} in {state}")
-        
-        # This would typically involve checking a database of utility policies
-        # For now, return mock data based on common Texas utilities
-        
-        # Texas utilities with net metering or similar programs
-        net_metering_utilities = {
-            'Austin Energy': {
-                'has_net_metering': True,
-                'net_metering_rate': 0.097,
-                'notes': 'Value of Solar Tariff instead of traditional net metering'
-            },
-            'CPS Energy': {
-                'has_net_metering': True,
-                'net_metering_rate': 0.09,
-                'notes': 'Net billing at avoided cost rate'
-            },
-            'El Paso Electric': {
-                'has_net_metering': True,
-                'net_metering_rate': 0.08,
-                'notes': 'Limited net metering available'
-            },
-            'Green Mountain Energy': {
-                'has_net_metering': True,
-                'net_metering_rate': 0.11,
-                'notes': 'Renewable Rewards buyback program'
-            }
-        }
-        
-        # Default response for utilities without specific net metering programs
-        default_response = {
-            'has_net_metering': False,
-            'net_metering_rate': 0.0,
-            'notes': 'No net metering program available'
-        }
-        
-        return net_metering_utilities.get(utility_provider, default_response)
+            Dictionary with net metering information, shared between calls
+            so it must not be modified
+        """
+        return _NET_METERING_UTILITIES.get(utility_provider, _NO_NET_METERING)
     
     def get_utility_provider_by_location(self, latitude, longitude):
         """
@@ -188,7 +256,7 @@ class UtilityDataCollector:
         Returns:
             Name of the utility provider
         """
-        logger.info(f"Finding utility provider for location: {latitude}, {longitude}")
+        logger.debug("Finding utility provider for location: %s, %s", latitude, longitude)
         
         # This would typically involve checking a geospatial database of utility service areas
         # For now, return a mock result based on Texas regions
@@ -211,10 +279,37 @@ class UtilityDataCollector:
             # Default to a common retail provider
             return "Green Mountain Energy"
     
+    def get_utility_provider_by_location_batch(self, latitudes, longitudes):
+        """
+        Determine the utility providers for many locations at once.
+        
+        Applies the same regions as get_utility_provider_by_location, in the
+        same order, to whole coordinate arrays.
+        
+        Args:
+            latitudes: Sequence or array of latitude coordinates
+            longitudes: Sequence or array of longitude coordinates
+            
+        Returns:
+            NumPy object array of utility provider names
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        logger.info(f"Finding utility providers for {latitudes.size} locations")
+        
+        # np.select takes the first matching region, like the if/elif chain
+        regions = [
+            (latitudes > 30.2) & (longitudes > -97.8),
+            (latitudes > 29.3) & (longitudes > -98.6),
+            (latitudes > 31.7) & (longitudes < -106.3),
+            (latitudes > 29.5) & (longitudes > -95.5),
+            (latitudes > 32.7) & (longitudes > -96.8)
+        ]
+        providers = ["Austin Energy", "CPS Energy", "El Paso Electric", "Centerpoint Energy", "Oncor Electric"]
+        return np.select(regions, providers, default="Green Mountain Energy").astype(object)
+    
     def _mock_utility_data(self, latitude, longitude):
         """Generate mock utility data for testing."""
-        import random
-        
         # Determine utility provider based on location
         utility_provider = self.get_utility_provider_by_location(latitude, longitude)
         
@@ -238,3 +333,47 @@ class UtilityDataCollector:
             'net_metering_rate': net_metering_info['net_metering_rate'],
             'data_source': 'mock_data'
         }
+    
+    def _mock_utility_data_batch(self, latitudes, longitudes, seed=None):
+        """
+        Generate mock utility data for many locations at once.
+        
+        Each rate is drawn for the whole batch in one NumPy call, from the
+        same distributions as _mock_utility_data.
+        
+        Args:
+            latitudes: Sequence or array of latitude coordinates
+            longitudes: Sequence or array of longitude coordinates
+            seed: Optional seed for reproducible batches
+            
+        Returns:
+            Dictionary of NumPy arrays keyed like _mock_utility_data's fields
+        """
+        rng = np.random.default_rng(seed)
+        
+        utility_provider = self.get_utility_provider_by_location_batch(latitudes, longitudes)
+        n = utility_provider.size
+        
+        residential_rate = rng.uniform(0.09, 0.15, n)
+        commercial_rate = rng.uniform(0.08, 0.13, n)
+        industrial_rate = rng.uniform(0.06, 0.10, n)
+        
+        # Only a handful of providers exist, so look each one up once and
+        # spread the answers back over the batch
+        providers, provider_idx = np.unique(utility_provider, return_inverse=True)
+        net_metering = [self.check_net_metering_availability(provider) for provider in providers]
+        has_net_metering = np.array([info['has_net_metering'] for info in net_metering], dtype=bool)
+        net_metering_rate = np.array([info['net_metering_rate'] for info in net_metering], dtype=float)
+        
+        return {
+            'utility_provider': utility_provider,
+            'utility_rate_plan': np.full(n, 'Standard Residential'),
+            'residential': residential_rate,
+            'commercial': commercial_rate,
+            'industrial': industrial_rate,
+            'base_rate': residential_rate * 0.7,  # Base rate is typically lower than total rate
+            'tdu_rate': residential_rate * 0.3,  # TDU portion
+            'has_net_metering': has_net_metering[provider_idx],
+            'net_metering_rate': net_metering_rate[provider_idx],
+            'data_source': np.full(n, 'mock_data')
+        }